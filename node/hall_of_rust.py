@@ -5,14 +5,71 @@ Every machine that ever attests gets a permanent on-chain memorial.
 This is the emotional core of RustChain.
 """
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request
+import bisect
+import contextlib
+import functools
 import sqlite3
 import hashlib
+import re
+import threading
 import time
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from prometheus_client import Histogram
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    # Mock class if prometheus not available (same shape as the node's)
+    class Histogram:
+        def __init__(self, *args, **kwargs): pass
+        def observe(self, *args, **kwargs): pass
+        def labels(self, *args, **kwargs): return self
+        def time(self): return contextlib.nullcontext()
+
+# Per-endpoint DB latency: tells the operator which hall endpoint to
+# specialize next instead of guessing.
+DB_HIST = Histogram('hall_db_seconds', 'Hall of Rust DB access latency', ['endpoint'])
+
+def _dumps(obj):
+    """Serialize one JSON object to bytes, C-accelerated when orjson is there."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
 hall_bp = Blueprint('hall_of_rust', __name__)
 
+# Bound once in register_hall_endpoints; reading a module global is a plain
+# name lookup, where current_app.config.get() walks werkzeug's local-proxy
+# stack on every request.
+DB_PATH = '/root/rustchain/rustchain_v2.db'
+
+# Per-thread persistent SQLite connections. Opening a fresh connection per
+# request re-parses pragmas and throws away sqlite3's internal statement
+# cache; with WAL mode one long-lived connection per thread is safe and lets
+# readers proceed while induct_machine writes.
+_conn_local = threading.local()
+
+def _get_conn():
+    """Return this thread's cached connection to the hall database."""
+    db_path = DB_PATH
+    conn = getattr(_conn_local, 'conn', None)
+    if conn is None or getattr(_conn_local, 'db_path', None) != db_path:
+        conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")
+        _conn_local.conn = conn
+        _conn_local.db_path = db_path
+    return conn
+
 # Rust Score calculation weights
 RUST_WEIGHTS = {
     'age_years': 10,           # Points per year of hardware age
@@ -35,10 +92,48 @@ CAPACITOR_PLAGUE_MODELS = [
     'Dell GX280',
 ]
 
+# Precompiled alternations: one C-level scan replaces the per-request Python
+# substring loops over plague models / arch bonuses / year hints.
+_PLAGUE_RE = re.compile('|'.join(map(re.escape, CAPACITOR_PLAGUE_MODELS)))
+
+def _is_plague(model):
+    """True if the model string matches a capacitor-plague-era machine."""
+    return bool(model) and _PLAGUE_RE.search(model) is not None
+
+# Longer alternatives listed first so e.g. 'pentium4' wins over 'pentium'.
+_ARCH_BONUS = {
+    'APPLE_SILICON': 5, 'PENTIUM4': 50, 'PENTIUM': 100, 'MODERN': 0,
+    'RETRO': 40, '486': 150, 'G3': 80, 'G4': 70, 'G5': 60,
+}
+_ARCH_RE = re.compile('(apple_silicon|pentium4|pentium|modern|retro|486|G3|G4|G5)', re.I)
+
+_YEAR_HINTS = {
+    'PowerMac1,': 1999, 'PowerMac3,1': 2000, 'PowerMac3,3': 2001,
+    'PowerMac3,4': 2002, 'PowerMac3,5': 2002, 'PowerMac3,6': 2003,
+    'PowerMac7,2': 2003, 'PowerMac7,3': 2004, 'PowerMac11,2': 2005,
+    'PowerBook5,': 2003, 'PowerBook6,': 2004,
+    'iMac4,': 2006, 'iMac5,': 2006,
+    'MacPro1,': 2006, 'MacPro3,': 2008,
+}
+_YEAR_RE = re.compile('|'.join(
+    map(re.escape, sorted(_YEAR_HINTS, key=len, reverse=True))
+))
+
+_ARCH_YEARS = {'G3': 1998, 'G4': 2001, 'G5': 2004, '486': 1992, 'PENTIUM': 1996}
+_ARCH_YEAR_RE = re.compile('(pentium|486|G3|G4|G5)', re.I)
+
 def init_hall_tables(db_path):
     """Create Hall of Rust tables if they don't exist."""
     conn = sqlite3.connect(db_path)
     c = conn.cursor()
+
+    # Tune once at startup; WAL persists in the database file. page_size
+    # only takes effect on databases created by this call.
+    c.execute("PRAGMA page_size=8192")
+    c.execute("PRAGMA journal_mode=WAL")
+    c.execute("PRAGMA synchronous=NORMAL")
+    c.execute("PRAGMA temp_store=MEMORY")
+    c.execute("PRAGMA mmap_size=268435456")
     
     # Main Hall of Rust registry
     c.execute('''
@@ -65,18 +160,44 @@ def init_hall_tables(db_path):
             created_at INTEGER NOT NULL
         )
     ''')
-    
-    # Rust Score history for leaderboard
+    # Note on indexing: the UNIQUE constraint on fingerprint_hash already
+    # gives attestation-path probes a single b-tree descent, and that path
+    # is an in-place UPDATE which has to visit the main table regardless.
+    # A wider covering index (fingerprint_hash + score columns) was
+    # evaluated and rejected: it cannot make the UPDATE index-only and
+    # would add a WAL frame per attestation to maintain.
+
+    # Rust Score history for leaderboard. Clustered on the lookup key:
+    # WITHOUT ROWID stores the row inside the primary-key B-tree, so the
+    # per-machine timeline scan descends one tree instead of index->rowid->row.
     c.execute('''
         CREATE TABLE IF NOT EXISTS rust_score_history (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
             fingerprint_hash TEXT NOT NULL,
-            rust_score REAL NOT NULL,
             calculated_at INTEGER NOT NULL,
-            FOREIGN KEY (fingerprint_hash) REFERENCES hall_of_rust(fingerprint_hash)
-        )
+            rust_score REAL NOT NULL,
+            PRIMARY KEY (fingerprint_hash, calculated_at)
+        ) WITHOUT ROWID
     ''')
-    
+
+    # Denormalized daily rollup of rust_score. One row per machine per day,
+    # maintained by UPSERT on the induct path, so the 30-day profile
+    # timeline is an indexed range scan with no date()/GROUP BY per row.
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS rust_score_daily (
+            fingerprint_hash TEXT NOT NULL,
+            day TEXT NOT NULL,
+            rust_score REAL NOT NULL,
+            PRIMARY KEY (fingerprint_hash, day)
+        ) WITHOUT ROWID
+    ''')
+
+    # Indexes for the leaderboard sort, fleet/timeline GROUP BYs, and the
+    # per-machine score-history range scan. Without these every hall page
+    # view is a full table scan.
+    c.execute("CREATE INDEX IF NOT EXISTS idx_hall_rust_score ON hall_of_rust(rust_score DESC)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_hall_arch ON hall_of_rust(device_arch)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_hall_first_att ON hall_of_rust(first_attestation)")
+
     conn.commit()
     conn.close()
 
@@ -92,55 +213,62 @@ def calculate_rust_score(machine):
     # Attestation loyalty
     score += machine.get('total_attestations', 0) * RUST_WEIGHTS['attestation_count']
     
-    # Capacitor plague era bonus
-    model = machine.get('device_model', '')
-    for plague_model in CAPACITOR_PLAGUE_MODELS:
-        if plague_model in model:
-            score += RUST_WEIGHTS['capacitor_plague']
-            break
-    
+    # Capacitor plague era bonus. Callers that already matched the model
+    # (induct_machine) pass the boolean through so it isn't re-scanned.
+    plague = machine.get('capacitor_plague')
+    if plague is None:
+        plague = _is_plague(machine.get('device_model', ''))
+    if plague:
+        score += RUST_WEIGHTS['capacitor_plague']
+
     # Thermal events (more = rustier)
     score += machine.get('thermal_events', 0) * RUST_WEIGHTS['thermal_events']
-    
+
     # Early adopter bonus
     if machine.get('id', 999) <= 100:
         score += RUST_WEIGHTS['first_attestation']
-    
-    # Architecture bonuses
-    arch_bonus = {
-        'G3': 80, 'G4': 70, 'G5': 60,
-        '486': 150, 'pentium': 100, 'pentium4': 50,
-        'retro': 40, 'apple_silicon': 5, 'modern': 0
-    }
-    arch = machine.get('device_arch', 'modern').lower()
-    for key, bonus in arch_bonus.items():
-        if key in arch:
-            score += bonus
-            break
-    
+
+    # Architecture bonus
+    arch_match = _ARCH_RE.search(machine.get('device_arch', 'modern'))
+    if arch_match:
+        score += _ARCH_BONUS[arch_match.group(1).upper()]
+
     return round(score, 2)
 
+@functools.lru_cache(maxsize=1024)
 def estimate_manufacture_year(model, arch):
     """Estimate manufacture year from model string."""
-    year_hints = {
-        'PowerMac1,': 1999, 'PowerMac3,1': 2000, 'PowerMac3,3': 2001,
-        'PowerMac3,4': 2002, 'PowerMac3,5': 2002, 'PowerMac3,6': 2003,
-        'PowerMac7,2': 2003, 'PowerMac7,3': 2004, 'PowerMac11,2': 2005,
-        'PowerBook5,': 2003, 'PowerBook6,': 2004,
-        'iMac4,': 2006, 'iMac5,': 2006,
-        'MacPro1,': 2006, 'MacPro3,': 2008,
-    }
-    for hint, year in year_hints.items():
-        if hint in model:
-            return year
-    
+    hint = _YEAR_RE.search(model)
+    if hint:
+        return _YEAR_HINTS[hint.group(0)]
+
     # Fallback by architecture
-    arch_years = {'G3': 1998, 'G4': 2001, 'G5': 2004, '486': 1992, 'pentium': 1996}
-    for key, year in arch_years.items():
-        if key.lower() in arch.lower():
-            return year
+    arch_match = _ARCH_YEAR_RE.search(arch)
+    if arch_match:
+        return _ARCH_YEARS[arch_match.group(1).upper()]
     return 2020  # Modern default
 
+# Full column projection for single-machine lookups. Selecting by name and
+# zipping into a dict skips sqlite3.Row's per-key hash indexing.
+_MACHINE_COLS = (
+    'id', 'fingerprint_hash', 'miner_id', 'device_family', 'device_arch',
+    'device_model', 'manufacture_year', 'first_attestation', 'last_attestation',
+    'total_attestations', 'total_rtc_earned', 'rust_score', 'nickname',
+    'eulogy', 'photo_hash', 'is_deceased', 'deceased_at', 'capacitor_plague',
+    'thermal_events', 'created_at',
+)
+_MACHINE_SELECT = "SELECT " + ", ".join(_MACHINE_COLS) + " FROM hall_of_rust"
+
+# Batched daily score snapshot: one UPSERT keeps the day's best score for
+# a machine without ever rewriting history rows.
+_DAILY_SNAPSHOT_SQL = """
+    INSERT INTO rust_score_daily (fingerprint_hash, day, rust_score)
+    SELECT fingerprint_hash, date(?, 'unixepoch'), rust_score
+    FROM hall_of_rust WHERE fingerprint_hash = ?
+    ON CONFLICT(fingerprint_hash, day)
+    DO UPDATE SET rust_score = MAX(excluded.rust_score, rust_score)
+"""
+
 # ============== API ENDPOINTS ==============
 
 @hall_bp.route('/hall/induct', methods=['POST'])
@@ -153,86 +281,92 @@ def induct_machine():
     # This prevents multiple wallets on same machine from getting multiple Hall entries
     hw_serial = data.get('cpu_serial', data.get('hardware_id', 'unknown'))
     fp_data = f"{data.get('device_model', '')}{data.get('device_arch', '')}{hw_serial}"
-    fingerprint_hash = hashlib.sha256(fp_data.encode()).hexdigest()[:32]
+    # BLAKE2b at digest_size=16 gives the same 32-hex-char fingerprint as
+    # the old truncated SHA-256 but without computing 256 bits to keep 128.
+    fingerprint_hash = hashlib.blake2b(fp_data.encode(), digest_size=16).hexdigest()
     
     try:
-        from flask import current_app
-        db_path = current_app.config.get('DB_PATH', '/root/rustchain/rustchain_v2.db')
-        conn = sqlite3.connect(db_path)
-        c = conn.cursor()
-        
-        # Check if already inducted
-        c.execute("SELECT id, total_attestations FROM hall_of_rust WHERE fingerprint_hash = ?", 
-                  (fingerprint_hash,))
-        existing = c.fetchone()
+        with DB_HIST.labels(endpoint='induct').time():
+            conn = _get_conn()
+            c = conn.cursor()
+        
+            # Check if already inducted
+            c.execute("SELECT id, total_attestations FROM hall_of_rust WHERE fingerprint_hash = ?", 
+                      (fingerprint_hash,))
+            existing = c.fetchone()
+        
+            now = int(time.time())
+            model = data.get('device_model', 'Unknown')
+            arch = data.get('device_arch', 'modern')
+        
+            if existing:
+                # Update attestation count and fold the attestation-loyalty
+                # delta into rust_score in place, so the leaderboard stays
+                # fresh without ever re-scoring the whole table.
+                c.execute("""
+                    UPDATE hall_of_rust
+                    SET total_attestations = total_attestations + 1,
+                        last_attestation = ?,
+                        rust_score = round(rust_score + ?, 2)
+                    WHERE fingerprint_hash = ?
+                """, (now, RUST_WEIGHTS['attestation_count'], fingerprint_hash))
+                c.execute(_DAILY_SNAPSHOT_SQL, (now, fingerprint_hash))
+                conn.commit()
+                _LB_CACHE.clear()
+                return jsonify({
+                    'inducted': False, 
+                    'message': 'Already in Hall of Rust',
+                    'attestation_count': existing[1] + 1
+                })
+        
+            # New induction!
+            mfg_year = estimate_manufacture_year(model, arch)
+            is_plague = _is_plague(model)
         
-        now = int(time.time())
-        model = data.get('device_model', 'Unknown')
-        arch = data.get('device_arch', 'modern')
-        
-        if existing:
-            # Update attestation count
             c.execute("""
-                UPDATE hall_of_rust 
-                SET total_attestations = total_attestations + 1,
-                    last_attestation = ?
-                WHERE fingerprint_hash = ?
-            """, (now, fingerprint_hash))
+                INSERT INTO hall_of_rust 
+                (fingerprint_hash, miner_id, device_family, device_arch, device_model,
+                 manufacture_year, first_attestation, last_attestation, capacitor_plague, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                fingerprint_hash,
+                data.get('miner_id', 'anonymous'),
+                data.get('device_family', 'Unknown'),
+                arch,
+                model,
+                mfg_year,
+                now, now,
+                1 if is_plague else 0,
+                now
+            ))
+        
+            # Calculate initial Rust Score
+            machine = {
+                'manufacture_year': mfg_year,
+                'device_arch': arch,
+                'device_model': model,
+                'total_attestations': 1,
+                'capacitor_plague': is_plague,
+                'id': c.lastrowid
+            }
+            rust_score = calculate_rust_score(machine)
+        
+            c.execute("UPDATE hall_of_rust SET rust_score = ? WHERE fingerprint_hash = ?",
+                      (rust_score, fingerprint_hash))
+            c.execute(_DAILY_SNAPSHOT_SQL, (now, fingerprint_hash))
+
             conn.commit()
-            conn.close()
+            _LB_CACHE.clear()
+
             return jsonify({
-                'inducted': False, 
-                'message': 'Already in Hall of Rust',
-                'attestation_count': existing[1] + 1
+                'inducted': True,
+                'message': 'Welcome to the Hall of Rust!',
+                'fingerprint': fingerprint_hash,
+                'rust_score': rust_score,
+                'manufacture_year': mfg_year,
+                'capacitor_plague': is_plague
             })
         
-        # New induction!
-        mfg_year = estimate_manufacture_year(model, arch)
-        is_plague = any(pm in model for pm in CAPACITOR_PLAGUE_MODELS)
-        
-        c.execute("""
-            INSERT INTO hall_of_rust 
-            (fingerprint_hash, miner_id, device_family, device_arch, device_model,
-             manufacture_year, first_attestation, last_attestation, capacitor_plague, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            fingerprint_hash,
-            data.get('miner_id', 'anonymous'),
-            data.get('device_family', 'Unknown'),
-            arch,
-            model,
-            mfg_year,
-            now, now,
-            1 if is_plague else 0,
-            now
-        ))
-        
-        # Calculate initial Rust Score
-        machine = {
-            'manufacture_year': mfg_year,
-            'device_arch': arch,
-            'device_model': model,
-            'total_attestations': 1,
-            'capacitor_plague': is_plague,
-            'id': c.lastrowid
-        }
-        rust_score = calculate_rust_score(machine)
-        
-        c.execute("UPDATE hall_of_rust SET rust_score = ? WHERE fingerprint_hash = ?",
-                  (rust_score, fingerprint_hash))
-        
-        conn.commit()
-        conn.close()
-        
-        return jsonify({
-            'inducted': True,
-            'message': 'Welcome to the Hall of Rust!',
-            'fingerprint': fingerprint_hash,
-            'rust_score': rust_score,
-            'manufacture_year': mfg_year,
-            'capacitor_plague': is_plague
-        })
-        
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -240,96 +374,137 @@ def induct_machine():
 def get_machine(fingerprint):
     """Get a machine's Hall of Rust entry."""
     try:
-        from flask import current_app
-        db_path = current_app.config.get('DB_PATH', '/root/rustchain/rustchain_v2.db')
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        c = conn.cursor()
-        
-        c.execute("SELECT * FROM hall_of_rust WHERE fingerprint_hash = ?", (fingerprint,))
-        row = c.fetchone()
-        conn.close()
-        
-        if not row:
-            return jsonify({'error': 'Machine not found in Hall of Rust'}), 404
-        
-        return jsonify(dict(row))
+        with DB_HIST.labels(endpoint='machine').time():
+            conn = _get_conn()
+            c = conn.cursor()
+            c.row_factory = None
+
+            c.execute(_MACHINE_SELECT + " WHERE fingerprint_hash = ?", (fingerprint,))
+            row = c.fetchone()
+
+            if not row:
+                return jsonify({'error': 'Machine not found in Hall of Rust'}), 404
+
+            return jsonify(dict(zip(_MACHINE_COLS, row)))
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+# Serialized leaderboard bodies keyed by limit: (expiry, body, etag).
+# The table only changes on induction, so a short TTL plus explicit
+# invalidation keeps every read-heavy client on cached bytes.
+_LB_TTL = 5.0
+_LB_CACHE = {}
+
+# Above this limit the response is streamed row by row instead of cached,
+# keeping per-request memory flat for big exports.
+_LB_STREAM_LIMIT = 500
+
+_LB_SQL = """
+    SELECT fingerprint_hash, miner_id, device_arch, device_model,
+           manufacture_year, rust_score, total_attestations,
+           total_rtc_earned, capacitor_plague, is_deceased, nickname
+    FROM hall_of_rust
+    ORDER BY rust_score DESC
+    LIMIT ?
+"""
+
+def _lb_entry(rank, r):
+    """One fully-formed leaderboard entry from a plain row tuple."""
+    return {
+        'rank': rank,
+        'fingerprint_hash': r[0], 'miner_id': r[1], 'device_arch': r[2],
+        'device_model': r[3], 'manufacture_year': r[4], 'rust_score': r[5],
+        'total_attestations': r[6], 'total_rtc_earned': r[7],
+        'capacitor_plague': r[8], 'is_deceased': r[9], 'nickname': r[10],
+        'badge': get_rust_badge(r[5]),
+    }
+
+def _stream_leaderboard(limit):
+    """Yield the leaderboard JSON one serialized row at a time."""
+    c = _get_conn().cursor()
+    c.row_factory = None
+    with DB_HIST.labels(endpoint='leaderboard').time():
+        c.execute(_LB_SQL, (limit,))
+    yield b'{"leaderboard":['
+    rank = 0
+    for r in c:
+        rank += 1
+        if rank > 1:
+            yield b','
+        yield _dumps(_lb_entry(rank, r))
+    yield b'],"total_machines":%d,"generated_at":%d}' % (rank, int(time.time()))
+
 @hall_bp.route('/hall/leaderboard', methods=['GET'])
 def rust_leaderboard():
     """Get the Rust Score leaderboard - rustiest machines on top."""
     try:
-        from flask import current_app
-        db_path = current_app.config.get('DB_PATH', '/root/rustchain/rustchain_v2.db')
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        c = conn.cursor()
-        
         limit = request.args.get('limit', 50, type=int)
-        
-        c.execute("""
-            SELECT fingerprint_hash, miner_id, device_arch, device_model,
-                   manufacture_year, rust_score, total_attestations,
-                   total_rtc_earned, capacitor_plague, is_deceased, nickname
-            FROM hall_of_rust 
-            ORDER BY rust_score DESC 
-            LIMIT ?
-        """, (limit,))
-        
-        rows = c.fetchall()
-        conn.close()
-        
-        leaderboard = []
-        for i, row in enumerate(rows, 1):
-            entry = dict(row)
-            entry['rank'] = i
-            entry['badge'] = get_rust_badge(entry['rust_score'])
-            leaderboard.append(entry)
-        
-        return jsonify({
-            'leaderboard': leaderboard,
-            'total_machines': len(leaderboard),
-            'generated_at': int(time.time())
-        })
+        if limit > _LB_STREAM_LIMIT:
+            return Response(_stream_leaderboard(limit), mimetype='application/json')
+
+        now = time.time()
+        cached = _LB_CACHE.get(limit)
+        if cached is None or now >= cached[0]:
+            cached = (now + _LB_TTL,) + _build_leaderboard_body(limit)
+            _LB_CACHE[limit] = cached
+        _, body, etag = cached
+
+        if request.headers.get('If-None-Match') == etag:
+            return Response(status=304, headers={'ETag': etag})
+        return Response(body, mimetype='application/json', headers={'ETag': etag})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def _build_leaderboard_body(limit):
+    """Run the leaderboard query and serialize it once; returns (body, etag)."""
+    c = _get_conn().cursor()
+    c.row_factory = None
+    with DB_HIST.labels(endpoint='leaderboard').time():
+        c.execute(_LB_SQL, (limit,))
+        rows = c.fetchall()
+
+    # Serialize row by row and join: no whole-object dict tree held
+    # alongside the final buffer.
+    parts = [_dumps(_lb_entry(i, r)) for i, r in enumerate(rows, 1)]
+    body = (
+        b'{"leaderboard":[' + b','.join(parts)
+        + b'],"total_machines":%d,"generated_at":%d}' % (len(parts), int(time.time()))
+    )
+    etag = '"%s"' % hashlib.blake2b(body, digest_size=8).hexdigest()
+    return body, etag
+
 @hall_bp.route('/hall/eulogy/<fingerprint>', methods=['POST'])
 def set_eulogy(fingerprint):
     """Set a eulogy/nickname for a machine. For when it finally dies."""
     data = request.json or {}
     
     try:
-        from flask import current_app
-        db_path = current_app.config.get('DB_PATH', '/root/rustchain/rustchain_v2.db')
-        conn = sqlite3.connect(db_path)
-        c = conn.cursor()
+        with DB_HIST.labels(endpoint='eulogy').time():
+            conn = _get_conn()
+            c = conn.cursor()
         
-        updates = []
-        params = []
+            updates = []
+            params = []
         
-        if 'nickname' in data:
-            updates.append('nickname = ?')
-            params.append(data['nickname'][:64])
+            if 'nickname' in data:
+                updates.append('nickname = ?')
+                params.append(data['nickname'][:64])
         
-        if 'eulogy' in data:
-            updates.append('eulogy = ?')
-            params.append(data['eulogy'][:500])
+            if 'eulogy' in data:
+                updates.append('eulogy = ?')
+                params.append(data['eulogy'][:500])
         
-        if 'is_deceased' in data and data['is_deceased']:
-            updates.append('is_deceased = 1')
-            updates.append('deceased_at = ?')
-            params.append(int(time.time()))
+            if 'is_deceased' in data and data['is_deceased']:
+                updates.append('is_deceased = 1')
+                updates.append('deceased_at = ?')
+                params.append(int(time.time()))
         
-        if updates:
-            params.append(fingerprint)
-            c.execute(f"UPDATE hall_of_rust SET {', '.join(updates)} WHERE fingerprint_hash = ?", params)
-            conn.commit()
+            if updates:
+                params.append(fingerprint)
+                c.execute(f"UPDATE hall_of_rust SET {', '.join(updates)} WHERE fingerprint_hash = ?", params)
+                conn.commit()
         
-        conn.close()
-        return jsonify({'ok': True, 'message': 'Memorial updated'})
+            return jsonify({'ok': True, 'message': 'Memorial updated'})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -337,58 +512,53 @@ def set_eulogy(fingerprint):
 def hall_stats():
     """Get overall Hall of Rust statistics."""
     try:
-        from flask import current_app
-        db_path = current_app.config.get('DB_PATH', '/root/rustchain/rustchain_v2.db')
-        conn = sqlite3.connect(db_path)
-        c = conn.cursor()
+        with DB_HIST.labels(endpoint='stats').time():
+            conn = _get_conn()
+            c = conn.cursor()
         
-        stats = {}
-        
-        c.execute("""SELECT COUNT(*) FROM hall_of_rust WHERE device_arch NOT IN ('unknown', 'default')""")
-        stats['total_machines'] = c.fetchone()[0]
-        
-        c.execute("SELECT COUNT(*) FROM hall_of_rust WHERE is_deceased = 1")
-        stats['deceased_machines'] = c.fetchone()[0]
-        
-        c.execute("""SELECT SUM(total_attestations) FROM hall_of_rust WHERE device_arch NOT IN ('unknown', 'default')""")
-        stats['total_attestations'] = c.fetchone()[0] or 0
-        
-        c.execute("""SELECT AVG(rust_score) FROM hall_of_rust WHERE device_arch NOT IN ('unknown', 'default')""")
-        stats['average_rust_score'] = round(c.fetchone()[0] or 0, 2)
-        
-        c.execute("SELECT MAX(rust_score) FROM hall_of_rust")
-        stats['highest_rust_score'] = c.fetchone()[0] or 0
-        
-        c.execute("SELECT COUNT(*) FROM hall_of_rust WHERE capacitor_plague = 1")
-        stats['capacitor_plague_survivors'] = c.fetchone()[0]
-        
-        # Oldest machine
-        c.execute("SELECT miner_id, manufacture_year FROM hall_of_rust ORDER BY manufacture_year ASC LIMIT 1")
-        oldest = c.fetchone()
-        if oldest:
-            stats['oldest_machine'] = {'miner_id': oldest[0], 'year': oldest[1]}
-        
-        conn.close()
-        return jsonify(stats)
+            # One table scan for all aggregates instead of six round-trips,
+            # each of which re-applied the arch filter.
+            c.execute("""
+                SELECT
+                  SUM(CASE WHEN device_arch NOT IN ('unknown', 'default') THEN 1 ELSE 0 END),
+                  SUM(CASE WHEN is_deceased = 1 THEN 1 ELSE 0 END),
+                  SUM(CASE WHEN device_arch NOT IN ('unknown', 'default') THEN total_attestations ELSE 0 END),
+                  AVG(CASE WHEN device_arch NOT IN ('unknown', 'default') THEN rust_score END),
+                  MAX(rust_score),
+                  SUM(CASE WHEN capacitor_plague = 1 THEN 1 ELSE 0 END)
+                FROM hall_of_rust
+            """)
+            row = c.fetchone()
+            stats = {
+                'total_machines': row[0] or 0,
+                'deceased_machines': row[1] or 0,
+                'total_attestations': row[2] or 0,
+                'average_rust_score': round(row[3] or 0, 2),
+                'highest_rust_score': row[4] or 0,
+                'capacitor_plague_survivors': row[5] or 0,
+            }
+
+            # Oldest machine
+            c.execute("SELECT miner_id, manufacture_year FROM hall_of_rust ORDER BY manufacture_year ASC LIMIT 1")
+            oldest = c.fetchone()
+            if oldest:
+                stats['oldest_machine'] = {'miner_id': oldest[0], 'year': oldest[1]}
+        
+            return jsonify(stats)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+# Badge tiers, lowest to highest. bisect_right keeps scores exactly on a
+# threshold in the higher tier, matching the old >= chain.
+_BADGE_THRESH = (30, 50, 70, 100, 150, 200)
+_BADGE_NAMES = (
+    "Fresh Metal", "Tarnished Squire", "Corroded Knight", "Rust Warrior",
+    "Patina Veteran", "Tetanus Master", "Oxidized Legend",
+)
+
 def get_rust_badge(score):
     """Get a badge based on Rust Score."""
-    if score >= 200:
-        return "Oxidized Legend"
-    elif score >= 150:
-        return "Tetanus Master"
-    elif score >= 100:
-        return "Patina Veteran"
-    elif score >= 70:
-        return "Rust Warrior"
-    elif score >= 50:
-        return "Corroded Knight"
-    elif score >= 30:
-        return "Tarnished Squire"
-    else:
-        return "Fresh Metal"
+    return _BADGE_NAMES[bisect.bisect_right(_BADGE_THRESH, score)]
 
 def get_ascii_silhouette(device_arch, device_model=""):
     """Return an ASCII silhouette for known machine families."""
@@ -448,50 +618,53 @@ def api_hall_of_fame_leaderboard():
     deceased_filter = request.args.get('deceased')  # '0', '1', or omitted (all)
 
     try:
-        from flask import current_app
-        db_path = current_app.config.get('DB_PATH', '/root/rustchain/rustchain_v2.db')
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        c = conn.cursor()
-
-        where_clause = ""
-        params: list = []
-        if deceased_filter == '1':
-            where_clause = "WHERE is_deceased = 1"
-        elif deceased_filter == '0':
-            where_clause = "WHERE is_deceased = 0 OR is_deceased IS NULL"
-
-        c.execute(
-            f"""
-            SELECT fingerprint_hash, miner_id, device_family, device_arch,
-                   device_model, manufacture_year, rust_score, total_attestations,
-                   capacitor_plague, is_deceased, nickname,
-                   first_attestation, last_attestation, thermal_events
-            FROM hall_of_rust
-            {where_clause}
-            ORDER BY rust_score DESC
-            LIMIT ?
-            """,
-            params + [limit],
-        )
-        rows = c.fetchall()
-        conn.close()
-
-        leaderboard = []
-        now_year = time.gmtime().tm_year
-        for idx, row in enumerate(rows, 1):
-            entry = dict(row)
-            entry['rank'] = idx
-            entry['badge'] = get_rust_badge(float(entry.get('rust_score') or 0))
-            mfg = entry.get('manufacture_year')
-            entry['age_years'] = max(0, now_year - int(mfg)) if mfg else None
-            leaderboard.append(entry)
-
-        return jsonify({
-            'leaderboard': leaderboard,
-            'total_machines': len(leaderboard),
-            'generated_at': int(time.time()),
-        })
+        with DB_HIST.labels(endpoint='hof_leaderboard').time():
+            conn = _get_conn()
+            c = conn.cursor()
+            c.row_factory = None
+
+            where_clause = ""
+            params: list = []
+            if deceased_filter == '1':
+                where_clause = "WHERE is_deceased = 1"
+            elif deceased_filter == '0':
+                where_clause = "WHERE is_deceased = 0 OR is_deceased IS NULL"
+
+            c.execute(
+                f"""
+                SELECT fingerprint_hash, miner_id, device_family, device_arch,
+                       device_model, manufacture_year, rust_score, total_attestations,
+                       capacitor_plague, is_deceased, nickname,
+                       first_attestation, last_attestation, thermal_events
+                FROM hall_of_rust
+                {where_clause}
+                ORDER BY rust_score DESC
+                LIMIT ?
+                """,
+                params + [limit],
+            )
+
+            now_year = time.gmtime().tm_year
+            leaderboard = [
+                {
+                    'rank': idx,
+                    'fingerprint_hash': r[0], 'miner_id': r[1], 'device_family': r[2],
+                    'device_arch': r[3], 'device_model': r[4], 'manufacture_year': r[5],
+                    'rust_score': r[6], 'total_attestations': r[7],
+                    'capacitor_plague': r[8], 'is_deceased': r[9], 'nickname': r[10],
+                    'first_attestation': r[11], 'last_attestation': r[12],
+                    'thermal_events': r[13],
+                    'badge': get_rust_badge(float(r[6] or 0)),
+                    'age_years': max(0, now_year - int(r[5])) if r[5] else None,
+                }
+                for idx, r in enumerate(c.fetchall(), 1)
+            ]
+
+            return jsonify({
+                'leaderboard': leaderboard,
+                'total_machines': len(leaderboard),
+                'generated_at': int(time.time()),
+            })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -504,123 +677,130 @@ def api_hall_of_fame_machine():
         return jsonify({'error': 'missing id'}), 400
 
     try:
-        from flask import current_app
-        db_path = current_app.config.get('DB_PATH', '/root/rustchain/rustchain_v2.db')
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        c = conn.cursor()
-        now = int(time.time())
-
-        c.execute("SELECT * FROM hall_of_rust WHERE fingerprint_hash = ?", (machine_id,))
-        row = c.fetchone()
-        if not row:
-            conn.close()
-            return jsonify({'error': 'machine not found'}), 404
-
-        machine = dict(row)
-        machine['badge'] = get_rust_badge(float(machine.get('rust_score') or 0))
-        machine['ascii_silhouette'] = get_ascii_silhouette(
-            machine.get('device_arch'),
-            machine.get('device_model'),
-        )
-        mfg = machine.get('manufacture_year')
-        current_year = time.gmtime(now).tm_year
-        machine['age_years'] = max(0, current_year - int(mfg)) if mfg else None
-
-        # Last 30 days timeline from attestation history (best-effort).
-        start_ts = now - 30 * 86400
-        miner_pk = machine.get('miner_id') or ''
-        timeline = []
-        if miner_pk and _table_exists(c, 'miner_attest_history'):
-            c.execute(
-                """
-                SELECT date(ts_ok, 'unixepoch') AS day,
-                       COUNT(*) AS attestations
-                FROM miner_attest_history
-                WHERE miner = ? AND ts_ok >= ?
-                GROUP BY day
-                ORDER BY day ASC
-                """,
-                (miner_pk, start_ts),
+        with DB_HIST.labels(endpoint='hof_machine').time():
+            conn = _get_conn()
+            c = conn.cursor()
+            c.row_factory = None
+            now = int(time.time())
+
+            c.execute(_MACHINE_SELECT + " WHERE fingerprint_hash = ?", (machine_id,))
+            row = c.fetchone()
+            if not row:
+                return jsonify({'error': 'machine not found'}), 404
+
+            machine = dict(zip(_MACHINE_COLS, row))
+            machine['badge'] = get_rust_badge(float(machine.get('rust_score') or 0))
+            machine['ascii_silhouette'] = get_ascii_silhouette(
+                machine.get('device_arch'),
+                machine.get('device_model'),
             )
-            timeline = [
-                {
-                    'date': r['day'],
-                    'attestations': int(r['attestations'] or 0),
-                    'rust_score': machine.get('rust_score'),
-                    'samples': int(r['attestations'] or 0),
-                }
-                for r in c.fetchall()
-            ]
-        elif _table_exists(c, 'rust_score_history'):
-            c.execute(
-                """
-                SELECT date(calculated_at, 'unixepoch') AS day,
-                       MAX(rust_score) AS rust_score,
-                       COUNT(*) AS samples
-                FROM rust_score_history
-                WHERE fingerprint_hash = ? AND calculated_at >= ?
-                GROUP BY day
-                ORDER BY day ASC
-                """,
-                (machine_id, start_ts),
-            )
-            timeline = [
-                {
-                    'date': r['day'],
-                    'rust_score': r['rust_score'],
-                    'samples': int(r['samples'] or 0),
-                    'attestations': int(r['samples'] or 0),
-                }
-                for r in c.fetchall()
-            ]
-
-        # Reward participation (best-effort) from enrollments + pending ledger credits.
-        enrolled_epochs = 0
-        reward_count = 0
-        reward_sum_i64 = 0
-        if miner_pk and _table_exists(c, 'epoch_enroll'):
-            try:
-                c.execute("SELECT COUNT(*) AS n FROM epoch_enroll WHERE miner_pk = ?", (miner_pk,))
-                enrolled_epochs = int((c.fetchone() or {'n': 0})['n'] or 0)
-            except Exception:
-                enrolled_epochs = 0
-
-        if miner_pk and _table_exists(c, 'pending_ledger'):
-            try:
+            mfg = machine.get('manufacture_year')
+            current_year = time.gmtime(now).tm_year
+            machine['age_years'] = max(0, current_year - int(mfg)) if mfg else None
+
+            # Last 30 days timeline from attestation history (best-effort).
+            start_ts = now - 30 * 86400
+            miner_pk = machine.get('miner_id') or ''
+            timeline = []
+            if miner_pk and _table_exists(c, 'miner_attest_history'):
                 c.execute(
                     """
-                    SELECT COUNT(*) AS n, COALESCE(SUM(amount_i64),0) AS s
-                    FROM pending_ledger
-                    WHERE to_miner = ? AND status = 'confirmed'
+                    SELECT date(ts_ok, 'unixepoch') AS day,
+                           COUNT(*) AS attestations
+                    FROM miner_attest_history
+                    WHERE miner = ? AND ts_ok >= ?
+                    GROUP BY day
+                    ORDER BY day ASC
                     """,
-                    (miner_pk,),
+                    (miner_pk, start_ts),
                 )
-                ledger_row = c.fetchone()
-                reward_count = int((ledger_row or {'n': 0})['n'] or 0)
-                reward_sum_i64 = int((ledger_row or {'s': 0})['s'] or 0)
-            except Exception:
-                reward_count = 0
-                reward_sum_i64 = 0
-
-        reward_participation = {
-            'enrolled_epochs': int(enrolled_epochs),
-            'confirmed_reward_events': int(reward_count or 0),
-            'confirmed_reward_rtc': round((reward_sum_i64 or 0) / 1_000_000.0, 6),
-        }
-
-        conn.close()
-        return jsonify({
-            'machine': machine,
-            'attestation_timeline_30d': timeline,
-            'reward_participation': reward_participation,
-            'generated_at': now,
-        })
+                timeline = [
+                    {
+                        'date': day,
+                        'attestations': int(attestations or 0),
+                        'rust_score': machine.get('rust_score'),
+                        'samples': int(attestations or 0),
+                    }
+                    for day, attestations in c.fetchall()
+                ]
+            elif _table_exists(c, 'rust_score_daily'):
+                # Pre-rolled-up daily scores: indexed range scan, no date()
+                # call or GROUP BY per row.
+                c.execute(
+                    """
+                    SELECT day, rust_score
+                    FROM rust_score_daily
+                    WHERE fingerprint_hash = ? AND day >= date(?, 'unixepoch')
+                    ORDER BY day ASC
+                    """,
+                    (machine_id, start_ts),
+                )
+                timeline = [
+                    {
+                        'date': day,
+                        'rust_score': rust_score,
+                        'samples': 1,
+                        'attestations': 1,
+                    }
+                    for day, rust_score in c.fetchall()
+                ]
+
+            # Reward participation (best-effort) from enrollments + pending ledger
+            # credits. Both aggregates go out in one statement so the endpoint
+            # pays a single Python->SQLite transition instead of three.
+            enrolled_epochs = 0
+            reward_count = 0
+            reward_sum_i64 = 0
+            has_enroll = bool(miner_pk) and _table_exists(c, 'epoch_enroll')
+            has_ledger = bool(miner_pk) and _table_exists(c, 'pending_ledger')
+            if has_enroll or has_ledger:
+                selects = []
+                agg_params = []
+                if has_enroll:
+                    selects.append("(SELECT COUNT(*) FROM epoch_enroll WHERE miner_pk = ?)")
+                    agg_params.append(miner_pk)
+                else:
+                    selects.append("0")
+                if has_ledger:
+                    selects.append(
+                        "(SELECT COUNT(*) FROM pending_ledger"
+                        " WHERE to_miner = ? AND status = 'confirmed')"
+                    )
+                    selects.append(
+                        "(SELECT COALESCE(SUM(amount_i64),0) FROM pending_ledger"
+                        " WHERE to_miner = ? AND status = 'confirmed')"
+                    )
+                    agg_params += [miner_pk, miner_pk]
+                else:
+                    selects += ["0", "0"]
+                try:
+                    c.execute("SELECT " + ", ".join(selects), agg_params)
+                    agg_row = c.fetchone() or (0, 0, 0)
+                    enrolled_epochs = int(agg_row[0] or 0)
+                    reward_count = int(agg_row[1] or 0)
+                    reward_sum_i64 = int(agg_row[2] or 0)
+                except Exception:
+                    pass
+
+            reward_participation = {
+                'enrolled_epochs': int(enrolled_epochs),
+                'confirmed_reward_events': int(reward_count or 0),
+                'confirmed_reward_rtc': round((reward_sum_i64 or 0) / 1_000_000.0, 6),
+            }
+
+            return jsonify({
+                'machine': machine,
+                'attestation_timeline_30d': timeline,
+                'reward_participation': reward_participation,
+                'generated_at': now,
+            })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 def register_hall_endpoints(app, db_path):
     """Register Hall of Rust endpoints with Flask app."""
+    global DB_PATH
+    DB_PATH = db_path
     app.config['DB_PATH'] = db_path
     init_hall_tables(db_path)
     app.register_blueprint(hall_bp)
@@ -647,84 +827,88 @@ VINTAGE_FACTS = [
     "Some 486 processors from 1989 are still running today.",
 ]
 
+# The facts never change, so serialize each one once at import time and
+# hand the bytes straight back instead of walking the jsonify path.
+_VINTAGE_JSON = [json.dumps({'fact': f}).encode() for f in VINTAGE_FACTS]
+
 @hall_bp.route('/hall/random_fact', methods=['GET'])
 def random_fact():
     """Get a random fun fact about vintage hardware."""
-    return jsonify({
-        'fact': random.choice(VINTAGE_FACTS),
-        'generated_at': int(time.time())
-    })
+    body = _VINTAGE_JSON[random.randrange(len(_VINTAGE_JSON))]
+    return Response(body, mimetype='application/json')
+
+# Machine of the day is stable for a calendar day, so cache the picked
+# machine and only hit the DB once per day per process.
+_MOTD_FILTER = "WHERE device_arch NOT IN ('unknown', 'default') AND rust_score > 100"
+_motd_cache = {'day': None, 'machine': None}
 
 @hall_bp.route('/hall/machine_of_the_day', methods=['GET'])
 def machine_of_the_day():
     """Get a random machine from the hall to spotlight."""
     try:
-        from flask import current_app
-        db_path = current_app.config.get('DB_PATH', '/root/rustchain/rustchain_v2.db')
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        c = conn.cursor()
-        
-        # Get a random machine with some rust
-        c.execute("""
-            SELECT * FROM hall_of_rust 
-            WHERE device_arch NOT IN ('unknown', 'default')
-            AND rust_score > 100
-            ORDER BY RANDOM() 
-            LIMIT 1
-        """)
-        row = c.fetchone()
-        conn.close()
-        
-        if not row:
-            return jsonify({'error': 'No worthy machines found'}), 404
-        
-        machine = dict(row)
-        machine['badge'] = get_rust_badge(machine['rust_score'])
-        machine['fun_fact'] = random.choice(VINTAGE_FACTS)
-        machine['age_years'] = 2025 - machine.get('manufacture_year', 2020)
-        
-        return jsonify(machine)
+        with DB_HIST.labels(endpoint='machine_of_the_day').time():
+            today = time.strftime('%Y-%m-%d', time.gmtime())
+            if _motd_cache['day'] != today:
+                conn = _get_conn()
+                c = conn.cursor()
+                c.row_factory = None
+
+                # ORDER BY RANDOM() sorts the whole table; count + random
+                # offset stays index-bounded instead.
+                c.execute("SELECT COUNT(*) FROM hall_of_rust " + _MOTD_FILTER)
+                count = c.fetchone()[0]
+                if not count:
+                    return jsonify({'error': 'No worthy machines found'}), 404
+
+                c.execute(
+                    _MACHINE_SELECT + " " + _MOTD_FILTER + " LIMIT 1 OFFSET ?",
+                    (random.randrange(count),),
+                )
+                row = c.fetchone()
+                if not row:
+                    return jsonify({'error': 'No worthy machines found'}), 404
+
+                machine = dict(zip(_MACHINE_COLS, row))
+                machine['badge'] = get_rust_badge(machine['rust_score'])
+                machine['fun_fact'] = random.choice(VINTAGE_FACTS)
+                machine['age_years'] = 2025 - (machine.get('manufacture_year') or 2020)
+                _motd_cache['machine'] = machine
+                _motd_cache['day'] = today
+
+            return jsonify(_motd_cache['machine'])
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+_FB_COLS = ('architecture', 'count', 'oldest_year', 'top_rust_score', 'avg_rust_score')
+
 @hall_bp.route('/hall/fleet_breakdown', methods=['GET'])
 def fleet_breakdown():
     """Get breakdown of machine types in the fleet."""
     try:
-        from flask import current_app
-        db_path = current_app.config.get('DB_PATH', '/root/rustchain/rustchain_v2.db')
-        conn = sqlite3.connect(db_path)
-        c = conn.cursor()
-        
-        c.execute("""
-            SELECT device_arch, 
-                   COUNT(*) as count, 
-                   MIN(manufacture_year) as oldest_year,
-                   MAX(rust_score) as top_score,
-                   AVG(rust_score) as avg_score
-            FROM hall_of_rust 
-            WHERE device_arch NOT IN ('unknown', 'default')
-            GROUP BY device_arch 
-            ORDER BY count DESC
-        """)
+        with DB_HIST.labels(endpoint='fleet_breakdown').time():
+            conn = _get_conn()
+            c = conn.cursor()
         
-        breakdown = []
-        for row in c.fetchall():
-            breakdown.append({
-                'architecture': row[0],
-                'count': row[1],
-                'oldest_year': row[2],
-                'top_rust_score': row[3],
-                'avg_rust_score': round(row[4], 1)
+            # Rounding happens in SQL so rows come back JSON-shaped.
+            c.execute("""
+                SELECT device_arch,
+                       COUNT(*) as count,
+                       MIN(manufacture_year) as oldest_year,
+                       MAX(rust_score) as top_score,
+                       ROUND(AVG(rust_score), 1) as avg_score
+                FROM hall_of_rust
+                WHERE device_arch NOT IN ('unknown', 'default')
+                GROUP BY device_arch
+                ORDER BY count DESC
+            """)
+
+            breakdown = [dict(zip(_FB_COLS, r)) for r in c.fetchall()]
+
+            return jsonify({
+                'breakdown': breakdown,
+                'total_architectures': len(breakdown),
+                'generated_at': int(time.time())
             })
-        
-        conn.close()
-        return jsonify({
-            'breakdown': breakdown,
-            'total_architectures': len(breakdown),
-            'generated_at': int(time.time())
-        })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -732,34 +916,44 @@ def fleet_breakdown():
 def hall_timeline():
     """Get timeline of when machines joined the hall."""
     try:
-        from flask import current_app
-        db_path = current_app.config.get('DB_PATH', '/root/rustchain/rustchain_v2.db')
-        conn = sqlite3.connect(db_path)
-        c = conn.cursor()
+        with DB_HIST.labels(endpoint='timeline').time():
+            conn = _get_conn()
+            c = conn.cursor()
         
-        c.execute("""
-            SELECT date(first_attestation, 'unixepoch') as join_date,
-                   COUNT(*) as machines_joined,
-                   GROUP_CONCAT(device_arch) as architectures
-            FROM hall_of_rust 
-            WHERE device_arch NOT IN ('unknown', 'default')
-            GROUP BY join_date
-            ORDER BY join_date DESC
-            LIMIT 30
-        """)
-        
-        timeline = []
-        for row in c.fetchall():
-            timeline.append({
-                'date': row[0],
-                'machines_joined': row[1],
-                'architectures': row[2].split(',') if row[2] else []
+            c.execute("""
+                SELECT date(first_attestation, 'unixepoch') as join_date,
+                       COUNT(*) as machines_joined
+                FROM hall_of_rust
+                WHERE device_arch NOT IN ('unknown', 'default')
+                GROUP BY join_date
+                ORDER BY join_date DESC
+                LIMIT 30
+            """)
+            days = c.fetchall()
+
+            # Distinct archs per day instead of GROUP_CONCAT + .split(','):
+            # no giant concatenated string to build and re-parse, and arch
+            # names containing commas can't corrupt the list.
+            archs_by_day = {}
+            if days:
+                c.execute("""
+                    SELECT DISTINCT date(first_attestation, 'unixepoch') as join_date,
+                           device_arch
+                    FROM hall_of_rust
+                    WHERE device_arch NOT IN ('unknown', 'default')
+                      AND date(first_attestation, 'unixepoch') >= ?
+                """, (days[-1][0],))
+                for day, arch in c.fetchall():
+                    archs_by_day.setdefault(day, []).append(arch)
+
+            timeline = [
+                {'date': d, 'machines_joined': n, 'architectures': archs_by_day.get(d, [])}
+                for d, n in days
+            ]
+
+            return jsonify({
+                'timeline': timeline,
+                'generated_at': int(time.time())
             })
-        
-        conn.close()
-        return jsonify({
-            'timeline': timeline,
-            'generated_at': int(time.time())
-        })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -0,0 +1,383 @@
+"""OpenAPI 3.0.3 specification for the RustChain v2 node API.
+
+Kept out of the main module so the spec dicts are only materialized while
+being serialized; /openapi.json serves the cached bytes.
+"""
+
+OPENAPI = {
+    "openapi": "3.0.3",
+    "info": {
+        "title": "RustChain v2 API",
+        "version": "2.1.0-rip8",
+        "description": "RustChain v2 Integrated Server API with Epoch Rewards, Withdrawals, and Finality"
+    },
+    "servers": [
+        {"url": "http://localhost:8099", "description": "Local development server"}
+    ],
+    "paths": {
+        "/attest/challenge": {
+            "post": {
+                "summary": "Get hardware attestation challenge",
+                "requestBody": {
+                    "content": {"application/json": {"schema": {"type": "object"}}}
+                },
+                "responses": {
+                    "200": {
+                        "description": "Challenge issued",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "nonce": {"type": "string"},
+                                        "expires_at": {"type": "integer"},
+                                        "server_time": {"type": "integer"}
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        },
+        "/attest/submit": {
+            "post": {
+                "summary": "Submit hardware attestation",
+                "requestBody": {
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "properties": {
+                                    "report": {
+                                        "type": "object",
+                                        "properties": {
+                                            "nonce": {"type": "string"},
+                                            "device": {"type": "object"},
+                                            "commitment": {"type": "string"}
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    }
+                },
+                "responses": {
+                    "200": {
+                        "description": "Attestation accepted",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "ticket_id": {"type": "string"},
+                                        "status": {"type": "string"},
+                                        "device": {"type": "object"}
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        },
+        "/epoch": {
+            "get": {
+                "summary": "Get current epoch information",
+                "responses": {
+                    "200": {
+                        "description": "Current epoch info",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "epoch": {"type": "integer"},
+                                        "slot": {"type": "integer"},
+                                        "epoch_pot": {"type": "number"},
+                                        "enrolled_miners": {"type": "integer"},
+                                        "blocks_per_epoch": {"type": "integer"}
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        },
+        "/epoch/enroll": {
+            "post": {
+                "summary": "Enroll in current epoch",
+                "requestBody": {
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "properties": {
+                                    "miner_pubkey": {"type": "string"},
+                                    "device": {
+                                        "type": "object",
+                                        "properties": {
+                                            "family": {"type": "string"},
+                                            "arch": {"type": "string"}
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    }
+                },
+                "responses": {
+                    "200": {
+                        "description": "Enrollment successful",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "ok": {"type": "boolean"},
+                                        "epoch": {"type": "integer"},
+                                        "weight": {"type": "number"},
+                                        "miner_pk": {"type": "string"}
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        },
+        "/withdraw/register": {
+            "post": {
+                "summary": "Register SR25519 key for withdrawals",
+                "requestBody": {
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "properties": {
+                                    "miner_pk": {"type": "string"},
+                                    "pubkey_sr25519": {"type": "string"}
+                                }
+                            }
+                        }
+                    }
+                },
+                "responses": {
+                    "200": {
+                        "description": "Key registered",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "miner_pk": {"type": "string"},
+                                        "pubkey_registered": {"type": "boolean"},
+                                        "can_withdraw": {"type": "boolean"}
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        },
+        "/withdraw/request": {
+            "post": {
+                "summary": "Request RTC withdrawal",
+                "requestBody": {
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "properties": {
+                                    "miner_pk": {"type": "string"},
+                                    "amount": {"type": "number"},
+                                    "destination": {"type": "string"},
+                                    "signature": {"type": "string"},
+                                    "nonce": {"type": "string"}
+                                }
+                            }
+                        }
+                    }
+                },
+                "responses": {
+                    "200": {
+                        "description": "Withdrawal requested",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "withdrawal_id": {"type": "string"},
+                                        "status": {"type": "string"},
+                                        "amount": {"type": "number"},
+                                        "fee": {"type": "number"},
+                                        "net_amount": {"type": "number"}
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        },
+        "/withdraw/status/{withdrawal_id}": {
+            "get": {
+                "summary": "Get withdrawal status",
+                "parameters": [
+                    {
+                        "name": "withdrawal_id",
+                        "in": "path",
+                        "required": True,
+                        "schema": {"type": "string"}
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Withdrawal status",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "withdrawal_id": {"type": "string"},
+                                        "miner_pk": {"type": "string"},
+                                        "amount": {"type": "number"},
+                                        "fee": {"type": "number"},
+                                        "destination": {"type": "string"},
+                                        "status": {"type": "string"},
+                                        "created_at": {"type": "integer"},
+                                        "processed_at": {"type": "integer"},
+                                        "tx_hash": {"type": "string"},
+                                        "error_msg": {"type": "string"}
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        },
+        "/withdraw/history/{miner_pk}": {
+            "get": {
+                "summary": "Get withdrawal history",
+                "parameters": [
+                    {
+                        "name": "miner_pk",
+                        "in": "path",
+                        "required": True,
+                        "schema": {"type": "string"}
+                    },
+                    {
+                        "name": "limit",
+                        "in": "query",
+                        "schema": {"type": "integer", "default": 50}
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Withdrawal history",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "miner_pk": {"type": "string"},
+                                        "current_balance": {"type": "number"},
+                                        "withdrawals": {
+                                            "type": "array",
+                                            "items": {
+                                                "type": "object",
+                                                "properties": {
+                                                    "withdrawal_id": {"type": "string"},
+                                                    "amount": {"type": "number"},
+                                                    "fee": {"type": "number"},
+                                                    "destination": {"type": "string"},
+                                                    "status": {"type": "string"},
+                                                    "created_at": {"type": "integer"},
+                                                    "processed_at": {"type": "integer"},
+                                                    "tx_hash": {"type": "string"}
+                                                }
+                                            }
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        },
+        "/balance/{miner_pk}": {
+            "get": {
+                "summary": "Get miner balance",
+                "parameters": [
+                    {
+                        "name": "miner_pk",
+                        "in": "path",
+                        "required": True,
+                        "schema": {"type": "string"}
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Miner balance",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "miner_pk": {"type": "string"},
+                                        "balance_rtc": {"type": "number"}
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        },
+        "/api/stats": {
+            "get": {
+                "summary": "Get system statistics",
+                "responses": {
+                    "200": {
+                        "description": "System stats",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "version": {"type": "string"},
+                                        "chain_id": {"type": "string"},
+                                        "epoch": {"type": "integer"},
+                                        "block_time": {"type": "integer"},
+                                        "total_miners": {"type": "integer"},
+                                        "total_balance": {"type": "number"},
+                                        "pending_withdrawals": {"type": "integer"},
+                                        "features": {
+                                            "type": "array",
+                                            "items": {"type": "string"}
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        },
+        "/metrics": {
+            "get": {
+                "summary": "Prometheus metrics",
+                "responses": {
+                    "200": {
+                        "description": "Prometheus metrics",
+                        "content": {"text/plain": {"schema": {"type": "string"}}}
+                    }
+                }
+            }
+        }
+    }
+}
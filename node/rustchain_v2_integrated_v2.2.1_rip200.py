@@ -3,11 +3,16 @@
 RustChain v2 - Integrated Server
 Includes RIP-0005 (Epoch Rewards), RIP-0008 (Withdrawals), RIP-0009 (Finality)
 """
-import os, time, json, secrets, hashlib, hmac, sqlite3, base64, struct, uuid, glob, logging, sys, binascii, math, re, statistics
+import os, time, json, secrets, hashlib, hmac, sqlite3, base64, struct, uuid, glob, logging, logging.handlers, sys, binascii, math, re, statistics, threading, atexit, functools, queue, collections
 import ipaddress
 from urllib.parse import urlparse
-from flask import Flask, request, jsonify, g, send_from_directory, send_file, abort, render_template_string, redirect
+from flask import Flask, Response, request, jsonify, g, send_from_directory, send_file, abort, render_template_string, redirect
+from werkzeug.utils import safe_join
 import json
+try:
+    import orjson  # C-accelerated JSON for hot serialization paths
+except ImportError:
+    orjson = None
 from beacon_anchor import init_beacon_table, store_envelope, compute_beacon_digest, get_recent_envelopes, VALID_KINDS
 try:
     # Deployment compatibility: production may run this file as a single script.
@@ -65,6 +70,15 @@ except Exception as _e:
     print(f"[RIP-201] Fleet immune system not available: {_e}")
     HAVE_FLEET_IMMUNE = False
 
+# Specialize on configuration known at startup: bind the fleet-signal
+# recorder once so the attestation path calls through a function pointer
+# instead of re-testing HAVE_FLEET_IMMUNE per request.
+if HAVE_FLEET_IMMUNE:
+    _record_fleet = record_fleet_signals
+else:
+    def _record_fleet(*a, **kw):
+        return None
+
 # Ed25519 signature verification
 TESTNET_ALLOW_INLINE_PUBKEY = False  # PRODUCTION: Disabled
 TESTNET_ALLOW_MOCK_SIG = False  # PRODUCTION: Disabled
@@ -166,6 +180,24 @@ except ImportError as _e:
     print(f"[ISSUE #2276] Replay defense module not available: {_e}")
 
 app = Flask(__name__)
+
+# Route jsonify/get_json through orjson when installed: every JSON endpoint
+# (/epoch, /withdraw/*, /api/stats, /balance/*) gets the C encoder without
+# touching individual handlers. Key order is preserved to match stdlib output.
+if orjson is not None:
+    from flask.json.provider import DefaultJSONProvider
+
+    class _OrjsonProvider(DefaultJSONProvider):
+        sort_keys = False
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = _OrjsonProvider(app)
+
 # Supports running from repo `node/` dir or a flat deployment directory (e.g. /root/rustchain).
 _BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 REPO_ROOT = os.path.abspath(os.path.join(_BASE_DIR, "..")) if os.path.basename(_BASE_DIR) == "node" else _BASE_DIR
@@ -532,21 +564,43 @@ def _after(resp):
 # LIGHT CLIENT (static, served from node origin to avoid CORS)
 # ============================================================================
 
+_INDEX_CACHE = {"bytes": None, "mtime": 0, "checked": 0.0}
+
 @app.route("/light")
 def light_client_entry():
-    # Avoid caching during bounty iteration.
-    resp = send_from_directory(LIGHTCLIENT_DIR, "index.html")
-    resp.headers["Cache-Control"] = "no-store"
-    return resp
+    # Avoid browser caching during bounty iteration, but serve from memory:
+    # re-stat index.html at most every 5s and reload only when mtime moves.
+    now = time.monotonic()
+    if _INDEX_CACHE["bytes"] is None or now >= _INDEX_CACHE["checked"] + 5.0:
+        path = os.path.join(LIGHTCLIENT_DIR, "index.html")
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            abort(404)
+        if mtime != _INDEX_CACHE["mtime"]:
+            with open(path, "rb") as f:
+                _INDEX_CACHE["bytes"] = f.read()
+            _INDEX_CACHE["mtime"] = mtime
+        _INDEX_CACHE["checked"] = now
+    return Response(_INDEX_CACHE["bytes"], mimetype="text/html",
+                    headers={"Cache-Control": "no-store"})
 
 
+_BAD_PATH = re.compile(r"(?:^[\\/])|(?:\.\.)|\x00")
+
 @app.route("/light-client/<path:subpath>")
 def light_client_static(subpath: str):
-    # Minimal path traversal protection; send_from_directory already protects,
-    # but keep behavior explicit.
-    if ".." in subpath or subpath.startswith(("/", "\\")):
+    # Minimal path traversal protection; safe_join below already protects,
+    # but keep behavior explicit (one compiled scan instead of three).
+    if _BAD_PATH.search(subpath):
+        abort(404)
+    full = safe_join(LIGHTCLIENT_DIR, subpath)
+    if full is None or not os.path.isfile(full):
         abort(404)
-    resp = send_from_directory(LIGHTCLIENT_DIR, subpath)
+    # send_file(conditional=True) goes through wsgi.file_wrapper, so WSGI
+    # servers that support it (gunicorn) stream via sendfile(2) instead of
+    # reading the asset into Python.
+    resp = send_file(full, conditional=True)
     # Let browser cache vendor JS, but keep default safe.
     if subpath.startswith("vendor/"):
         resp.headers["Cache-Control"] = "public, max-age=86400"
@@ -554,391 +608,37 @@ def light_client_static(subpath: str):
         resp.headers["Cache-Control"] = "no-store"
     return resp
 
-# OpenAPI 3.0.3 Specification
-OPENAPI = {
-    "openapi": "3.0.3",
-    "info": {
-        "title": "RustChain v2 API",
-        "version": "2.1.0-rip8",
-        "description": "RustChain v2 Integrated Server API with Epoch Rewards, Withdrawals, and Finality"
-    },
-    "servers": [
-        {"url": "http://localhost:8099", "description": "Local development server"}
-    ],
-    "paths": {
-        "/attest/challenge": {
-            "post": {
-                "summary": "Get hardware attestation challenge",
-                "requestBody": {
-                    "content": {"application/json": {"schema": {"type": "object"}}}
-                },
-                "responses": {
-                    "200": {
-                        "description": "Challenge issued",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "nonce": {"type": "string"},
-                                        "expires_at": {"type": "integer"},
-                                        "server_time": {"type": "integer"}
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-        },
-        "/attest/submit": {
-            "post": {
-                "summary": "Submit hardware attestation",
-                "requestBody": {
-                    "content": {
-                        "application/json": {
-                            "schema": {
-                                "type": "object",
-                                "properties": {
-                                    "report": {
-                                        "type": "object",
-                                        "properties": {
-                                            "nonce": {"type": "string"},
-                                            "device": {"type": "object"},
-                                            "commitment": {"type": "string"}
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    }
-                },
-                "responses": {
-                    "200": {
-                        "description": "Attestation accepted",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "ticket_id": {"type": "string"},
-                                        "status": {"type": "string"},
-                                        "device": {"type": "object"}
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-        },
-        "/epoch": {
-            "get": {
-                "summary": "Get current epoch information",
-                "responses": {
-                    "200": {
-                        "description": "Current epoch info",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "epoch": {"type": "integer"},
-                                        "slot": {"type": "integer"},
-                                        "epoch_pot": {"type": "number"},
-                                        "enrolled_miners": {"type": "integer"},
-                                        "blocks_per_epoch": {"type": "integer"}
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-        },
-        "/epoch/enroll": {
-            "post": {
-                "summary": "Enroll in current epoch",
-                "requestBody": {
-                    "content": {
-                        "application/json": {
-                            "schema": {
-                                "type": "object",
-                                "properties": {
-                                    "miner_pubkey": {"type": "string"},
-                                    "device": {
-                                        "type": "object",
-                                        "properties": {
-                                            "family": {"type": "string"},
-                                            "arch": {"type": "string"}
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    }
-                },
-                "responses": {
-                    "200": {
-                        "description": "Enrollment successful",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "ok": {"type": "boolean"},
-                                        "epoch": {"type": "integer"},
-                                        "weight": {"type": "number"},
-                                        "miner_pk": {"type": "string"}
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-        },
-        "/withdraw/register": {
-            "post": {
-                "summary": "Register SR25519 key for withdrawals",
-                "requestBody": {
-                    "content": {
-                        "application/json": {
-                            "schema": {
-                                "type": "object",
-                                "properties": {
-                                    "miner_pk": {"type": "string"},
-                                    "pubkey_sr25519": {"type": "string"}
-                                }
-                            }
-                        }
-                    }
-                },
-                "responses": {
-                    "200": {
-                        "description": "Key registered",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "miner_pk": {"type": "string"},
-                                        "pubkey_registered": {"type": "boolean"},
-                                        "can_withdraw": {"type": "boolean"}
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-        },
-        "/withdraw/request": {
-            "post": {
-                "summary": "Request RTC withdrawal",
-                "requestBody": {
-                    "content": {
-                        "application/json": {
-                            "schema": {
-                                "type": "object",
-                                "properties": {
-                                    "miner_pk": {"type": "string"},
-                                    "amount": {"type": "number"},
-                                    "destination": {"type": "string"},
-                                    "signature": {"type": "string"},
-                                    "nonce": {"type": "string"}
-                                }
-                            }
-                        }
-                    }
-                },
-                "responses": {
-                    "200": {
-                        "description": "Withdrawal requested",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "withdrawal_id": {"type": "string"},
-                                        "status": {"type": "string"},
-                                        "amount": {"type": "number"},
-                                        "fee": {"type": "number"},
-                                        "net_amount": {"type": "number"}
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-        },
-        "/withdraw/status/{withdrawal_id}": {
-            "get": {
-                "summary": "Get withdrawal status",
-                "parameters": [
-                    {
-                        "name": "withdrawal_id",
-                        "in": "path",
-                        "required": True,
-                        "schema": {"type": "string"}
-                    }
-                ],
-                "responses": {
-                    "200": {
-                        "description": "Withdrawal status",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "withdrawal_id": {"type": "string"},
-                                        "miner_pk": {"type": "string"},
-                                        "amount": {"type": "number"},
-                                        "fee": {"type": "number"},
-                                        "destination": {"type": "string"},
-                                        "status": {"type": "string"},
-                                        "created_at": {"type": "integer"},
-                                        "processed_at": {"type": "integer"},
-                                        "tx_hash": {"type": "string"},
-                                        "error_msg": {"type": "string"}
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-        },
-        "/withdraw/history/{miner_pk}": {
-            "get": {
-                "summary": "Get withdrawal history",
-                "parameters": [
-                    {
-                        "name": "miner_pk",
-                        "in": "path",
-                        "required": True,
-                        "schema": {"type": "string"}
-                    },
-                    {
-                        "name": "limit",
-                        "in": "query",
-                        "schema": {"type": "integer", "default": 50}
-                    }
-                ],
-                "responses": {
-                    "200": {
-                        "description": "Withdrawal history",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "miner_pk": {"type": "string"},
-                                        "current_balance": {"type": "number"},
-                                        "withdrawals": {
-                                            "type": "array",
-                                            "items": {
-                                                "type": "object",
-                                                "properties": {
-                                                    "withdrawal_id": {"type": "string"},
-                                                    "amount": {"type": "number"},
-                                                    "fee": {"type": "number"},
-                                                    "destination": {"type": "string"},
-                                                    "status": {"type": "string"},
-                                                    "created_at": {"type": "integer"},
-                                                    "processed_at": {"type": "integer"},
-                                                    "tx_hash": {"type": "string"}
-                                                }
-                                            }
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-        },
-        "/balance/{miner_pk}": {
-            "get": {
-                "summary": "Get miner balance",
-                "parameters": [
-                    {
-                        "name": "miner_pk",
-                        "in": "path",
-                        "required": True,
-                        "schema": {"type": "string"}
-                    }
-                ],
-                "responses": {
-                    "200": {
-                        "description": "Miner balance",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "miner_pk": {"type": "string"},
-                                        "balance_rtc": {"type": "number"}
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-        },
-        "/api/stats": {
-            "get": {
-                "summary": "Get system statistics",
-                "responses": {
-                    "200": {
-                        "description": "System stats",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "version": {"type": "string"},
-                                        "chain_id": {"type": "string"},
-                                        "epoch": {"type": "integer"},
-                                        "block_time": {"type": "integer"},
-                                        "total_miners": {"type": "integer"},
-                                        "total_balance": {"type": "number"},
-                                        "pending_withdrawals": {"type": "integer"},
-                                        "features": {
-                                            "type": "array",
-                                            "items": {"type": "string"}
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-        },
-        "/metrics": {
-            "get": {
-                "summary": "Prometheus metrics",
-                "responses": {
-                    "200": {
-                        "description": "Prometheus metrics",
-                        "content": {"text/plain": {"schema": {"type": "string"}}}
-                    }
-                }
-            }
-        }
-    }
-}
+# OPENAPI spec lives in openapi_spec.py; import it once, serialize, and
+# drop the module so workers don't keep thousands of spec dicts resident.
+# /openapi.json serves the cached bytes.
+try:
+    import openapi_spec as _openapi_spec
+except ImportError:
+    from node import openapi_spec as _openapi_spec
+if orjson is not None:
+    _OPENAPI_BYTES = orjson.dumps(_openapi_spec.OPENAPI)
+else:
+    _OPENAPI_BYTES = json.dumps(_openapi_spec.OPENAPI, separators=(",", ":")).encode()
+_OPENAPI_ETAG = '"%s"' % blake2b(_OPENAPI_BYTES, digest_size=8).hexdigest()
+sys.modules.pop(_openapi_spec.__name__, None)
+del _openapi_spec
 
 # Configuration
 BLOCK_TIME = 600  # 10 minutes
 GENESIS_TIMESTAMP = 1764706927  # First actual block (Dec 2, 2025)
 EPOCH_SLOTS = 144  # 24 hours at 10-min blocks
 PER_EPOCH_RTC = 1.5  # Total RTC distributed per epoch across all miners
-PER_BLOCK_RTC = PER_EPOCH_RTC / EPOCH_SLOTS  # ~0.0104 RTC per block
+# Monetary math is done in integer micro-RTC (uRTC); floats only appear when
+# building API responses. PER_EPOCH_RTC / EPOCH_SLOTS is a non-terminating
+# float, so the integer split carries the remainder explicitly.
+UNIT = 1_000_000  # uRTC per RTC (same scale as rewards_implementation_rip200)
+PER_EPOCH_URTC = int(PER_EPOCH_RTC * UNIT)
+PER_BLOCK_URTC, EPOCH_REMAINDER_URTC = divmod(PER_EPOCH_URTC, EPOCH_SLOTS)
+PER_BLOCK_RTC = PER_BLOCK_URTC / UNIT  # display only — never accumulate this
+
+def _urtc_to_rtc(u):
+    """Convert integer micro-RTC to RTC for API responses."""
+    return (u or 0) / UNIT
 TOTAL_SUPPLY_RTC = 8_388_608  # Exactly 2**23 — pure binary, immutable
 TOTAL_SUPPLY_URTC = int(TOTAL_SUPPLY_RTC * 1_000_000)  # 8,388,608,000,000 uRTC
 ENFORCE = False  # Start with enforcement off
@@ -956,7 +656,10 @@ GOVERNANCE_ACTIVE_MINER_WINDOW_SECONDS = 3600
 withdrawal_requests = Counter('rustchain_withdrawal_requests', 'Total withdrawal requests')
 withdrawal_completed = Counter('rustchain_withdrawal_completed', 'Completed withdrawals')
 withdrawal_failed = Counter('rustchain_withdrawal_failed', 'Failed withdrawals')
-balance_gauge = Gauge('rustchain_miner_balance', 'Miner balance', ['miner_pk'])
+# A per-miner labelled gauge is unbounded cardinality; track the balance
+# distribution instead, observed whenever a balance changes.
+balance_hist = Histogram('rustchain_miner_balance_rtc', 'Miner balance at update time (RTC)',
+                         buckets=(0.01, 0.1, 1, 10, 100, 1000, 10000))
 epoch_gauge = Gauge('rustchain_current_epoch', 'Current epoch')
 withdrawal_queue_size = Gauge('rustchain_withdrawal_queue', 'Pending withdrawals')
 
@@ -964,6 +667,106 @@ withdrawal_queue_size = Gauge('rustchain_withdrawal_queue', 'Pending withdrawals
 # Allow env override for local dev / different deployments.
 DB_PATH = os.environ.get("RUSTCHAIN_DB_PATH") or os.environ.get("DB_PATH") or "./rustchain_v2.db"
 
+# One long-lived connection per thread: opening the DB fresh on every call
+# costs an open() + WAL header read + pragma reset, which dominates bursty
+# /attest/submit traffic. Safe under WAL; `with _connect() as conn:` keeps
+# its commit-on-exit transaction semantics on the cached connection.
+# 1-second-resolution clock refreshed by a daemon ticker so hot loops can
+# read a cached int instead of calling clock_gettime per row. Anything that
+# needs sub-second precision keeps calling time.time() directly.
+_NOW_S = [int(time.time())]
+
+def now_s() -> int:
+    return _NOW_S[0]
+
+def _clock_tick():
+    while True:
+        _NOW_S[0] = int(time.time())
+        time.sleep(0.5)
+
+threading.Thread(target=_clock_tick, daemon=True, name="clock-tick").start()
+
+_DB_LOCAL = threading.local()
+_DB_CONNS = []  # every pooled connection, closed in one sweep at exit
+_DB_CONNS_LOCK = threading.Lock()
+
+def _close_pooled_conns():
+    with _DB_CONNS_LOCK:
+        conns, _DB_CONNS[:] = _DB_CONNS[:], []
+    for c in conns:
+        try:
+            c.close()
+        except Exception:
+            pass
+
+atexit.register(_close_pooled_conns)
+
+# Hall/attestation logging goes through a QueueHandler so the hot path
+# only does a queue.put; the QueueListener thread owns the stdout flush.
+# Keeps synchronous I/O out of the window where the sqlite write lock is
+# held.
+_hall_logq = queue.SimpleQueue()
+hall_log = logging.getLogger("rustchain.hall")
+hall_log.setLevel(logging.INFO)
+hall_log.propagate = False
+hall_log.addHandler(logging.handlers.QueueHandler(_hall_logq))
+_hall_listener = logging.handlers.QueueListener(_hall_logq, logging.StreamHandler())
+_hall_listener.start()
+atexit.register(_hall_listener.stop)
+
+# Validators and epoch settlement share the same queue: level-gated,
+# lazily formatted, flushed off-thread.
+node_log = logging.getLogger("rustchain.node")
+node_log.setLevel(logging.INFO)
+node_log.propagate = False
+node_log.addHandler(logging.handlers.QueueHandler(_hall_logq))
+
+def _connect():
+    """Return this thread's cached connection to the node DB.
+
+    Every handler goes through here so busy_timeout / foreign_keys are
+    uniform; the heavyweight WAL/mmap tuning happens once in init_db.
+    """
+    conn = getattr(_DB_LOCAL, "conn", None)
+    if conn is None or getattr(_DB_LOCAL, "path", None) != DB_PATH:
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        # detect_types=0: no per-column declared-type parsing on fetch;
+        # cached_statements raised so hot SQL is parsed once per connection.
+        conn = sqlite3.connect(DB_PATH, timeout=5, detect_types=0, cached_statements=256)
+        conn.set_trace_callback(None)
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA foreign_keys=ON")
+        # Per-connection tuning: journal_mode=WAL persists in the database
+        # file (set by init_db), but synchronous/temp_store/cache/mmap are
+        # connection-scoped and must be applied to every pooled handle.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA mmap_size=268435456")
+        # Deterministic scalar used by the hall-of-rust rescore UPDATE; the
+        # lambda defers to the function defined later in this module.
+        try:
+            conn.create_function("rust_score_fn", 4,
+                                 lambda y, a, n, i: calculate_rust_score_inline(y, a, n, i),
+                                 deterministic=True)
+        except Exception:
+            pass
+        # Only cache real connections (sqlite3.connect may be patched in tests)
+        if isinstance(conn, sqlite3.Connection):
+            _DB_LOCAL.conn = conn
+            _DB_LOCAL.path = DB_PATH
+            with _DB_CONNS_LOCK:
+                _DB_CONNS.append(conn)
+    else:
+        # Handlers that want sqlite3.Row set it per request; reset so the
+        # cached connection hands plain tuples to everyone else.
+        conn.row_factory = None
+    return conn
+
 # Set Flask app config for DB_PATH
 app.config["DB_PATH"] = DB_PATH
 
@@ -1017,86 +820,77 @@ if HAVE_BOTTUBE_FEED:
     except Exception as e:
         print(f"[BoTTube Feed] Failed to register feed endpoints: {e}")
 
-def init_db():
-    """Initialize all database tables"""
-    with sqlite3.connect(DB_PATH) as c:
-        # Core tables
-        attest_ensure_tables(c)
-        c.execute("CREATE TABLE IF NOT EXISTS tickets (ticket_id TEXT PRIMARY KEY, expires_at INTEGER, commitment TEXT)")
-
-        # Epoch tables
-        c.execute("CREATE TABLE IF NOT EXISTS epoch_state (epoch INTEGER PRIMARY KEY, accepted_blocks INTEGER DEFAULT 0, finalized INTEGER DEFAULT 0)")
-        c.execute("CREATE TABLE IF NOT EXISTS epoch_enroll (epoch INTEGER, miner_pk TEXT, weight REAL, PRIMARY KEY (epoch, miner_pk))")
-        c.execute("CREATE TABLE IF NOT EXISTS balances (miner_pk TEXT PRIMARY KEY, balance_rtc REAL DEFAULT 0)")
-        ensure_fingerprint_history_table(c)
-        ensure_epoch_fingerprint_rotation_table(c)
-
-        # Pending transfers (2-phase commit)
-        # NOTE: Production DBs may already have a different balances schema; this table is additive.
-        c.execute(
-            """
-            CREATE TABLE IF NOT EXISTS pending_ledger (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                ts INTEGER NOT NULL,
-                epoch INTEGER NOT NULL,
-                from_miner TEXT NOT NULL,
-                to_miner TEXT NOT NULL,
-                amount_i64 INTEGER NOT NULL,
-                reason TEXT,
-                status TEXT DEFAULT 'pending',
-                created_at INTEGER NOT NULL,
-                confirms_at INTEGER NOT NULL,
-                tx_hash TEXT,
-                voided_by TEXT,
-                voided_reason TEXT,
-                confirmed_at INTEGER
-            )
-            """
-        )
-
-        # Replay protection for signed transfers
-        c.execute(
-            """
-            CREATE TABLE IF NOT EXISTS transfer_nonces (
-                from_address TEXT NOT NULL,
-                nonce TEXT NOT NULL,
-                used_at INTEGER NOT NULL,
-                PRIMARY KEY (from_address, nonce)
-            )
-            """
-        )
-        c.execute("CREATE INDEX IF NOT EXISTS idx_pending_ledger_status ON pending_ledger(status)")
-        c.execute("CREATE INDEX IF NOT EXISTS idx_pending_ledger_confirms_at ON pending_ledger(confirms_at)")
-        c.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_pending_ledger_tx_hash ON pending_ledger(tx_hash)")
-
-        # Withdrawal tables
-        c.execute("""
-            CREATE TABLE IF NOT EXISTS withdrawals (
-                withdrawal_id TEXT PRIMARY KEY,
-                miner_pk TEXT NOT NULL,
-                amount REAL NOT NULL,
-                fee REAL NOT NULL,
-                destination TEXT NOT NULL,
-                signature TEXT NOT NULL,
-                status TEXT DEFAULT 'pending',
-                created_at INTEGER NOT NULL,
-                processed_at INTEGER,
-                tx_hash TEXT,
-                error_msg TEXT
-            )
-        """)
-
-        c.execute("""
-            CREATE TABLE IF NOT EXISTS withdrawal_limits (
-                miner_pk TEXT NOT NULL,
-                date TEXT NOT NULL,
-                total_withdrawn REAL DEFAULT 0,
-                PRIMARY KEY (miner_pk, date)
-            )
-        """)
-
-        # RIP-301: Fee events tracking (fees recycled to mining pool)
-        c.execute("""CREATE TABLE IF NOT EXISTS fee_events (
+# Core schema, applied in one parse/transaction by init_db(). Helper-owned
+# tables (attestations, governance, fingerprints, beacon, bridge, ...) are
+# created by their modules below.
+_SCHEMA_SQL = """
+BEGIN;
+CREATE TABLE IF NOT EXISTS tickets (ticket_id TEXT PRIMARY KEY, expires_at INTEGER, commitment TEXT);
+
+CREATE TABLE IF NOT EXISTS epoch_state (epoch INTEGER PRIMARY KEY, accepted_blocks INTEGER DEFAULT 0, finalized INTEGER DEFAULT 0);
+
+CREATE TABLE IF NOT EXISTS epoch_enroll (epoch INTEGER, miner_pk TEXT, weight REAL, PRIMARY KEY (epoch, miner_pk));
+
+CREATE TABLE IF NOT EXISTS balances (miner_pk TEXT PRIMARY KEY, balance_rtc REAL DEFAULT 0, balance_urtc INTEGER NOT NULL DEFAULT 0);
+
+CREATE TABLE IF NOT EXISTS pending_ledger (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts INTEGER NOT NULL,
+    epoch INTEGER NOT NULL,
+    from_miner TEXT NOT NULL,
+    to_miner TEXT NOT NULL,
+    amount_i64 INTEGER NOT NULL,
+    reason TEXT,
+    status TEXT DEFAULT 'pending',
+    created_at INTEGER NOT NULL,
+    confirms_at INTEGER NOT NULL,
+    tx_hash TEXT,
+    voided_by TEXT,
+    voided_reason TEXT,
+    confirmed_at INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS transfer_nonces (
+    from_address TEXT NOT NULL,
+    nonce TEXT NOT NULL,
+    used_at INTEGER NOT NULL,
+    PRIMARY KEY (from_address, nonce)
+);
+
+CREATE INDEX IF NOT EXISTS idx_pending_ledger_status ON pending_ledger(status);
+
+CREATE INDEX IF NOT EXISTS idx_pending_ledger_confirms_at ON pending_ledger(confirms_at);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_pending_ledger_tx_hash ON pending_ledger(tx_hash);
+
+CREATE INDEX IF NOT EXISTS idx_pending_ledger_from_confirms ON pending_ledger(from_miner, confirms_at);
+
+CREATE TABLE IF NOT EXISTS withdrawals (
+    withdrawal_id TEXT PRIMARY KEY,
+    miner_pk TEXT NOT NULL,
+    amount REAL NOT NULL,
+    fee REAL NOT NULL,
+    destination TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    status TEXT DEFAULT 'pending',
+    created_at INTEGER NOT NULL,
+    processed_at INTEGER,
+    tx_hash TEXT,
+    error_msg TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_withdrawals_miner_created ON withdrawals(miner_pk, created_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_withdrawals_status ON withdrawals(status) WHERE status IN ('pending','processing');
+
+CREATE TABLE IF NOT EXISTS withdrawal_limits (
+    miner_pk TEXT NOT NULL,
+    date TEXT NOT NULL,
+    total_withdrawn REAL DEFAULT 0,
+    PRIMARY KEY (miner_pk, date)
+);
+
+CREATE TABLE IF NOT EXISTS fee_events (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             source TEXT NOT NULL,
             source_id TEXT,
@@ -1105,115 +899,153 @@ def init_db():
             fee_urtc INTEGER NOT NULL,
             destination TEXT NOT NULL,
             created_at INTEGER NOT NULL
-        )""")
+        );
+
+CREATE INDEX IF NOT EXISTS idx_fee_events_miner_created ON fee_events(miner_pk, created_at DESC);
+
+CREATE TABLE IF NOT EXISTS miner_keys (
+    miner_pk TEXT PRIMARY KEY,
+    pubkey_sr25519 TEXT NOT NULL,
+    registered_at INTEGER NOT NULL,
+    last_withdrawal INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS withdrawal_nonces (
+    miner_pk TEXT NOT NULL,
+    nonce TEXT NOT NULL,
+    used_at INTEGER NOT NULL,
+    PRIMARY KEY (miner_pk, nonce)
+);
+
+CREATE TABLE IF NOT EXISTS gov_rotation_proposals(
+    epoch_effective INTEGER PRIMARY KEY,
+    threshold INTEGER NOT NULL,
+    members_json TEXT NOT NULL,
+    created_ts BIGINT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS gov_rotation_approvals(
+    epoch_effective INTEGER NOT NULL,
+    signer_id INTEGER NOT NULL,
+    sig_hex TEXT NOT NULL,
+    approved_ts BIGINT NOT NULL,
+    UNIQUE(epoch_effective, signer_id)
+);
+
+CREATE TABLE IF NOT EXISTS gov_signers(
+    signer_id INTEGER PRIMARY KEY,
+    pubkey_hex TEXT NOT NULL,
+    active INTEGER DEFAULT 1
+);
+
+CREATE TABLE IF NOT EXISTS gov_threshold(
+    id INTEGER PRIMARY KEY,
+    threshold INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS gov_rotation(
+    epoch_effective INTEGER PRIMARY KEY,
+    committed INTEGER DEFAULT 0,
+    threshold INTEGER NOT NULL,
+    created_ts BIGINT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS gov_rotation_members(
+    epoch_effective INTEGER NOT NULL,
+    signer_id INTEGER NOT NULL,
+    pubkey_hex TEXT NOT NULL,
+    PRIMARY KEY (epoch_effective, signer_id)
+);
+
+CREATE TABLE IF NOT EXISTS checkpoints_meta(
+    k TEXT PRIMARY KEY,
+    v TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS wallet_review_holds(
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    wallet TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'needs_review',
+    reason TEXT NOT NULL,
+    coach_note TEXT DEFAULT '',
+    reviewer_note TEXT DEFAULT '',
+    created_at INTEGER NOT NULL,
+    reviewed_at INTEGER DEFAULT 0
+);
+
+CREATE INDEX IF NOT EXISTS idx_wallet_review_wallet ON wallet_review_holds(wallet, created_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_wallet_review_status ON wallet_review_holds(status, created_at DESC);
+
+CREATE TABLE IF NOT EXISTS headers(
+    slot INTEGER PRIMARY KEY,
+    header_json TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS schema_version(
+    version INTEGER PRIMARY KEY,
+    applied_at INTEGER NOT NULL
+);
+
+INSERT OR IGNORE INTO gov_threshold(id, threshold) VALUES(1, 3);
+
+INSERT OR IGNORE INTO checkpoints_meta(k, v) VALUES('chain_id', 'rustchain-mainnet-candidate');
+
+CREATE TABLE IF NOT EXISTS miner_attest_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            miner TEXT NOT NULL,
+            ts_ok INTEGER NOT NULL,
+            device_family TEXT,
+            device_arch TEXT,
+            entropy_score REAL DEFAULT 0.0,
+            fingerprint_passed INTEGER DEFAULT 0
+        );
 
-        c.execute("""
-            CREATE TABLE IF NOT EXISTS miner_keys (
-                miner_pk TEXT PRIMARY KEY,
-                pubkey_sr25519 TEXT NOT NULL,
-                registered_at INTEGER NOT NULL,
-                last_withdrawal INTEGER
-            )
-        """)
+CREATE INDEX IF NOT EXISTS idx_attest_history_miner ON miner_attest_history(miner);
 
-        # Withdrawal nonce tracking (replay protection)
-        c.execute("""
-            CREATE TABLE IF NOT EXISTS withdrawal_nonces (
-                miner_pk TEXT NOT NULL,
-                nonce TEXT NOT NULL,
-                used_at INTEGER NOT NULL,
-                PRIMARY KEY (miner_pk, nonce)
-            )
-        """)
+CREATE INDEX IF NOT EXISTS idx_attest_history_ts ON miner_attest_history(miner, ts_ok);
+
+COMMIT;
+"""
+
+SCHEMA_USER_VERSION = 17
+
+def init_db():
+    """Initialize all database tables"""
+    with _connect() as c:
+        # One-shot guard: a fully-initialized DB carries its schema level in
+        # user_version, so extra gunicorn workers skip the DDL entirely.
+        if c.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_USER_VERSION:
+            return
+        # Concurrency tuning, applied once: WAL keeps readers off the
+        # writer's fsync path (API reads vs worker/attestation writes),
+        # NORMAL sync coalesces fdatasync calls. WAL persists in the file.
+        c.execute("PRAGMA journal_mode=WAL")
+        c.execute("PRAGMA synchronous=NORMAL")
+        c.execute("PRAGMA temp_store=MEMORY")
+        c.execute("PRAGMA mmap_size=268435456")
+        c.execute("PRAGMA cache_size=-65536")
+        c.execute("PRAGMA wal_autocheckpoint=1000")
+
+        # Core tables (single executescript: one parse, one transaction)
+        attest_ensure_tables(c)
+        c.executescript(_SCHEMA_SQL)
+        ensure_fingerprint_history_table(c)
+        ensure_epoch_fingerprint_rotation_table(c)
+
+        # Integer accounting migration: accumulate money in uRTC ints and
+        # keep balance_rtc as the derived display column (same pattern as
+        # pending_ledger.amount_i64).
+        bal_cols = {r[1] for r in c.execute("PRAGMA table_info(balances)")}
+        if "balance_rtc" in bal_cols and "balance_urtc" not in bal_cols:
+            c.execute("ALTER TABLE balances ADD COLUMN balance_urtc INTEGER NOT NULL DEFAULT 0")
+            c.execute("UPDATE balances SET balance_urtc = CAST(ROUND(balance_rtc * 1000000) AS INTEGER)")
 
         # Governance proposal and voting tables
         _ensure_governance_tables(c)
 
-        # Governance tables (RIP-0142)
-        c.execute("""
-            CREATE TABLE IF NOT EXISTS gov_rotation_proposals(
-                epoch_effective INTEGER PRIMARY KEY,
-                threshold INTEGER NOT NULL,
-                members_json TEXT NOT NULL,
-                created_ts BIGINT NOT NULL
-            )
-        """)
-        c.execute("""
-            CREATE TABLE IF NOT EXISTS gov_rotation_approvals(
-                epoch_effective INTEGER NOT NULL,
-                signer_id INTEGER NOT NULL,
-                sig_hex TEXT NOT NULL,
-                approved_ts BIGINT NOT NULL,
-                UNIQUE(epoch_effective, signer_id)
-            )
-        """)
-        c.execute("""
-            CREATE TABLE IF NOT EXISTS gov_signers(
-                signer_id INTEGER PRIMARY KEY,
-                pubkey_hex TEXT NOT NULL,
-                active INTEGER DEFAULT 1
-            )
-        """)
-        c.execute("""
-            CREATE TABLE IF NOT EXISTS gov_threshold(
-                id INTEGER PRIMARY KEY,
-                threshold INTEGER NOT NULL
-            )
-        """)
-        c.execute("""
-            CREATE TABLE IF NOT EXISTS gov_rotation(
-                epoch_effective INTEGER PRIMARY KEY,
-                committed INTEGER DEFAULT 0,
-                threshold INTEGER NOT NULL,
-                created_ts BIGINT NOT NULL
-            )
-        """)
-        c.execute("""
-            CREATE TABLE IF NOT EXISTS gov_rotation_members(
-                epoch_effective INTEGER NOT NULL,
-                signer_id INTEGER NOT NULL,
-                pubkey_hex TEXT NOT NULL,
-                PRIMARY KEY (epoch_effective, signer_id)
-            )
-        """)
-        c.execute("""
-            CREATE TABLE IF NOT EXISTS checkpoints_meta(
-                k TEXT PRIMARY KEY,
-                v TEXT NOT NULL
-            )
-        """)
-        c.execute("""
-            CREATE TABLE IF NOT EXISTS wallet_review_holds(
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                wallet TEXT NOT NULL,
-                status TEXT NOT NULL DEFAULT 'needs_review',
-                reason TEXT NOT NULL,
-                coach_note TEXT DEFAULT '',
-                reviewer_note TEXT DEFAULT '',
-                created_at INTEGER NOT NULL,
-                reviewed_at INTEGER DEFAULT 0
-            )
-        """)
-        c.execute("CREATE INDEX IF NOT EXISTS idx_wallet_review_wallet ON wallet_review_holds(wallet, created_at DESC)")
-        c.execute("CREATE INDEX IF NOT EXISTS idx_wallet_review_status ON wallet_review_holds(status, created_at DESC)")
-        c.execute("""
-            CREATE TABLE IF NOT EXISTS headers(
-                slot INTEGER PRIMARY KEY,
-                header_json TEXT NOT NULL
-            )
-        """)
-        c.execute("""
-            CREATE TABLE IF NOT EXISTS schema_version(
-                version INTEGER PRIMARY KEY,
-                applied_at INTEGER NOT NULL
-            )
-        """)
-
-        # Insert default values
         c.execute("INSERT OR IGNORE INTO schema_version(version, applied_at) VALUES(17, ?)",
                   (int(time.time()),))
-        c.execute("INSERT OR IGNORE INTO gov_threshold(id, threshold) VALUES(1, 3)")
-        c.execute("INSERT OR IGNORE INTO checkpoints_meta(k, v) VALUES('chain_id', 'rustchain-mainnet-candidate')")
         # BCOS v2: Blockchain Certified Open Source attestations
         try:
             from bcos_routes import init_bcos_table
@@ -1221,19 +1053,6 @@ def init_db():
         except ImportError:
             pass
 
-        # C3 fix: Attestation history for first_attest tracking
-        c.execute("""CREATE TABLE IF NOT EXISTS miner_attest_history (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            miner TEXT NOT NULL,
-            ts_ok INTEGER NOT NULL,
-            device_family TEXT,
-            device_arch TEXT,
-            entropy_score REAL DEFAULT 0.0,
-            fingerprint_passed INTEGER DEFAULT 0
-        )""")
-        c.execute("CREATE INDEX IF NOT EXISTS idx_attest_history_miner ON miner_attest_history(miner)")
-        c.execute("CREATE INDEX IF NOT EXISTS idx_attest_history_ts ON miner_attest_history(miner, ts_ok)")
-
         # Issue #2276: Hardware fingerprint replay defense tables
         if HAVE_REPLAY_DEFENSE:
             init_replay_defense_schema()
@@ -1262,6 +1081,10 @@ def init_db():
         except Exception as e:
             print(f"[UTXO] WARNING: Table init failed: {e}")
 
+    # Stamp only after every init step above completed, so an interrupted
+    # first run is retried in full by the next worker.
+    _connect().execute(f"PRAGMA user_version={SCHEMA_USER_VERSION}")
+
 # Hardware multipliers
 HARDWARE_WEIGHTS = {
     # PowerPC — vintage computing royalty
@@ -1303,6 +1126,22 @@ HARDWARE_WEIGHTS = {
                 "saturn_sh2": 2.6, "gba_arm7": 2.3, "default": 2.5},
 }
 
+# Flattened at import: one tuple-keyed lookup replaces the nested
+# dict-of-dicts .get chains on the enroll/attest hot paths. (family, None)
+# carries the family default.
+_HW_WEIGHT = {}
+for _fam, _sub in HARDWARE_WEIGHTS.items():
+    for _arch, _w in _sub.items():
+        _HW_WEIGHT[(_fam, _arch)] = _w
+    _HW_WEIGHT[(_fam, None)] = _sub.get("default", 1.0)
+del _fam, _sub, _arch, _w
+
+def _hw_weight(family, arch, default=1.0):
+    w = _HW_WEIGHT.get((family, arch))
+    if w is None:
+        w = _HW_WEIGHT.get((family, None), default)
+    return w
+
 # === WELCOME BONUS & STREAK REWARDS ===
 WELCOME_BONUS_RTC = 0.5          # RTC given on first successful attestation
 WELCOME_BONUS_SOURCE = "founder_community"  # Fund that pays welcome bonuses
@@ -1520,10 +1359,21 @@ def _has_any_token(text: str, tokens: set) -> bool:
     return any(token in text for token in tokens)
 
 
+@functools.lru_cache(maxsize=256)
+def _lower(s: str) -> str:
+    """Cached str.lower for arch/family tokens.
+
+    Device archs and families come from a small closed vocabulary, so
+    caching the lowercase form turns the per-call allocation into a dict
+    hit. Not for open-ended inputs like miner names.
+    """
+    return s.lower()
+
+
 def _claims_powerpc(device: dict) -> bool:
     family, arch = _claimed_family_and_arch(device)
-    family_lower = family.lower()
-    arch_lower = arch.lower()
+    family_lower = _lower(family)
+    arch_lower = _lower(arch)
     return "powerpc" in family_lower or "ppc" in family_lower or arch_lower in POWERPC_ARCHES
 
 
@@ -1620,6 +1470,32 @@ def _detect_arm_evidence(device: dict, fingerprint: dict) -> bool:
     return False
 
 
+# Token tables for _detect_exotic_arch, built once at import so the
+# per-attestation classification is pure membership tests against
+# prebuilt sets instead of reconstructing the literals on every call.
+_SPARC_MACHINES = ("sparc", "sparc64", "sun4u", "sun4v")
+_SPARC_BRANDS = {"sparc", "ultrasparc", "sun4", "fujitsu sparc"}
+_MIPS_MACHINES = ("mips", "mips64", "mipsel", "mips64el")
+_MIPS_BRANDS = {"mips", "r2000", "r3000", "r4000", "r4400", "r5000", "r8000", "r10000",
+                "r12000", "r14000", "r16000", "vr4300", "loongson", "ingenic",
+                "emotion engine", "allegrex", "r5900"}
+_RISCV_MACHINES = ("riscv64", "riscv32", "riscv")
+_RISCV_BRANDS = {"riscv", "risc-v", "sifive", "thead", "starfive", "kendryte", "allwinner d1", "xuantie"}
+_SH_BRANDS = {"sh-1", "sh-2", "sh-4", "sh4", "sh2", "sh1", "sh4a", "superh", "renesas sh"}
+_M68K_MACHINES = ("m68k",)
+_M68K_BRANDS = {"68000", "68010", "68020", "68030", "68040", "68060", "mc68", "m68k", "motorola 68"}
+_CELL_BRANDS = {"cell broadband", "cell be", "cell b.e", "ps3", "spursengine"}
+_IA64_MACHINES = ("ia64",)
+_IA64_BRANDS = {"itanium", "ia-64", "ia64", "montecito", "poulson", "tukwila"}
+_S390_MACHINES = ("s390", "s390x")
+_S390_BRANDS = {"s/390", "z/architecture", "z900", "z990", "z9", "z10", "z13", "z14", "z15"}
+_RARE_FAMILIES = {
+    "vax": "VAX", "transputer": "Transputer", "i860": "i860", "i960": "i960",
+    "clipper": "Clipper", "ns32k": "NS32K", "88k": "M88K", "mc88100": "M88K",
+    "am29k": "Am29K", "romp": "ROMP",
+}
+
+
 def _detect_exotic_arch(device: dict) -> Optional[dict]:
     """Detect exotic/vintage architectures from machine field and CPU brand.
     Returns {"device_family": ..., "device_arch": ...} or None if not exotic.
@@ -1629,72 +1505,51 @@ def _detect_exotic_arch(device: dict) -> Optional[dict]:
     machine = str(device.get("machine") or "").lower()
     cpu_brand = _cpu_brand_string(device)
     family, arch = _claimed_family_and_arch(device)
-    family_lower = family.lower()
-    arch_lower = arch.lower()
+    family_lower = _lower(family)
+    arch_lower = _lower(arch)
 
     # SPARC detection
-    sparc_machines = ("sparc", "sparc64", "sun4u", "sun4v")
-    sparc_brands = {"sparc", "ultrasparc", "sun4", "fujitsu sparc"}
-    if machine in sparc_machines or _has_any_token(cpu_brand, sparc_brands) or family_lower == "sparc":
+    if machine in _SPARC_MACHINES or _has_any_token(cpu_brand, _SPARC_BRANDS) or family_lower == "sparc":
         detected_arch = arch if arch_lower.startswith("sparc") or arch_lower.startswith("ultra") else "sparc"
         return {"device_family": "SPARC", "device_arch": detected_arch}
 
     # MIPS detection (includes PS1 R3000A, PS2 Emotion Engine, PSP Allegrex, N64, SGI)
-    mips_machines = ("mips", "mips64", "mipsel", "mips64el")
-    mips_brands = {"mips", "r2000", "r3000", "r4000", "r4400", "r5000", "r8000", "r10000",
-                   "r12000", "r14000", "r16000", "vr4300", "loongson", "ingenic",
-                   "emotion engine", "allegrex", "r5900"}
-    if machine in mips_machines or _has_any_token(cpu_brand, mips_brands) or family_lower == "mips":
+    if machine in _MIPS_MACHINES or _has_any_token(cpu_brand, _MIPS_BRANDS) or family_lower == "mips":
         detected_arch = arch if arch_lower.startswith(("mips", "r", "ps", "emotion", "allegrex")) else "mips"
         return {"device_family": "MIPS", "device_arch": detected_arch}
 
     # RISC-V detection
-    riscv_machines = ("riscv64", "riscv32", "riscv")
-    riscv_brands = {"riscv", "risc-v", "sifive", "thead", "starfive", "kendryte", "allwinner d1", "xuantie"}
-    if machine in riscv_machines or _has_any_token(cpu_brand, riscv_brands) or family_lower in ("risc-v", "riscv"):
+    if machine in _RISCV_MACHINES or _has_any_token(cpu_brand, _RISCV_BRANDS) or family_lower in ("risc-v", "riscv"):
         detected_arch = arch if arch_lower.startswith("riscv") else "riscv"
         return {"device_family": "RISC-V", "device_arch": detected_arch}
 
     # Hitachi/Renesas SuperH detection (SH-1 through SH-4, Dreamcast, Saturn)
-    sh_brands = {"sh-1", "sh-2", "sh-4", "sh4", "sh2", "sh1", "sh4a", "superh", "renesas sh"}
-    if _has_any_token(cpu_brand, sh_brands) or arch_lower.startswith("sh") and arch_lower in ("sh1", "sh2", "sh4", "sh4a"):
+    if _has_any_token(cpu_brand, _SH_BRANDS) or arch_lower.startswith("sh") and arch_lower in ("sh1", "sh2", "sh4", "sh4a"):
         detected_arch = arch_lower if arch_lower in ("sh1", "sh2", "sh4", "sh4a") else "sh4"
         return {"device_family": "SuperH", "device_arch": detected_arch}
 
     # Motorola 68K detection (Amiga, Atari ST, classic Mac, Sun-3)
-    m68k_machines = ("m68k",)
-    m68k_brands = {"68000", "68010", "68020", "68030", "68040", "68060", "mc68", "m68k", "motorola 68"}
-    if machine in m68k_machines or _has_any_token(cpu_brand, m68k_brands) or family_lower in ("m68k", "68k", "motorola"):
+    if machine in _M68K_MACHINES or _has_any_token(cpu_brand, _M68K_BRANDS) or family_lower in ("m68k", "68k", "motorola"):
         detected_arch = arch if arch_lower.startswith("68") or arch_lower.startswith("mc68") else "68000"
         return {"device_family": "M68K", "device_arch": detected_arch}
 
     # Cell Broadband Engine (PS3) — PowerPC PPE + 7 SPE
-    cell_brands = {"cell broadband", "cell be", "cell b.e", "ps3", "spursengine"}
-    if _has_any_token(cpu_brand, cell_brands) or arch_lower in ("cell_be", "ps3_cell", "cell"):
+    if _has_any_token(cpu_brand, _CELL_BRANDS) or arch_lower in ("cell_be", "ps3_cell", "cell"):
         return {"device_family": "Cell", "device_arch": arch_lower if arch_lower.startswith("cell") or arch_lower.startswith("ps3") else "cell_be"}
 
     # Itanium / IA-64
-    ia64_machines = ("ia64",)
-    ia64_brands = {"itanium", "ia-64", "ia64", "montecito", "poulson", "tukwila"}
-    if machine in ia64_machines or _has_any_token(cpu_brand, ia64_brands) or family_lower in ("ia64", "itanium"):
+    if machine in _IA64_MACHINES or _has_any_token(cpu_brand, _IA64_BRANDS) or family_lower in ("ia64", "itanium"):
         return {"device_family": "IA-64", "device_arch": arch_lower if "itanium" in arch_lower or "ia64" in arch_lower else "itanium"}
 
     # IBM S/390 / z/Architecture (mainframes)
-    s390_machines = ("s390", "s390x")
-    s390_brands = {"s/390", "z/architecture", "z900", "z990", "z9", "z10", "z13", "z14", "z15"}
-    if machine in s390_machines or _has_any_token(cpu_brand, s390_brands) or family_lower in ("s390", "s390x", "zarchitecture"):
+    if machine in _S390_MACHINES or _has_any_token(cpu_brand, _S390_BRANDS) or family_lower in ("s390", "s390x", "zarchitecture"):
         return {"device_family": "S390", "device_arch": arch_lower if arch_lower.startswith(("s390", "z")) else "s390"}
 
     # Ultra-rare / dead architectures — trust claimed family if it matches
-    rare_families = {
-        "vax": "VAX", "transputer": "Transputer", "i860": "i860", "i960": "i960",
-        "clipper": "Clipper", "ns32k": "NS32K", "88k": "M88K", "mc88100": "M88K",
-        "am29k": "Am29K", "romp": "ROMP",
-    }
-    if family_lower in rare_families:
-        return {"device_family": rare_families[family_lower], "device_arch": arch}
-    if arch_lower in rare_families:
-        return {"device_family": rare_families[arch_lower], "device_arch": arch}
+    if family_lower in _RARE_FAMILIES:
+        return {"device_family": _RARE_FAMILIES[family_lower], "device_arch": arch}
+    if arch_lower in _RARE_FAMILIES:
+        return {"device_family": _RARE_FAMILIES[arch_lower], "device_arch": arch}
 
     return None
 
@@ -1806,115 +1661,166 @@ ENROLL_REQUIRE_MAC = os.getenv("ENROLL_REQUIRE_MAC", "1") == "1"
 MAC_MAX_UNIQUE_PER_DAY = int(os.getenv("MAC_MAX_UNIQUE_PER_DAY", "3"))
 PRIVACY_PEPPER = os.getenv("PRIVACY_PEPPER", "rustchain_poa_v2")
 
+_SALT_CACHE = {"salt": b"", "expires": 0.0}
+_SALT_LOCK = threading.Lock()
+
+def _invalidate_salt_cache():
+    """Force the next _epoch_salt_for_mac() call to re-read the epoch."""
+    with _SALT_LOCK:
+        _SALT_CACHE["expires"] = 0.0
+
 def _epoch_salt_for_mac() -> bytes:
-    """Get epoch-scoped salt for MAC hashing"""
+    """Get epoch-scoped salt for MAC hashing (cached, refreshed every 30s)"""
+    with _SALT_LOCK:
+        if time.monotonic() < _SALT_CACHE["expires"]:
+            return _SALT_CACHE["salt"]
     try:
-        with sqlite3.connect(DB_PATH) as conn:
+        with _connect() as conn:
             row = conn.execute("SELECT epoch FROM epoch_enroll ORDER BY epoch DESC LIMIT 1").fetchone()
             epoch = row[0] if row else 0
     except Exception:
         epoch = 0
-    return f"epoch:{epoch}|{PRIVACY_PEPPER}".encode()
+    salt = f"epoch:{epoch}|{PRIVACY_PEPPER}".encode()
+    with _SALT_LOCK:
+        _SALT_CACHE["salt"] = salt
+        _SALT_CACHE["expires"] = time.monotonic() + 30.0
+    return salt
+
+_MAC_DEL = bytes(i for i in range(256) if chr(i) not in "0123456789abcdefABCDEF")
 
 def _norm_mac(mac: str) -> str:
-    return ''.join(ch for ch in mac.lower() if ch in "0123456789abcdef")
+    return mac.encode("ascii", "ignore").translate(None, _MAC_DEL).lower().decode()
+
+_HMAC_PROTO = {"salt": None, "proto": None}
 
 def _mac_hash(mac: str) -> str:
     norm = _norm_mac(mac)
     if len(norm) < 12: return ""
     salt = _epoch_salt_for_mac()
-    digest = hmac.new(salt, norm.encode(), hashlib.sha256).hexdigest()
-    return digest[:12]
+    # hmac.new re-hashes the 64-byte key pads every call; keep a prepared
+    # HMAC per salt and copy() it so each MAC costs one compression block.
+    if _HMAC_PROTO["salt"] != salt:
+        _HMAC_PROTO["proto"] = hmac.new(salt, b"", hashlib.sha256)
+        _HMAC_PROTO["salt"] = salt
+    h = _HMAC_PROTO["proto"].copy()
+    h.update(norm.encode())
+    return h.hexdigest()[:12]
 
 def record_macs(miner: str, macs: list):
-    now = int(time.time())
-    with sqlite3.connect(DB_PATH) as conn:
-        for mac in (macs or []):
-            h = _mac_hash(str(mac))
-            if not h: continue
-            conn.execute("""
-                INSERT INTO miner_macs (miner, mac_hash, first_ts, last_ts, count)
-                VALUES (?, ?, ?, ?, 1)
-                ON CONFLICT(miner, mac_hash) DO UPDATE SET last_ts=excluded.last_ts, count=count+1
-            """, (miner, h, now, now))
+    now = now_s()
+    rows = [(miner, h, now, now) for mac in (macs or []) if (h := _mac_hash(str(mac)))]
+    if not rows:
+        return
+    with _connect() as conn:
+        conn.executemany("""
+            INSERT INTO miner_macs (miner, mac_hash, first_ts, last_ts, count)
+            VALUES (?, ?, ?, ?, 1)
+            ON CONFLICT(miner, mac_hash) DO UPDATE SET last_ts=excluded.last_ts, count=count+1
+        """, rows)
         conn.commit()
 
 
+_MFG_YEARS = {"g4": 2001, "g5": 2004, "g3": 1998, "power8": 2014, "power9": 2017,
+              "power10": 2021, "apple_silicon": 2020, "retro": 2010}
+_MFG_YEAR_RE = re.compile("|".join(re.escape(k) for k in sorted(_MFG_YEARS, key=len, reverse=True)))
+
+_INLINE_ARCH_BONUS = {"g3": 80, "g4": 70, "g5": 60, "power8": 50, "486": 150, "pentium": 100, "retro": 40, "apple_silicon": 5}
+_INLINE_ARCH_RE = re.compile("|".join(re.escape(k) for k in sorted(_INLINE_ARCH_BONUS, key=len, reverse=True)))
+
+@functools.lru_cache(maxsize=4096)
 def calculate_rust_score_inline(mfg_year, arch, attestations, machine_id):
-    """Calculate rust score for a machine."""
+    """Calculate rust score for a machine. Pure in its arguments, so results
+    are memoized — rescoring an unchanged machine is a dict hit."""
     score = 0
     if mfg_year:
         score += (2025 - mfg_year) * 10  # age bonus
     score += attestations * 0.001  # attestation bonus
     if machine_id <= 100:
         score += 50  # early adopter
-    arch_bonus = {"g3": 80, "g4": 70, "g5": 60, "power8": 50, "486": 150, "pentium": 100, "retro": 40, "apple_silicon": 5}
-    arch_lower = arch.lower()
-    for key, bonus in arch_bonus.items():
-        if key in arch_lower:
-            score += bonus
-            break
+    m = _INLINE_ARCH_RE.search(_lower(arch))
+    if m:
+        score += _INLINE_ARCH_BONUS[m.group(0)]
     return round(score, 2)
 
-def auto_induct_to_hall(miner: str, device: dict):
-    """Automatically induct machine into Hall of Rust after successful attestation."""
-    hw_serial = device.get("cpu_serial", device.get("hardware_id", "unknown"))
-    model = device.get("device_model", device.get("model", "Unknown"))
-    arch = device.get("device_arch", device.get("arch", "modern"))
-    family = device.get("device_family", device.get("family", "unknown"))
+def _normalize_device(d: dict) -> dict:
+    """Resolve the legacy device-key aliases to canonical keys, once.
+
+    Client payloads use either the device_* names or the bare legacy
+    ones; resolving here lets downstream code read a single key instead
+    of chaining .get fallbacks per field. Defaults mirror the historical
+    fallbacks exactly — they feed the persisted fingerprint hash.
+    """
+    return {
+        "cpu_serial": d.get("cpu_serial", d.get("hardware_id", "unknown")),
+        "device_model": d.get("device_model", d.get("model", "Unknown")),
+        "device_arch": d.get("device_arch", d.get("arch", "modern")),
+        "device_family": d.get("device_family", d.get("family", "unknown")),
+    }
+
+def auto_induct_to_hall(miner: str, device: dict, conn=None):
+    """Automatically induct machine into Hall of Rust after successful attestation.
+
+    When the caller passes its own connection the hall update joins the
+    caller's open transaction (the caller commits); otherwise this runs
+    and commits on the pooled connection.
+    """
+    dev = _normalize_device(device)
+    hw_serial = dev["cpu_serial"]
+    model = dev["device_model"]
+    arch = dev["device_arch"]
+    family = dev["device_family"]
     
     fp_data = f"{model}{arch}{hw_serial}"
-    fingerprint_hash = hashlib.sha256(fp_data.encode()).hexdigest()[:32]
+    # 128-bit identity hash; BLAKE2b-128 gives the truncated width directly
+    # and matches the Hall of Rust induction path.
+    fingerprint_hash = hashlib.blake2b(fp_data.encode(), digest_size=16).hexdigest()
     
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            c = conn.cursor()
-            c.execute("SELECT id, total_attestations FROM hall_of_rust WHERE fingerprint_hash = ?", 
-                      (fingerprint_hash,))
-            existing = c.fetchone()
-            
-            now = int(time.time())
+        caller_conn = conn
+        if conn is None:
+            conn = _connect()
+        c = conn.cursor()
+        now = now_s()
+
+        # Single arithmetic UPDATE for the common re-attestation case: bump
+        # the counter and, every 10th attestation, rescore in place through
+        # the registered rust_score_fn — no SELECT round-trips. rowcount==0
+        # means the machine is new and falls through to the INSERT branch.
+        # A process-local set/Bloom filter of known fingerprints was
+        # considered to short-circuit the lookup, but the bump UPDATE has
+        # to descend the fingerprint index to mutate the row anyway, so an
+        # in-memory membership test saves nothing here.
+        c.execute(SQL_HALL_BUMP, (now, fingerprint_hash))
+        if c.rowcount == 0:
+            # Estimate manufacture year: one compiled scan over the arch
+            # string replaces the substring elif ladder.
+            m = _MFG_YEAR_RE.search(_lower(arch))
+            mfg_year = _MFG_YEARS[m.group(0)] if m else 2022
             
-            if existing:
-                # Update attestation count and recalculate rust_score
-                new_attest = existing[1] + 1
-                c.execute("UPDATE hall_of_rust SET total_attestations = ?, last_attestation = ? WHERE fingerprint_hash = ?", (new_attest, now, fingerprint_hash))
-                # Recalculate rust score periodically (every 10 attestations)
-                if new_attest % 10 == 0:
-                    c.execute("SELECT manufacture_year, device_arch FROM hall_of_rust WHERE fingerprint_hash = ?", (fingerprint_hash,))
-                    row = c.fetchone()
-                    if row:
-                        new_score = calculate_rust_score_inline(row[0], row[1], new_attest, existing[0])
-                        c.execute("UPDATE hall_of_rust SET rust_score = ? WHERE fingerprint_hash = ?", (new_score, fingerprint_hash))
-            else:
-                # Estimate manufacture year
-                mfg_year = 2022
-                arch_lower = arch.lower()
-                if "g4" in arch_lower: mfg_year = 2001
-                elif "g5" in arch_lower: mfg_year = 2004
-                elif "g3" in arch_lower: mfg_year = 1998
-                elif "power8" in arch_lower: mfg_year = 2014
-                elif "power9" in arch_lower: mfg_year = 2017
-                elif "power10" in arch_lower: mfg_year = 2021
-                elif "apple_silicon" in arch_lower: mfg_year = 2020
-                elif "retro" in arch_lower: mfg_year = 2010
-                
-                c.execute("INSERT INTO hall_of_rust (fingerprint_hash, miner_id, device_family, device_arch, device_model, manufacture_year, first_attestation, last_attestation, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                    (fingerprint_hash, miner, family, arch, model, mfg_year, now, now, now))
-                
-                # Calculate initial rust_score
-                machine_id = c.lastrowid
+            # Fold the initial rust_score into the INSERT. The score depends
+            # on the row id only through the early-adopter bonus (id <= 100),
+            # so precompute the no-bonus score and touch the row a second
+            # time only for those first hundred machines.
+            rust_score = calculate_rust_score_inline(mfg_year, arch, 1, 101)
+            # UPSERT closes the race against a concurrent first attestation
+            # for the same fingerprint: the loser degrades to a counter bump
+            # instead of raising a UNIQUE violation.
+            c.execute(SQL_HALL_INDUCT,
+                (fingerprint_hash, miner, family, arch, model, mfg_year, now, now, now, rust_score))
+            machine_id = c.lastrowid
+            if machine_id <= 100:
                 rust_score = calculate_rust_score_inline(mfg_year, arch, 1, machine_id)
                 c.execute("UPDATE hall_of_rust SET rust_score = ? WHERE id = ?", (rust_score, machine_id))
-                print(f"[HALL] New induction: {miner} ({arch}) - Year: {mfg_year} - Score: {rust_score}")
+            hall_log.info(f"[HALL] New induction: {miner} ({arch}) - Year: {mfg_year} - Score: {rust_score}")
+        if caller_conn is None:
             conn.commit()
     except Exception as e:
-        print(f"[HALL] Auto-induct error: {e}")
+        hall_log.warning(f"[HALL] Auto-induct error: {e}")
 
 def _check_welcome_bonus(miner: str):
     """Award welcome bonus on first-ever attestation. Funded from founder_community."""
     try:
-        with sqlite3.connect(DB_PATH) as conn:
+        with _connect() as conn:
             # Check if this miner has ever attested before
             history_count = conn.execute(
                 "SELECT COUNT(*) FROM miner_attest_history WHERE miner = ?", (miner,)
@@ -1953,7 +1859,7 @@ def _check_welcome_bonus(miner: str):
 def _get_streak_bonus(miner: str) -> float:
     """Calculate streak bonus based on consecutive days of attestation."""
     try:
-        with sqlite3.connect(DB_PATH) as conn:
+        with _connect() as conn:
             # Get attestation timestamps from history, ordered newest first
             rows = conn.execute(
                 "SELECT ts_ok FROM miner_attest_history WHERE miner = ? ORDER BY ts_ok DESC LIMIT 1000",
@@ -2022,8 +1928,41 @@ def _projected_multiplier_growth(current_mult: float, device_arch: str) -> dict:
     }
 
 
+_ATTEST_MIGRATED = set()
+
+# Hot-path SQL hoisted to module constants: passing the same string object
+# keeps sqlite3's per-connection statement cache warm (no reparse/replan).
+SQL_ATTEST_UPSERT = """
+    INSERT INTO miner_attest_recent (miner, ts_ok, device_family, device_arch, entropy_score, fingerprint_passed, source_ip, signing_pubkey, fingerprint_checks_json)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(miner) DO UPDATE SET
+        ts_ok = excluded.ts_ok,
+        device_family = excluded.device_family,
+        device_arch = excluded.device_arch,
+        source_ip = excluded.source_ip,
+        fingerprint_passed = MAX(miner_attest_recent.fingerprint_passed, excluded.fingerprint_passed),
+        signing_pubkey = excluded.signing_pubkey,
+        fingerprint_checks_json = excluded.fingerprint_checks_json
+"""
+SQL_ATTEST_HISTORY = """
+    INSERT INTO miner_attest_history (miner, ts_ok, device_family, device_arch, entropy_score, fingerprint_passed, fingerprint_checks_json)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+SQL_HALL_BUMP = """UPDATE hall_of_rust SET
+       total_attestations = total_attestations + 1,
+       last_attestation = ?,
+       rust_score = CASE WHEN (total_attestations + 1) % 10 = 0
+           THEN rust_score_fn(manufacture_year, device_arch, total_attestations + 1, id)
+           ELSE rust_score END
+   WHERE fingerprint_hash = ?"""
+SQL_HALL_INDUCT = """INSERT INTO hall_of_rust (fingerprint_hash, miner_id, device_family, device_arch, device_model, manufacture_year, first_attestation, last_attestation, created_at, rust_score)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+   ON CONFLICT(fingerprint_hash) DO UPDATE SET
+       total_attestations = total_attestations + 1,
+       last_attestation = excluded.last_attestation"""
+
 def record_attestation_success(miner: str, device: dict, fingerprint_passed: bool = False, source_ip: str = None, signals: dict = None, fingerprint: dict = None, signing_pubkey: str = None):
-    now = int(time.time())
+    now = now_s()
     # Miner-name platform hints — helps detect Apple Silicon / POWER8 when client doesn't send rich device info
     _device = dict(device or {})
     _miner_lower = miner.lower() if miner else ""
@@ -2033,17 +1972,20 @@ def record_attestation_success(miner: str, device: dict, fingerprint_passed: boo
         if not _device.get("machine"):
             _device["machine"] = "ppc64le" if "power8" in _miner_lower else "ppc"
     verified_device = derive_verified_device(_device, fingerprint if isinstance(fingerprint, dict) else {}, fingerprint_passed)
-    with sqlite3.connect(DB_PATH) as conn:
-        # Ensure signing_pubkey and fingerprint_checks_json columns exist (idempotent migrations)
-        for col_stmt in [
-            "ALTER TABLE miner_attest_recent ADD COLUMN signing_pubkey TEXT",
-            "ALTER TABLE miner_attest_recent ADD COLUMN fingerprint_checks_json TEXT",
-            "ALTER TABLE miner_attest_history ADD COLUMN fingerprint_checks_json TEXT",
-        ]:
-            try:
-                conn.execute(col_stmt)
-            except Exception:
-                pass  # Column already exists or table doesn't exist yet
+    with _connect() as conn:
+        # Ensure signing_pubkey and fingerprint_checks_json columns exist
+        # (idempotent migrations, attempted once per database)
+        if DB_PATH not in _ATTEST_MIGRATED:
+            for col_stmt in [
+                "ALTER TABLE miner_attest_recent ADD COLUMN signing_pubkey TEXT",
+                "ALTER TABLE miner_attest_recent ADD COLUMN fingerprint_checks_json TEXT",
+                "ALTER TABLE miner_attest_history ADD COLUMN fingerprint_checks_json TEXT",
+            ]:
+                try:
+                    conn.execute(col_stmt)
+                except Exception:
+                    pass  # Column already exists or table doesn't exist yet
+            _ATTEST_MIGRATED.add(DB_PATH)
 
         # Extract per-check results from fingerprint dict for RIP-309 rotation.
         fp_checks_map = {}
@@ -2060,35 +2002,23 @@ def record_attestation_success(miner: str, device: dict, fingerprint_passed: boo
         # If the miner already has fingerprint_passed=1, a later failed attestation
         # should not downgrade it. We still update ts_ok to keep the attestation fresh.
         new_fp = 1 if fingerprint_passed else 0
-        conn.execute("""
-            INSERT INTO miner_attest_recent (miner, ts_ok, device_family, device_arch, entropy_score, fingerprint_passed, source_ip, signing_pubkey, fingerprint_checks_json)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(miner) DO UPDATE SET
-                ts_ok = excluded.ts_ok,
-                device_family = excluded.device_family,
-                device_arch = excluded.device_arch,
-                source_ip = excluded.source_ip,
-                fingerprint_passed = MAX(miner_attest_recent.fingerprint_passed, excluded.fingerprint_passed),
-                signing_pubkey = excluded.signing_pubkey,
-                fingerprint_checks_json = excluded.fingerprint_checks_json
-        """, (miner, now, verified_device["device_family"], verified_device["device_arch"], 0.0, new_fp, source_ip, signing_pubkey, fingerprint_checks_json))
+        conn.execute(SQL_ATTEST_UPSERT, (miner, now, verified_device["device_family"], verified_device["device_arch"], 0.0, new_fp, source_ip, signing_pubkey, fingerprint_checks_json))
         _ = append_fingerprint_snapshot(conn, miner, fingerprint if isinstance(fingerprint, dict) else {}, now)
         # C3 fix: Record attestation history for first_attest tracking
-        conn.execute("""
-            INSERT INTO miner_attest_history (miner, ts_ok, device_family, device_arch, entropy_score, fingerprint_passed, fingerprint_checks_json)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (miner, now, verified_device["device_family"], verified_device["device_arch"], 0.0, new_fp, fingerprint_checks_json))
-        conn.commit()
+        conn.execute(SQL_ATTEST_HISTORY, (miner, now, verified_device["device_family"], verified_device["device_arch"], 0.0, new_fp, fingerprint_checks_json))
 
-        # RIP-201: Record fleet immune system signals
-        if HAVE_FLEET_IMMUNE:
-            try:
-                record_fleet_signals(conn, miner, device, signals or {},
-                                     fingerprint, now, ip_address=source_ip)
-            except Exception as _fe:
-                print(f"[RIP-201] Fleet signal recording warning: {_fe}")
-    # Auto-induct to Hall of Rust
-    auto_induct_to_hall(miner, verified_device)
+        # RIP-201: Record fleet immune system signals (no-op binding when
+        # the module is absent, see _record_fleet at import)
+        try:
+            _record_fleet(conn, miner, device, signals or {},
+                          fingerprint, now, ip_address=source_ip)
+        except Exception as _fe:
+            hall_log.warning(f"[RIP-201] Fleet signal recording warning: {_fe}")
+
+        # Auto-induct to Hall of Rust inside the same transaction: one commit
+        # (one WAL fsync) covers the attest upsert, history row and hall update.
+        auto_induct_to_hall(miner, verified_device, conn)
+        conn.commit()
 
 
 TEMPORAL_HISTORY_LIMIT = 10
@@ -2273,6 +2203,42 @@ KNOWN_VM_SIGNATURES = {
     "bhyve", "openvz", "virtuozzo", "systemd-nspawn",
 }
 
+# Lookup tables for validate_fingerprint_data, frozen at import so the
+# hot validation path does membership tests without rebuilding the set
+# literals per request.
+_VINTAGE_RELAXED_ARCHS = frozenset({
+    "g4", "g5", "g3", "powerpc", "power macintosh",
+    "powerpc g4", "powerpc g5", "powerpc g3",
+    "power8", "power9", "68k", "m68k",
+})
+# RIP-304: Console miners via Pico bridge have their own fingerprint checks
+_CONSOLE_ARCHS = frozenset({
+    "nes_6502", "snes_65c816", "n64_mips", "gba_arm7",
+    "genesis_68000", "sms_z80", "saturn_sh2",
+    "gameboy_z80", "gameboy_color_z80", "ps1_mips",
+    "6502", "65c816", "z80", "sh2",
+})
+# Vintage hardware should show MORE clock drift, not less
+_VINTAGE_TIMING_ARCHS = frozenset({"g4", "g5", "g3", "powerpc", "power macintosh", "68k", "m68k"})
+_SOFT_CHECKS_BASE = frozenset({"cache_timing"})
+# Required-check tuples per arch class, precomputed; the class itself is
+# memoized so repeat archs skip even the frozenset probes.
+_REQUIRED_VINTAGE = ("anti_emulation",)
+_REQUIRED_DEFAULT = ("anti_emulation", "clock_drift")
+
+@functools.lru_cache(maxsize=512)
+def _arch_class(claimed_arch_lower: str) -> str:
+    if claimed_arch_lower in _CONSOLE_ARCHS:
+        return "console"
+    if claimed_arch_lower in _VINTAGE_RELAXED_ARCHS:
+        return "vintage"
+    return "modern"
+# Fields accepted as raw anti-emulation evidence (any one suffices)
+_ANTI_EMU_EVIDENCE = frozenset({"vm_indicators", "dmesg_scanned", "paths_checked", "cpuinfo_flags"})
+# FIX 2026-02-28: for vintage archs clock_drift is soft (may not be available)
+_SOFT_CHECKS_VINTAGE = _SOFT_CHECKS_BASE | {"clock_drift"}
+
+
 def validate_fingerprint_data(fingerprint: dict, claimed_device: dict = None) -> tuple:
     """
     Server-side validation of miner fingerprint check results.
@@ -2311,16 +2277,9 @@ def validate_fingerprint_data(fingerprint: dict, claimed_device: dict = None) ->
     if not isinstance(claimed_arch, str):
         claimed_arch = "modern"
     claimed_arch_lower = claimed_arch.lower()
-    vintage_relaxed_archs = {"g4", "g5", "g3", "powerpc", "power macintosh",
-                             "powerpc g4", "powerpc g5", "powerpc g3",
-                             "power8", "power9", "68k", "m68k"}
-    # RIP-304: Console miners via Pico bridge have their own fingerprint checks
-    console_archs = {"nes_6502", "snes_65c816", "n64_mips", "gba_arm7",
-                     "genesis_68000", "sms_z80", "saturn_sh2",
-                     "gameboy_z80", "gameboy_color_z80", "ps1_mips",
-                     "6502", "65c816", "z80", "sh2"}
-    is_vintage = claimed_arch_lower in vintage_relaxed_archs
-    is_console = claimed_arch_lower in console_archs
+    arch_class = _arch_class(claimed_arch_lower)
+    is_vintage = arch_class == "vintage"
+    is_console = arch_class == "console"
 
     # RIP-304: Console miners use Pico bridge fingerprinting (ctrl_port_timing
     # replaces clock_drift; anti_emulation still required via timing CV)
@@ -2335,15 +2294,15 @@ def validate_fingerprint_data(fingerprint: dict, claimed_device: dict = None) ->
         has_anti_emu = "anti_emulation" in checks
         if has_ctrl_timing or has_anti_emu:
             required_checks = [k for k in ["ctrl_port_timing", "anti_emulation"] if k in checks]
-            print(f"[FINGERPRINT] Console arch {claimed_arch_lower} (bridge={bridge_type}) - using Pico bridge checks")
+            node_log.info("[FINGERPRINT] Console arch %s (bridge=%s) - using Pico bridge checks", claimed_arch_lower, bridge_type)
         else:
             return False, "console_no_bridge_checks"
     elif is_vintage:
         # Vintage: only anti_emulation is strictly required
-        required_checks = ["anti_emulation"]
-        print(f"[FINGERPRINT] Vintage arch {claimed_arch_lower} - relaxed clock_drift requirement")
+        required_checks = _REQUIRED_VINTAGE
+        node_log.info("[FINGERPRINT] Vintage arch %s - relaxed clock_drift requirement", claimed_arch_lower)
     else:
-        required_checks = ["anti_emulation", "clock_drift"]
+        required_checks = _REQUIRED_DEFAULT
 
     for check_name in required_checks:
         if check_name not in checks:
@@ -2379,16 +2338,12 @@ def validate_fingerprint_data(fingerprint: dict, claimed_device: dict = None) ->
         anti_emu_data = anti_emu_check.get("data", {})
         if not isinstance(anti_emu_data, dict):
             anti_emu_data = {}
-        # Require evidence of actual checks being performed
-        has_evidence = (
-            "vm_indicators" in anti_emu_data or
-            "dmesg_scanned" in anti_emu_data or
-            "paths_checked" in anti_emu_data or
-            "cpuinfo_flags" in anti_emu_data or
+        # Require evidence of actual checks being performed: one set
+        # intersection against the frozen evidence-key table.
+        has_evidence = bool(anti_emu_data.keys() & _ANTI_EMU_EVIDENCE) or \
             isinstance(anti_emu_data.get("vm_indicators"), list)
-        )
         if not has_evidence and anti_emu_check.get("passed") == True:
-            print(f"[FINGERPRINT] REJECT: anti_emulation claims pass but has no raw evidence")
+            node_log.info("[FINGERPRINT] REJECT: anti_emulation claims pass but has no raw evidence")
             return False, "anti_emulation_no_evidence"
 
         if anti_emu_check.get("passed") == False:
@@ -2409,7 +2364,7 @@ def validate_fingerprint_data(fingerprint: dict, claimed_device: dict = None) ->
 
         # Require meaningful sample count
         if clock_check.get("passed") == True and samples == 0 and cv == 0:
-            print(f"[FINGERPRINT] REJECT: clock_drift claims pass but no samples/cv")
+            node_log.info("[FINGERPRINT] REJECT: clock_drift claims pass but no samples/cv")
             return False, "clock_drift_no_evidence"
 
         if cv < 0.0001 and cv != 0:
@@ -2419,25 +2374,18 @@ def validate_fingerprint_data(fingerprint: dict, claimed_device: dict = None) ->
             return False, f"clock_drift_failed:{clock_data.get('fail_reason', 'unknown')}"
 
         # Cross-validate: vintage hardware should have MORE drift
-        claimed_arch = (claimed_device.get("device_arch") or
-                       claimed_device.get("arch", "modern")).lower()
-        vintage_archs = {"g4", "g5", "g3", "powerpc", "power macintosh", "68k", "m68k"}
-        if claimed_arch in vintage_archs and 0 < cv < 0.005:
-            print(f"[FINGERPRINT] SUSPICIOUS: claims {claimed_arch} but cv={cv:.6f} is too stable for vintage")
+        if claimed_arch_lower in _VINTAGE_TIMING_ARCHS and 0 < cv < 0.005:
+            node_log.info("[FINGERPRINT] SUSPICIOUS: claims %s but cv=%.6f is too stable for vintage", claimed_arch_lower, cv)
             return False, f"vintage_timing_too_stable:cv={cv}"
     elif isinstance(clock_check, bool):
         if not clock_check:
             return False, "clock_drift_failed_bool"
 
     # ── PHASE 2: Cross-validate device claims against fingerprint ──
-    # FIX #1147: Defensive type checking for claimed_arch
-    claimed_arch = claimed_device.get("device_arch") or claimed_device.get("arch", "modern")
-    if not isinstance(claimed_arch, str):
-        claimed_arch = "modern"
-    claimed_arch = claimed_arch.lower()
+    # (claimed_arch_lower computed once at the top of the function)
 
     # If claiming PowerPC, check for x86-specific signals in fingerprint
-    if claimed_arch in POWERPC_ARCHES:
+    if claimed_arch_lower in POWERPC_ARCHES:
         # FIX #1147: Check for x86 SIMD features on PowerPC claims (defensive type checking)
         simd_check = checks.get("simd_identity")
         if isinstance(simd_check, dict):
@@ -2448,19 +2396,19 @@ def validate_fingerprint_data(fingerprint: dict, claimed_device: dict = None) ->
             if not isinstance(x86_features, list):
                 x86_features = []
             if x86_features:
-                print(f"[FINGERPRINT] REJECT: claims {claimed_arch} but has x86 SIMD: {x86_features}")
-                return False, f"arch_mismatch:claims_{claimed_arch}_has_x86_simd"
+                node_log.info("[FINGERPRINT] REJECT: claims %s but has x86 SIMD: %s", claimed_arch_lower, x86_features)
+                return False, f"arch_mismatch:claims_{claimed_arch_lower}_has_x86_simd"
         if not _powerpc_cpu_brand_matches(claimed_device):
-            print(f"[FINGERPRINT] REJECT: claims {claimed_arch} but CPU brand does not match PowerPC")
-            return False, f"cpu_brand_mismatch:claims_{claimed_arch}"
+            node_log.info("[FINGERPRINT] REJECT: claims %s but CPU brand does not match PowerPC", claimed_arch_lower)
+            return False, f"cpu_brand_mismatch:claims_{claimed_arch_lower}"
 
         if not _has_powerpc_simd_evidence(fingerprint):
-            print(f"[FINGERPRINT] REJECT: claims {claimed_arch} but lacks PowerPC SIMD evidence")
-            return False, f"missing_powerpc_simd:{claimed_arch}"
+            node_log.info("[FINGERPRINT] REJECT: claims %s but lacks PowerPC SIMD evidence", claimed_arch_lower)
+            return False, f"missing_powerpc_simd:{claimed_arch_lower}"
 
         if not _has_powerpc_cache_profile(fingerprint):
-            print(f"[FINGERPRINT] REJECT: claims {claimed_arch} but lacks PowerPC cache profile")
-            return False, f"missing_powerpc_cache_profile:{claimed_arch}"
+            node_log.info("[FINGERPRINT] REJECT: claims %s but lacks PowerPC cache profile", claimed_arch_lower)
+            return False, f"missing_powerpc_cache_profile:{claimed_arch_lower}"
 
     # ── PHASE 3: ROM fingerprint (retro platforms) ──
     rom_passed, rom_data = get_check_status(checks.get("rom_fingerprint"))
@@ -2473,10 +2421,7 @@ def validate_fingerprint_data(fingerprint: dict, claimed_device: dict = None) ->
 
     # ── PHASE 4: Overall check with hard/soft distinction ──
     if fingerprint.get("all_passed") == False:
-        SOFT_CHECKS = {"cache_timing"}
-        # FIX 2026-02-28: For vintage archs, clock_drift is soft (may not be available)
-        if is_vintage:
-            SOFT_CHECKS = SOFT_CHECKS | {"clock_drift"}
+        SOFT_CHECKS = _SOFT_CHECKS_VINTAGE if is_vintage else _SOFT_CHECKS_BASE
         failed_checks = []
         for k, v in checks.items():
             passed, _ = get_check_status(v)
@@ -2485,7 +2430,7 @@ def validate_fingerprint_data(fingerprint: dict, claimed_device: dict = None) ->
         hard_failures = [c for c in failed_checks if c not in SOFT_CHECKS]
         if hard_failures:
             return False, f"checks_failed:{hard_failures}"
-        print(f"[FINGERPRINT] Soft check failures only (OK): {failed_checks}")
+        node_log.info("[FINGERPRINT] Soft check failures only (OK): %s", failed_checks)
         return True, f"soft_checks_warn:{failed_checks}"
 
     return True, "valid"
@@ -2497,52 +2442,69 @@ def validate_fingerprint_data(fingerprint: dict, claimed_device: dict = None) ->
 ATTEST_IP_LIMIT = 15      # Max unique miners per IP per hour
 ATTEST_IP_WINDOW = 3600  # 1 hour window
 
+# Expired-row purge is bookkeeping, not correctness (the COUNT below
+# filters on the window cutoff), so it runs at most once a minute per
+# process instead of on every attestation.
+_IP_RL_NEXT_PURGE = [0.0]
+
 def check_ip_rate_limit(client_ip, miner_id):
     """Rate limit attestations per source IP using SQLite (shared across workers)."""
     now = int(time.time())
     cutoff = now - ATTEST_IP_WINDOW
-    
-    with sqlite3.connect(DB_PATH) as conn:
-        conn.execute("DELETE FROM ip_rate_limit WHERE ts < ?", (cutoff,))
+
+    with _connect() as conn:
+        if time.monotonic() >= _IP_RL_NEXT_PURGE[0]:
+            conn.execute("DELETE FROM ip_rate_limit WHERE ts < ?", (cutoff,))
+            _IP_RL_NEXT_PURGE[0] = time.monotonic() + 60.0
+        # UPSERT instead of INSERT OR REPLACE: refreshes ts in place
+        # rather than delete+reinsert against the (client_ip, miner_id) PK
         conn.execute(
-            "INSERT OR REPLACE INTO ip_rate_limit (client_ip, miner_id, ts) VALUES (?, ?, ?)",
+            "INSERT INTO ip_rate_limit (client_ip, miner_id, ts) VALUES (?, ?, ?) "
+            "ON CONFLICT(client_ip, miner_id) DO UPDATE SET ts = excluded.ts",
             (client_ip, miner_id, now)
         )
+        # The (client_ip, miner_id) PK guarantees one row per pair, so a
+        # plain COUNT over the PK prefix replaces the DISTINCT dedup scan.
         row = conn.execute(
-            "SELECT COUNT(DISTINCT miner_id) FROM ip_rate_limit WHERE client_ip = ? AND ts >= ?",
+            "SELECT COUNT(*) FROM ip_rate_limit WHERE client_ip = ? AND ts >= ?",
             (client_ip, cutoff)
         ).fetchone()
         unique_count = row[0] if row else 0
         
         if unique_count > ATTEST_IP_LIMIT:
-            print(f"[RATE_LIMIT] IP {client_ip} has {unique_count} unique miners (limit {ATTEST_IP_LIMIT})")
+            node_log.warning("[RATE_LIMIT] IP %s has %s unique miners (limit %s)", client_ip, unique_count, ATTEST_IP_LIMIT)
             return False, f"ip_rate_limit:{unique_count}_miners_from_same_ip"
     
     return True, "ok"
 
 
+# One compiled alternation over all VM signatures, longest-first so the
+# most specific signature wins at each position. A single C-level scan
+# replaces ~50 interpreter-level substring probes per string.
+_VM_SIG_RE = re.compile("|".join(
+    re.escape(s) for s in sorted(KNOWN_VM_SIGNATURES, key=len, reverse=True)))
+
+
 def check_vm_signatures_server_side(device: dict, signals: dict) -> tuple:
     """Server-side VM detection from device/signal data."""
     indicators = []
 
     raw_hostname = signals.get("hostname")
     hostname = (raw_hostname if isinstance(raw_hostname, str) else "").lower()
-    for sig in KNOWN_VM_SIGNATURES:
-        if sig in hostname:
-            indicators.append(f"hostname:{sig}")
+    for m in _VM_SIG_RE.finditer(hostname):
+        indicators.append(f"hostname:{m.group(0)}")
 
     raw_cpu = device.get("cpu")
     cpu = (raw_cpu if isinstance(raw_cpu, str) else "").lower()
-    for sig in KNOWN_VM_SIGNATURES:
-        if sig in cpu:
-            indicators.append(f"cpu:{sig}")
+    for m in _VM_SIG_RE.finditer(cpu):
+        indicators.append(f"cpu:{m.group(0)}")
 
     # Cross-validate machine vs claimed arch — catch arch spoofing
     machine = str(device.get("machine") or "").lower()
     claimed_arch = str(device.get("arch") or device.get("device_arch") or "").lower()
     if machine in ("aarch64", "arm64", "armv7l", "armv6l") and claimed_arch in ("modern", "x86_64", "x86", "core2", "nehalem", "sandybridge"):
         # ARM spoofing is handled by derive_verified_device() — log but don't zero rewards
-        print(f"[VM_CHECK] arch_spoof: machine={machine}, claimed={claimed_arch} (ARM rate applied via derive_verified_device)")
+        node_log.info("[VM_CHECK] arch_spoof: machine=%s, claimed=%s (ARM rate applied via derive_verified_device)", machine, claimed_arch)
 
     if indicators:
         return False, f"server_vm_check:{indicators}"
@@ -2551,7 +2513,7 @@ def check_vm_signatures_server_side(device: dict, signals: dict) -> tuple:
 
 def check_enrollment_requirements(miner: str) -> tuple:
     """Check if miner meets enrollment requirements including fingerprint validation."""
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         if ENROLL_REQUIRE_TICKET:
             # RIP-PoA: Also fetch fingerprint_passed status
             row = conn.execute("SELECT ts_ok, fingerprint_passed FROM miner_attest_recent WHERE miner = ?", (miner,)).fetchone()
@@ -2592,24 +2554,72 @@ def _mac_oui(mac: str) -> str:
     if len(norm) < 6: return ""
     return norm[:6]
 
+# oui_deny is nearly static (admin-edited), so lookups — including
+# misses, the common case — are cached for 5 minutes. The admin
+# add/remove endpoints invalidate explicitly so changes apply at once.
+_OUI_CACHE = {}
+_OUI_CACHE_LOCK = threading.Lock()
+_OUI_CACHE_TTL = 300.0
+_OUI_CACHE_MAX = 8192
+
+def _invalidate_oui_cache():
+    with _OUI_CACHE_LOCK:
+        _OUI_CACHE.clear()
+
 def _oui_vendor(oui: str) -> Optional[str]:
     """Check if OUI is denied (VM vendor)"""
-    with sqlite3.connect(DB_PATH) as conn:
+    now = time.monotonic()
+    with _OUI_CACHE_LOCK:
+        hit = _OUI_CACHE.get(oui)
+        if hit is not None and hit[1] > now:
+            return hit[0]
+    with _connect() as conn:
         row = conn.execute("SELECT vendor, enforce FROM oui_deny WHERE oui = ?", (oui,)).fetchone()
-        if row:
-            return row[0], row[1]
-    return None
+    result = (row[0], row[1]) if row else None
+    with _OUI_CACHE_LOCK:
+        if len(_OUI_CACHE) >= _OUI_CACHE_MAX:
+            _OUI_CACHE.clear()
+        _OUI_CACHE[oui] = (result, now + _OUI_CACHE_TTL)
+    return result
+
+def _oui_vendors(ouis):
+    """Resolve many OUIs at once: cache hits served locally, all misses
+    fetched in a single IN query instead of one round-trip per MAC."""
+    now = time.monotonic()
+    results = {}
+    misses = []
+    with _OUI_CACHE_LOCK:
+        for oui in ouis:
+            hit = _OUI_CACHE.get(oui)
+            if hit is not None and hit[1] > now:
+                results[oui] = hit[0]
+            elif oui not in results:
+                misses.append(oui)
+    if misses:
+        placeholders = ",".join("?" * len(misses))
+        with _connect() as conn:
+            rows = {r[0]: (r[1], r[2]) for r in conn.execute(
+                f"SELECT oui, vendor, enforce FROM oui_deny WHERE oui IN ({placeholders})", misses)}
+        with _OUI_CACHE_LOCK:
+            if len(_OUI_CACHE) + len(misses) >= _OUI_CACHE_MAX:
+                _OUI_CACHE.clear()
+            for oui in misses:
+                result = rows.get(oui)
+                results[oui] = result
+                _OUI_CACHE[oui] = (result, now + _OUI_CACHE_TTL)
+    return results
 
 def _check_oui_gate(macs: list) -> Tuple[bool, dict]:
     """Check MACs against VM-OUI denylist"""
-    for mac in (macs or []):
-        oui = _mac_oui(str(mac))
+    mac_ouis = [(mac, _mac_oui(str(mac))) for mac in (macs or [])]
+    vendor_map = _oui_vendors({oui for _, oui in mac_ouis if oui})
+    for mac, oui in mac_ouis:
         if not oui: continue
 
         # Track seen
         MET_MAC_OUI_SEEN[oui] = MET_MAC_OUI_SEEN.get(oui, 0) + 1
 
-        vendor_info = _oui_vendor(oui)
+        vendor_info = vendor_map[oui]
         if vendor_info:
             vendor, enforce = vendor_info
             MET_MAC_OUI_DENIED[oui] = MET_MAC_OUI_DENIED.get(oui, 0) + 1
@@ -2636,15 +2646,60 @@ try:
 except ImportError:
     SR25519_AVAILABLE = False
 
+# Verification-result cache: gossip rebroadcasts present the same
+# (pubkey, signature, message) triple repeatedly; a hit turns a full
+# schnorrkel scalar mult into a dict lookup. Keyed by a 128-bit BLAKE2b
+# over the concatenated triple, bounded LRU via OrderedDict.
+_SIG_CACHE = collections.OrderedDict()
+_SIG_CACHE_MAX = 16384
+_SIG_CACHE_LOCK = threading.Lock()
+
 def verify_sr25519_signature(message: bytes, signature: bytes, pubkey: bytes) -> bool:
     """Verify sr25519 signature - PRODUCTION ONLY (no mock fallback)"""
     if not SR25519_AVAILABLE:
         raise RuntimeError("SR25519 library not available - cannot verify signatures in production")
+    key = blake2b(bytes(pubkey) + bytes(signature) + bytes(message), digest_size=16).digest()
+    with _SIG_CACHE_LOCK:
+        cached = _SIG_CACHE.get(key)
+        if cached is not None:
+            _SIG_CACHE.move_to_end(key)
+            return cached
     try:
-        return sr25519_verify(signature, message, pubkey)
+        result = bool(sr25519_verify(signature, message, pubkey))
     except Exception as e:
         logging.warning(f"Signature verification failed: {e}")
         return False
+    with _SIG_CACHE_LOCK:
+        _SIG_CACHE[key] = result
+        if len(_SIG_CACHE) > _SIG_CACHE_MAX:
+            _SIG_CACHE.popitem(last=False)
+    return result
+
+# Native schnorrkel batch verify when the binding exposes it; verified
+# once at import so the helper below doesn't re-probe per call.
+try:
+    from py_sr25519 import batch_verify as _sr25519_batch_verify
+except ImportError:
+    _sr25519_batch_verify = None
+
+def verify_sr25519_batch(messages, signatures, pubkeys):
+    """Verify many sr25519 signatures, returning per-item results.
+
+    Uses schnorrkel's native batch verification when the binding
+    provides it (one multi-scalar multiplication for the whole batch);
+    if the batch as a whole fails, or no batch API is available, falls
+    back to per-item verify_sr25519_signature to identify offenders.
+    """
+    if not SR25519_AVAILABLE:
+        raise RuntimeError("SR25519 library not available - cannot verify signatures in production")
+    if _sr25519_batch_verify is not None:
+        try:
+            if _sr25519_batch_verify(signatures, messages, pubkeys):
+                return [True] * len(messages)
+        except Exception as e:
+            logging.warning(f"Batch signature verification failed: {e}")
+    return [verify_sr25519_signature(m, s, p)
+            for m, s, p in zip(messages, signatures, pubkeys)]
 
 def hex_to_bytes(h):
     """Convert hex string to bytes"""
@@ -2654,26 +2709,83 @@ def bytes_to_hex(b):
     """Convert bytes to hex string"""
     return binascii.hexlify(b).decode("ascii")
 
+@functools.lru_cache(maxsize=4096)
+def _verify_key(pubkey_hex):
+    """Cached ed25519 VerifyKey for a hex-encoded public key.
+
+    Construction allocates a libsodium key object; miners reuse the
+    same pubkey for every header, so memoize per hex string. Bad hex
+    or a bad key length raises and is not cached.
+    """
+    return VerifyKey(bytes.fromhex(pubkey_hex))
+
+def _freeze(obj):
+    """Recursively convert an object into a hashable digest-cache key.
+
+    Every node is tagged with its concrete type: Python equality
+    conflates True/1/1.0 and an untagged dict would freeze identically
+    to the list of its pairs, while json.dumps distinguishes all of
+    them. Without the tags two headers with different signing preimages
+    could share a cache slot, which is unacceptable on a signature
+    path.
+    """
+    if isinstance(obj, dict):
+        return ("d", tuple(sorted((_freeze(k), _freeze(v)) for k, v in obj.items())))
+    if isinstance(obj, (list, tuple)):
+        return ("l", tuple(_freeze(v) for v in obj))
+    return (type(obj).__name__, obj)
+
+# Digest cache keyed on the frozen header structure. Bounded by simple
+# reset: headers are small, 4096 entries is plenty for gossip dedup.
+_CANON_CACHE = {}
+_CANON_CACHE_MAX = 4096
+
 def canonical_header_bytes(header_obj):
     """Deterministic canonicalization of header for signing.
-    IMPORTANT: This must match client-side preimage rules."""
-    s = json.dumps(header_obj, sort_keys=True, separators=(",",":")).encode("utf-8")
-    # Sign/verify over BLAKE2b-256(header_json)
-    return blake2b(s, digest_size=32).digest()
+    IMPORTANT: This must match client-side preimage rules.
 
+    Sign/verify over BLAKE2b-256(header_json). Re-submitted headers
+    (gossip duplicates, retries) hit a digest cache keyed on the frozen
+    header structure and skip the JSON sort+encode+hash entirely.
+    """
+    try:
+        key = _freeze(header_obj)
+        cached = _CANON_CACHE.get(key)
+        if cached is not None:
+            return cached
+    except TypeError:
+        key = None  # unhashable leaf value — canonicalize uncached
+    s = json.dumps(header_obj, sort_keys=True, separators=(",",":")).encode("utf-8")
+    digest = blake2b(s, digest_size=32).digest()
+    if key is not None:
+        if len(_CANON_CACHE) >= _CANON_CACHE_MAX:
+            _CANON_CACHE.clear()
+        _CANON_CACHE[key] = digest
+    return digest
+
+@functools.lru_cache(maxsize=128)
 def slot_to_epoch(slot):
     """Convert slot number to epoch"""
     return int(slot) // max(EPOCH_SLOTS, 1)
 
+# Slot only changes once per second at most; memoize on the wall-clock
+# second so request bursts share one division.
+_SLOT_CACHE = [0, 0]  # [ts, slot]
+
 def current_slot():
     """Get current slot number"""
-    return (int(time.time()) - GENESIS_TIMESTAMP) // BLOCK_TIME
+    t = int(time.time())
+    if t == _SLOT_CACHE[0]:
+        return _SLOT_CACHE[1]
+    s = (t - GENESIS_TIMESTAMP) // BLOCK_TIME
+    _SLOT_CACHE[0], _SLOT_CACHE[1] = t, s
+    return s
 
 def finalize_epoch(epoch, per_block_rtc, prev_block_hash: bytes = b""):
     """Finalize epoch and distribute rewards with security hardening"""
     from decimal import Decimal, ROUND_DOWN
 
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         c = conn.cursor()
 
         # REPLAY PROTECTION: Check if epoch already settled
@@ -2681,7 +2793,7 @@ def finalize_epoch(epoch, per_block_rtc, prev_block_hash: bytes = b""):
             "SELECT settled FROM epoch_state WHERE epoch = ?", (epoch,)
         ).fetchone()
         if settled and settled[0] == 1:
-            print(f"[SECURITY] Epoch {epoch} already settled, skipping to prevent double-reward")
+            node_log.warning("[SECURITY] Epoch %s already settled, skipping to prevent double-reward", epoch)
             return
 
         # Get all enrolled miners
@@ -2698,11 +2810,17 @@ def finalize_epoch(epoch, per_block_rtc, prev_block_hash: bytes = b""):
 
         # DIVISION BY ZERO PROTECTION
         if total_weight == 0:
-            print(f"[SECURITY] Total weight is 0 for epoch {epoch}, skipping reward distribution")
+            node_log.warning("[SECURITY] Total weight is 0 for epoch %s, skipping reward distribution", epoch)
             return
 
-        # PRECISION: Use Decimal for exact financial calculations
-        total_reward = Decimal(str(per_block_rtc)) * Decimal(EPOCH_SLOTS)
+        # PRECISION: integer micro-RTC for the whole distribution. The
+        # per-block rate has at most 6 decimal places, so converting the
+        # epoch pot to an int via Decimal once is lossless. Enrollment
+        # weights are REAL, so the per-miner split below divides via
+        # Decimal and truncates to int: only integers are ever bound
+        # into amount_i64, and truncation under-pays each miner by at
+        # most 1 uRTC, never over-pays.
+        total_reward_micro = int(Decimal(str(per_block_rtc)) * Decimal(EPOCH_SLOTS) * Decimal(1000000))
 
         # WEIGHT VALIDATION: Cap maximum weight to prevent drain attacks
         MAX_WEIGHT = 10000
@@ -2710,14 +2828,14 @@ def finalize_epoch(epoch, per_block_rtc, prev_block_hash: bytes = b""):
         valid_miners = [(pk, w) for pk, w in miners if w > 0]
         zero_weight_miners = [pk for pk, w in miners if w == 0]
         if zero_weight_miners:
-            print(f"[SECURITY] Excluding {len(zero_weight_miners)} miners with 0 weight (VM/emulator)")
+            node_log.info("[SECURITY] Excluding %s miners with 0 weight (VM/emulator)", len(zero_weight_miners))
         
         # Recalculate total weight with valid miners only
         miners = valid_miners
         total_weight = sum(w for _, w in miners)
         
         if total_weight == 0:
-            print(f"[SECURITY] No valid miners for epoch {epoch} after filtering")
+            node_log.warning("[SECURITY] No valid miners for epoch %s after filtering", epoch)
             return
         
         # RIP-309: Determine active fingerprint checks for this epoch
@@ -2729,13 +2847,13 @@ def finalize_epoch(epoch, per_block_rtc, prev_block_hash: bytes = b""):
             active_checks = set(__import__('random').Random(seed).sample(fp_checks, 4))
         else:
             active_checks = set(fp_checks)
-        print(f"[RIP-309] finalize_epoch {epoch} active checks: {sorted(active_checks)}")
+        node_log.info("[RIP-309] finalize_epoch %s active checks: %s", epoch, sorted(active_checks))
 
         # Adjust weights based on active fingerprint checks
         adjusted_miners = []
         for pk, weight in miners:
             if weight > MAX_WEIGHT:
-                print(f"[SECURITY] Capping weight {weight} for miner {pk} to {MAX_WEIGHT}")
+                node_log.warning("[SECURITY] Capping weight %s for miner %s to %s", weight, pk, MAX_WEIGHT)
                 weight = MAX_WEIGHT
 
             # RIP-309: zero out weight if any active check failed
@@ -2753,7 +2871,7 @@ def finalize_epoch(epoch, per_block_rtc, prev_block_hash: bytes = b""):
                             pass
                     active_passed = all(checks_map.get(chk, True) for chk in active_checks)
                     if not active_passed:
-                        print(f"[RIP-309] {pk[:20]}... failed active check(s) in finalize_epoch -> weight=0")
+                        node_log.info("[RIP-309] %s... failed active check(s) in finalize_epoch -> weight=0", pk[:20])
                         weight = 0
                 except Exception:
                     pass
@@ -2764,30 +2882,32 @@ def finalize_epoch(epoch, per_block_rtc, prev_block_hash: bytes = b""):
         zero_weight_miners += [pk for pk, w in adjusted_miners if w == 0]
         total_weight = sum(w for _, w in miners)
         if total_weight == 0:
-            print(f"[SECURITY] No valid miners for epoch {epoch} after RIP-309 filtering")
+            node_log.warning("[SECURITY] No valid miners for epoch %s after RIP-309 filtering", epoch)
             return
 
-        # ATOMIC TRANSACTION: Wrap all updates in explicit transaction
-        try:
-            c.execute("BEGIN TRANSACTION")
+        # Compute all reward shares BEFORE opening the transaction so the
+        # write lock is held only for the I/O, not the per-miner math.
+        reward_rows = []
+        total_weight_dec = Decimal(str(total_weight))
+        for pk, weight in miners:
+            amount_i64 = int(Decimal(total_reward_micro) * Decimal(str(weight)) / total_weight_dec)
 
-            # Distribute rewards with precision
-            for pk, weight in miners:
-                # Use Decimal arithmetic to avoid float precision loss
-                amount_decimal = total_reward * Decimal(weight) / Decimal(total_weight)
-                amount_i64 = int(amount_decimal * Decimal(1000000))
+            # OVERFLOW PROTECTION: Ensure amount_i64 fits in signed 64-bit int
+            if amount_i64 >= 2**63:
+                raise ValueError(f"Reward overflow for miner {pk}: {amount_i64}")
 
-                # OVERFLOW PROTECTION: Ensure amount_i64 fits in signed 64-bit int
-                if amount_i64 >= 2**63:
-                    raise ValueError(f"Reward overflow for miner {pk}: {amount_i64}")
+            reward_rows.append((amount_i64, amount_i64, pk))
+            balance_hist.observe(amount_i64 / 1000000.0)
 
-                c.execute(
-                    "UPDATE balances SET amount_i64 = amount_i64 + ?, balance_rtc = (amount_i64 + ?) / 1000000.0 WHERE miner_id = ?",
-                    (amount_i64, amount_i64, pk)
-                )
+        # ATOMIC TRANSACTION: Wrap all updates in explicit transaction
+        try:
+            c.execute("BEGIN TRANSACTION")
 
-                # Update metrics with decimal value for accuracy
-                balance_gauge.labels(miner_pk=pk).set(float(amount_decimal))
+            # One executemany pushes the update loop into SQLite's C loop
+            c.executemany(
+                "UPDATE balances SET amount_i64 = amount_i64 + ?, balance_rtc = (amount_i64 + ?) / 1000000.0 WHERE miner_id = ?",
+                reward_rows
+            )
 
             # Mark epoch as settled - use UPDATE with WHERE settled=0 to prevent race
             result = c.execute(
@@ -2797,12 +2917,12 @@ def finalize_epoch(epoch, per_block_rtc, prev_block_hash: bytes = b""):
 
             # Commit transaction atomically
             c.execute("COMMIT")
-            print(f"[EPOCH] Finalized epoch {epoch} with {len(miners)} miners, total_weight={total_weight}")
+            node_log.info("[EPOCH] Finalized epoch %s with %s miners, total_weight=%s", epoch, len(miners), total_weight)
 
         except Exception as e:
             # ROLLBACK on any error to maintain consistency
             c.execute("ROLLBACK")
-            print(f"[ERROR] Epoch {epoch} finalization failed, rolled back: {e}")
+            node_log.error("[ERROR] Epoch %s finalization failed, rolled back: %s", epoch, e)
             raise
 
 # ============= OPENAPI AND EXPLORER ENDPOINTS =============
@@ -2810,17 +2930,35 @@ def finalize_epoch(epoch, per_block_rtc, prev_block_hash: bytes = b""):
 @app.route('/openapi.json', methods=['GET'])
 def openapi_spec():
     """Return OpenAPI 3.0.3 specification"""
-    return jsonify(OPENAPI)
+    if request.headers.get('If-None-Match') == _OPENAPI_ETAG:
+        return Response(status=304, headers={'ETag': _OPENAPI_ETAG})
+    return Response(
+        _OPENAPI_BYTES,
+        mimetype='application/json',
+        headers={'ETag': _OPENAPI_ETAG, 'Cache-Control': 'public, max-age=300'},
+    )
+
+_EXPLORER_CACHE = {"bytes": None, "mtime": 0, "checked": 0.0}
 
 @app.route('/explorer', methods=['GET'])
 def explorer():
     """Real-time block explorer dashboard (Tier 1 + Tier 2 views).
-    Serves from tools/explorer/index.html if available, otherwise falls back to inline HTML."""
-    explorer_file = os.path.join(EXPLORER_DIR, "index.html")
-    if os.path.isfile(explorer_file):
-        return send_from_directory(EXPLORER_DIR, "index.html")
-    # Fallback: serve inline HTML if tools/explorer/ doesn't exist in deployment
-    return "Explorer HTML file not found. Deploy tools/explorer/index.html alongside the server.", 404
+    Serves tools/explorer/index.html from memory (same re-stat scheme as
+    /light: check mtime at most every 5s, reload only when it moves)."""
+    now = time.monotonic()
+    if _EXPLORER_CACHE["bytes"] is None or now >= _EXPLORER_CACHE["checked"] + 5.0:
+        explorer_file = os.path.join(EXPLORER_DIR, "index.html")
+        try:
+            mtime = os.stat(explorer_file).st_mtime_ns
+        except OSError:
+            return "Explorer HTML file not found. Deploy tools/explorer/index.html alongside the server.", 404
+        if mtime != _EXPLORER_CACHE["mtime"]:
+            with open(explorer_file, "rb") as f:
+                _EXPLORER_CACHE["bytes"] = f.read()
+            _EXPLORER_CACHE["mtime"] = mtime
+        _EXPLORER_CACHE["checked"] = now
+    return Response(_EXPLORER_CACHE["bytes"], mimetype="text/html",
+                    headers={"Cache-Control": "public, max-age=300"})
 
 # ============= MUSEUM STATIC UI (2D/3D) =============
 
@@ -2886,7 +3024,7 @@ def get_challenge():
     nonce = secrets.token_hex(32)
     expires = int(time.time()) + 300  # 5 minutes
 
-    with sqlite3.connect(DB_PATH) as c:
+    with _connect() as c:
         c.execute("INSERT INTO nonces (nonce, expires_at) VALUES (?, ?)", (nonce, expires))
 
     return jsonify({
@@ -2924,7 +3062,11 @@ def _compute_hardware_id(device: dict, signals: dict = None, source_ip: str = No
     mac_str = ','.join(sorted(macs)) if macs else ''
     
     hw_fields = [ip_component, model, arch, family, cores, mac_str, cpu_serial]
-    hw_id = hashlib.sha256('|'.join(str(f) for f in hw_fields).encode()).hexdigest()[:32]
+    # BLAKE2b-128: same 32-hex-char width as the old sha256[:32] without
+    # the truncation slice, and faster per byte on non-SHA-NI hardware.
+    # Node-local binding hash, not consensus material; existing bindings
+    # re-key once on upgrade and re-bind on the next attestation.
+    hw_id = hashlib.blake2b('|'.join(str(f) for f in hw_fields).encode(), digest_size=16).hexdigest()
     
     print(f"[HW_ID] {hw_id[:16]} = IP:{ip_component} arch:{arch} model:{model} cores:{cores} macs:{len(macs)}")
     
@@ -2934,7 +3076,7 @@ def _check_hardware_binding(miner_id: str, device: dict, signals: dict = None, s
     """Check if hardware is already bound to a different wallet. One machine = One wallet."""
     hardware_id = _compute_hardware_id(device, signals, source_ip=source_ip)
     
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         c = conn.cursor()
         
         # Check existing binding
@@ -3070,7 +3212,7 @@ def _submit_attestation_impl():
             "code": "MISSING_NONCE"
         }), 400
 
-    with sqlite3.connect(DB_PATH) as nonce_conn:
+    with _connect() as nonce_conn:
         nonce_ok, nonce_err, _ = attest_validate_and_store_nonce(
             nonce_conn,
             miner=miner,
@@ -3287,7 +3429,7 @@ def _submit_attestation_impl():
                 verified, bonus_tier, wart_reason = verify_warthog_proof(warthog_proof, miner)
                 warthog_bonus = bonus_tier if verified else 1.0
                 _wart_epoch = slot_to_epoch(current_slot())
-                with sqlite3.connect(DB_PATH) as wart_conn:
+                with _connect() as wart_conn:
                     record_warthog_proof(wart_conn, miner, _wart_epoch, warthog_proof, verified, warthog_bonus, wart_reason)
                 print(f"[WARTHOG] Miner: {miner[:20]}... verified={verified} bonus={warthog_bonus}x reason={wart_reason}")
             except Exception as _we:
@@ -3300,7 +3442,7 @@ def _submit_attestation_impl():
 
     temporal_review = {"score": 1.0, "review_flag": False, "reason": "insufficient_history", "flags": [], "check_scores": {}}
     try:
-        with sqlite3.connect(DB_PATH) as tconn:
+        with _connect() as tconn:
             temporal_review = validate_temporal_consistency(fetch_miner_fingerprint_sequence(tconn, miner))
     except Exception as _te:
         print(f"[TEMPORAL] Warning: {_te}")
@@ -3308,7 +3450,7 @@ def _submit_attestation_impl():
     # Update warthog_bonus in attestation record
     if warthog_bonus > 1.0:
         try:
-            with sqlite3.connect(DB_PATH) as wb_conn:
+            with _connect() as wb_conn:
                 wb_conn.execute(
                     "UPDATE miner_attest_recent SET warthog_bonus=? WHERE miner=?",
                     (warthog_bonus, miner)
@@ -3338,10 +3480,10 @@ def _submit_attestation_impl():
         verified_device = derive_verified_device(_device2, fingerprint if isinstance(fingerprint, dict) else {}, fingerprint_passed)
         family = verified_device["device_family"]
         arch_for_weight = verified_device["device_arch"]
-        hw_weight = HARDWARE_WEIGHTS.get(family, {}).get(arch_for_weight, HARDWARE_WEIGHTS.get(family, {}).get("default", 1.0))
+        hw_weight = _hw_weight(family, arch_for_weight)
         miner_id = data.get("miner_id", miner)
 
-        with sqlite3.connect(DB_PATH) as enroll_conn:
+        with _connect() as enroll_conn:
             rotation_eval = evaluate_rotating_fingerprint_checks(
                 enroll_conn,
                 epoch,
@@ -3368,6 +3510,8 @@ def _submit_attestation_impl():
                 (miner_id, miner)
             )
             enroll_conn.commit()
+            _invalidate_salt_cache()
+            _invalidate_enroll_cache()
 
         # Issue #19 temporal consistency only sets a review flag (no hard-fail).
         if temporal_review.get("review_flag"):
@@ -3403,7 +3547,7 @@ def _submit_attestation_impl():
     # Generate ticket ID
     ticket_id = f"ticket_{secrets.token_hex(16)}"
 
-    with sqlite3.connect(DB_PATH) as c:
+    with _connect() as c:
         c.execute(
             "INSERT INTO tickets (ticket_id, expires_at, commitment) VALUES (?, ?, ?)",
             (ticket_id, int(time.time()) + 3600, str(report.get('commitment', '')))
@@ -3429,7 +3573,7 @@ def get_epoch():
     epoch = slot_to_epoch(slot)
     epoch_gauge.set(epoch)
 
-    with sqlite3.connect(DB_PATH) as c:
+    with _connect() as c:
         enrolled = c.execute(
             "SELECT COUNT(*) FROM epoch_enroll WHERE epoch = ?",
             (epoch,)
@@ -3476,7 +3620,7 @@ def enroll_epoch():
             # Look up the signing pubkey stored during the miner's attestation
             stored_pubkey = None
             try:
-                with sqlite3.connect(DB_PATH) as lk_conn:
+                with _connect() as lk_conn:
                     row = lk_conn.execute(
                         "SELECT signing_pubkey FROM miner_attest_recent WHERE miner = ?",
                         (miner_pk,)
@@ -3555,13 +3699,13 @@ def enroll_epoch():
     # Calculate weight based on hardware
     family = device.get('family', 'x86')
     arch = device.get('arch', 'default')
-    hw_weight = HARDWARE_WEIGHTS.get(family, {}).get(arch, 1.0)
+    hw_weight = _HW_WEIGHT.get((family, arch), 1.0)
 
     # RIP-PoA Phase 2: VM miners get minimal (but non-zero) weight
     # VMs can technically earn RTC, but it's economically pointless (1e-9 vs 1.0-2.5 for real hardware)
     fingerprint_failed = check_result.get('fingerprint_failed', False)
 
-    with sqlite3.connect(DB_PATH) as c:
+    with _connect() as c:
         rotation_eval = evaluate_rotating_fingerprint_checks(
             c,
             epoch,
@@ -3598,6 +3742,9 @@ def enroll_epoch():
             (miner_id, miner_pk)
         )
 
+    _invalidate_salt_cache()
+    _invalidate_enroll_cache()
+
     app.logger.info(
         f"[RIP-309] epoch={epoch} miner={miner_pk[:20]}... nonce={rotation_eval['measurement_nonce'][:16]} "
         f"prev_hash={rotation_eval['previous_epoch_block_hash'][:16]} active={rotation_eval['active_checks']} "
@@ -3625,30 +3772,50 @@ def enroll_epoch():
 
 # ============= RIP-0173: LOTTERY/ELIGIBILITY ORACLE =============
 
-def vrf_is_selected(miner_pk: str, slot: int) -> bool:
-    """Deterministic VRF-based selection for a given miner and slot"""
-    epoch = slot_to_epoch(slot)
-
-    # Get miner weight from enrollment
-    with sqlite3.connect(DB_PATH) as c:
-        row = c.execute(
-            "SELECT weight FROM epoch_enroll WHERE epoch = ? AND miner_pk = ?",
-            (epoch, miner_pk)
-        ).fetchone()
-
-        if not row:
-            return False  # Not enrolled
-
-        weight = row[0]
-
-        # Get all enrolled miners for this epoch
-        all_miners = c.execute(
+# Enrollment snapshot for the VRF hot path: eligibility checks hit the
+# same epoch's rows thousands of times per slot, so the roster is held
+# in memory for a few seconds and dropped eagerly whenever an
+# enrollment write lands.
+_ENROLL_CACHE = {"epoch": -1, "miners": (), "expires": 0.0}
+_ENROLL_CACHE_LOCK = threading.Lock()
+
+def _invalidate_enroll_cache():
+    with _ENROLL_CACHE_LOCK:
+        _ENROLL_CACHE["expires"] = 0.0
+
+def _enrolled_miners(epoch: int):
+    """Return [(miner_pk, weight), ...] for the epoch, briefly cached."""
+    now = time.monotonic()
+    with _ENROLL_CACHE_LOCK:
+        if _ENROLL_CACHE["epoch"] == epoch and now < _ENROLL_CACHE["expires"]:
+            return _ENROLL_CACHE["miners"]
+    with _connect() as c:
+        miners = c.execute(
             "SELECT miner_pk, weight FROM epoch_enroll WHERE epoch = ?",
             (epoch,)
         ).fetchall()
-
-    if not all_miners:
-        return False
+    with _ENROLL_CACHE_LOCK:
+        _ENROLL_CACHE["epoch"] = epoch
+        _ENROLL_CACHE["miners"] = miners
+        _ENROLL_CACHE["expires"] = now + 5.0
+    return miners
+
+# The slot seed does not depend on the caller, so every eligibility
+# query for a slot resolves to the same winner. Compute it once per
+# (slot, roster snapshot) and answer callers with a string compare.
+_SLOT_WINNER_CACHE = {"slot": -1, "roster": None, "winner": None}
+
+def _slot_winner(slot: int):
+    """Winning miner_pk for a slot, or None when nobody is enrolled."""
+    epoch = slot_to_epoch(slot)
+    roster = _enrolled_miners(epoch)
+    if not roster:
+        return None
+    c = _SLOT_WINNER_CACHE
+    # Identity check on the roster ties the memo to the enrollment
+    # snapshot: a refreshed or invalidated roster forces a recompute.
+    if c["slot"] == slot and c["roster"] is roster:
+        return c["winner"]
 
     # Simple deterministic weighted selection using hash
     # In production, this would use proper VRF signatures
@@ -3659,18 +3826,23 @@ def vrf_is_selected(miner_pk: str, slot: int) -> bool:
     rand_val = int.from_bytes(hash_val[:8], 'big')
 
     # Calculate cumulative weights
-    total_weight = sum(w for _, w in all_miners)
+    total_weight = sum(w for _, w in roster)
     threshold = (rand_val % int(total_weight * 1000000)) / 1000000.0
 
     cumulative = 0.0
-    for pk, w in all_miners:
+    winner = None
+    for pk, w in roster:
         cumulative += w
-        if pk == miner_pk and cumulative >= threshold:
-            return True
         if cumulative >= threshold:
-            return False
+            winner = pk
+            break
 
-    return False
+    c["slot"], c["roster"], c["winner"] = slot, roster, winner
+    return winner
+
+def vrf_is_selected(miner_pk: str, slot: int) -> bool:
+    """Deterministic VRF-based selection for a given miner and slot"""
+    return _slot_winner(slot) == miner_pk
 
 @app.route('/lottery/eligibility', methods=['GET'])
 def lottery_eligibility():
@@ -3706,7 +3878,7 @@ def miner_set_header_key():
     pubkey_hex = str(body.get("pubkey_hex","")).strip().lower()
     if not miner_id or len(pubkey_hex) != 64:
         return jsonify({"ok":False,"error":"invalid miner_id or pubkey_hex"}), 400
-    with sqlite3.connect(DB_PATH) as db:
+    with _connect() as db:
         db.execute("INSERT INTO miner_header_keys(miner_id,pubkey_hex) VALUES(?,?) ON CONFLICT(miner_id) DO UPDATE SET pubkey_hex=excluded.pubkey_hex", (miner_id, pubkey_hex))
         db.commit()
     return jsonify({"ok":True,"miner_id":miner_id,"pubkey_hex":pubkey_hex})
@@ -3753,7 +3925,7 @@ def ingest_signed_header():
             return jsonify({"ok":False,"error":"bad inline pubkey"}), 400
         pubkey_hex = inline_pk
     else:
-        with sqlite3.connect(DB_PATH) as db:
+        with _connect() as db:
             row = db.execute("SELECT pubkey_hex FROM miner_header_keys WHERE miner_id=?", (miner_id,)).fetchone()
             if row: pubkey_hex = row[0]
     if not pubkey_hex:
@@ -3762,8 +3934,8 @@ def ingest_signed_header():
     # Resolve message bytes
     if msg_hex:
         try:
-            msg = hex_to_bytes(msg_hex)
-        except Exception:
+            msg = bytes.fromhex(msg_hex)
+        except ValueError:
             return jsonify({"ok":False,"error":"bad message hex"}), 400
     else:
         # build canonical message from header
@@ -3771,7 +3943,7 @@ def ingest_signed_header():
             msg = canonical_header_bytes(header)
         except Exception:
             return jsonify({"ok":False,"error":"bad header for canonicalization"}), 400
-        msg_hex = bytes_to_hex(msg)
+        msg_hex = msg.hex()
 
     # Mock acceptance (TESTNET ONLY)
     accepted = False
@@ -3783,9 +3955,8 @@ def ingest_signed_header():
             return jsonify({"ok":False,"error":"ed25519 unavailable on server (install pynacl)"}), 500
         # real ed25519 verify
         try:
-            sig = hex_to_bytes(sig_hex)
-            pk  = hex_to_bytes(pubkey_hex)
-            VerifyKey(pk).verify(msg, sig)
+            sig = bytes.fromhex(sig_hex)
+            _verify_key(pubkey_hex).verify(msg, sig)
             accepted = True
         except (BadSignatureError, Exception) as e:
             logging.warning(f"Signature verification failed: {e}")
@@ -3798,7 +3969,7 @@ def ingest_signed_header():
         slot = int(time.time())
 
     # Update tip + metrics
-    with sqlite3.connect(DB_PATH) as db:
+    with _connect() as db:
         db.execute("INSERT OR REPLACE INTO headers(slot, miner_id, message_hex, signature_hex, pubkey_hex, ts) VALUES(?,?,?,?,?,strftime('%s','now'))",
                    (slot, miner_id, msg_hex, sig_hex, pubkey_hex))
         db.commit()
@@ -3843,7 +4014,7 @@ def ingest_signed_header():
 @app.route('/headers/tip', methods=['GET'])
 def headers_tip():
     """Get current chain tip from headers table"""
-    with sqlite3.connect(DB_PATH) as db:
+    with _connect() as db:
         row = db.execute("SELECT slot, miner_id, signature_hex, ts FROM headers ORDER BY slot DESC LIMIT 1").fetchone()
     if not row:
         return jsonify({"slot": None, "miner": None, "tip_age": None}), 404
@@ -3854,7 +4025,7 @@ def headers_tip():
 def kv_get(key, default=None):
     """Get value from settings KV table"""
     try:
-        with sqlite3.connect(DB_PATH) as db:
+        with _connect() as db:
             db.execute("CREATE TABLE IF NOT EXISTS settings(key TEXT PRIMARY KEY, val TEXT NOT NULL)")
             row = db.execute("SELECT val FROM settings WHERE key=?", (key,)).fetchone()
             return row[0] if row else default
@@ -3863,7 +4034,7 @@ def kv_get(key, default=None):
 
 def kv_set(key, val):
     """Set value in settings KV table"""
-    with sqlite3.connect(DB_PATH) as db:
+    with _connect() as db:
         db.execute("CREATE TABLE IF NOT EXISTS settings(key TEXT PRIMARY KEY, val TEXT NOT NULL)")
         cur = db.execute("UPDATE settings SET val=? WHERE key=?", (str(val), key))
         if cur.rowcount == 0:
@@ -3913,7 +4084,7 @@ def _wallet_review_ui_authorized(req):
 
 def get_wallet_review_counts():
     """Return grouped wallet review counts for the operator summary surface."""
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         ensure_wallet_review_tables(conn)
         rows = conn.execute(
             """
@@ -3960,7 +4131,7 @@ def get_wallet_review_entry(conn, wallet: str):
 
 
 def wallet_review_gate_response(wallet: str):
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         entry = get_wallet_review_entry(conn, wallet)
     if not entry:
         return None
@@ -4000,7 +4171,7 @@ def admin_wallet_review_holds():
     if not is_admin(request):
         return jsonify({"ok": False, "error": "forbidden"}), 403
     status = (request.args.get("status") or "").strip().lower()
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         conn.row_factory = sqlite3.Row
         ensure_wallet_review_tables(conn)
         sql = """
@@ -4047,7 +4218,7 @@ def admin_create_wallet_review_hold():
     if status not in {"needs_review", "held", "escalated", "blocked"}:
         return jsonify({"ok": False, "error": "invalid status"}), 400
     now = int(time.time())
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         ensure_wallet_review_tables(conn)
         cur = conn.execute(
             """
@@ -4071,7 +4242,7 @@ def admin_resolve_wallet_review_hold(hold_id: int):
     reviewer_note = str(data.get("reviewer_note") or "").strip()
     coach_note = str(data.get("coach_note") or "").strip()
     now = int(time.time())
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         conn.row_factory = sqlite3.Row
         ensure_wallet_review_tables(conn)
         row = conn.execute(
@@ -4184,7 +4355,7 @@ def admin_wallet_review_holds_ui():
     if request.method == 'POST':
         now = int(time.time())
         form_action = str(request.form.get("form_action") or "").strip().lower()
-        with sqlite3.connect(DB_PATH) as conn:
+        with _connect() as conn:
             conn.row_factory = sqlite3.Row
             ensure_wallet_review_tables(conn)
             if form_action == "create":
@@ -4237,7 +4408,7 @@ def admin_wallet_review_holds_ui():
             query = "?" + "&".join(parts)
         return redirect(f"/admin/wallet-review-holds/ui{query}", code=303)
 
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         conn.row_factory = sqlite3.Row
         ensure_wallet_review_tables(conn)
         sql = """
@@ -4439,7 +4610,7 @@ def register_withdrawal_key():
     is_admin = admin_key == os.environ.get("RC_ADMIN_KEY", "")
 
     now = int(time.time())
-    with sqlite3.connect(DB_PATH) as c:
+    with _connect() as c:
         row = c.execute(
             "SELECT pubkey_sr25519 FROM miner_keys WHERE miner_pk = ?",
             (miner_pk,),
@@ -4485,7 +4656,7 @@ def request_withdrawal():
     if amount < MIN_WITHDRAWAL:
         return jsonify({"error": f"Minimum withdrawal is {MIN_WITHDRAWAL} RTC"}), 400
 
-    with sqlite3.connect(DB_PATH) as c:
+    with _connect() as c:
         # CRITICAL: Check nonce reuse FIRST (replay protection)
         nonce_row = c.execute(
             "SELECT used_at FROM withdrawal_nonces WHERE miner_pk = ? AND nonce = ?",
@@ -4499,14 +4670,15 @@ def request_withdrawal():
                 "used_at": nonce_row[0]
             }), 400
 
-        # Check balance
-        row = c.execute("SELECT balance_rtc FROM balances WHERE miner_pk = ?", (miner_pk,)).fetchone()
-        balance = row[0] if row else 0.0
+        # Check balance (integer uRTC; floats only in the response)
+        row = c.execute("SELECT balance_urtc FROM balances WHERE miner_pk = ?", (miner_pk,)).fetchone()
+        balance_urtc = row[0] if row else 0
         total_needed = amount + WITHDRAWAL_FEE
+        total_needed_urtc = int(round(total_needed * UNIT))
 
-        if balance < total_needed:
+        if balance_urtc < total_needed_urtc:
             withdrawal_failed.inc()
-            return jsonify({"error": "Insufficient balance", "balance": balance}), 400
+            return jsonify({"error": "Insufficient balance", "balance": _urtc_to_rtc(balance_urtc)}), 400
 
         # Check daily limit
         today = datetime.now().strftime("%Y-%m-%d")
@@ -4551,31 +4723,33 @@ def request_withdrawal():
 
         # Create withdrawal
         withdrawal_id = f"WD_{int(time.time() * 1000000)}_{secrets.token_hex(8)}"
+        # One wall-clock read for every row in this transaction: cheaper,
+        # and the nonce/fee/withdrawal records share an identical created_at.
+        now = now_s()
 
         # ATOMIC TRANSACTION: Record nonce FIRST to prevent replay
         c.execute("""
             INSERT INTO withdrawal_nonces (miner_pk, nonce, used_at)
             VALUES (?, ?, ?)
-        """, (miner_pk, nonce, int(time.time())))
+        """, (miner_pk, nonce, now))
 
-        # Deduct balance
-        c.execute("UPDATE balances SET balance_rtc = balance_rtc - ? WHERE miner_pk = ?",
-                  (total_needed, miner_pk))
+        # Deduct balance (int math; balance_rtc kept in sync for legacy readers)
+        c.execute("UPDATE balances SET balance_urtc = balance_urtc - ?, balance_rtc = (balance_urtc - ?) / 1000000.0 WHERE miner_pk = ?",
+                  (total_needed_urtc, total_needed_urtc, miner_pk))
 
         # RIP-301: Route fee to mining pool (founder_community) instead of burning
         fee_urtc = int(WITHDRAWAL_FEE * UNIT)
-        fee_rtc = WITHDRAWAL_FEE
         # Ensure founder_community row exists before crediting
         c.execute("INSERT OR IGNORE INTO balances (miner_pk, balance_rtc) VALUES (?, 0)",
                   ("founder_community",))
         c.execute(
-            "UPDATE balances SET balance_rtc = balance_rtc + ? WHERE miner_pk = ?",
-            (fee_rtc, "founder_community")
+            "UPDATE balances SET balance_urtc = balance_urtc + ?, balance_rtc = (balance_urtc + ?) / 1000000.0 WHERE miner_pk = ?",
+            (fee_urtc, fee_urtc, "founder_community")
         )
         c.execute(
             """INSERT INTO fee_events (source, source_id, miner_pk, fee_rtc, fee_urtc, destination, created_at)
             VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            ("withdrawal", withdrawal_id, miner_pk, WITHDRAWAL_FEE, fee_urtc, "founder_community", int(time.time()))
+            ("withdrawal", withdrawal_id, miner_pk, WITHDRAWAL_FEE, fee_urtc, "founder_community", now)
         )
 
         # Create withdrawal record
@@ -4584,7 +4758,7 @@ def request_withdrawal():
                 withdrawal_id, miner_pk, amount, fee, destination,
                 signature, status, created_at
             ) VALUES (?, ?, ?, ?, ?, ?, 'pending', ?)
-        """, (withdrawal_id, miner_pk, amount, WITHDRAWAL_FEE, destination, signature, int(time.time())))
+        """, (withdrawal_id, miner_pk, amount, WITHDRAWAL_FEE, destination, signature, now))
 
         # Update daily limit
         c.execute("""
@@ -4594,7 +4768,7 @@ def request_withdrawal():
             total_withdrawn = total_withdrawn + ?
         """, (miner_pk, today, amount, amount))
 
-        balance_gauge.labels(miner_pk=miner_pk).set(balance - total_needed)
+        balance_hist.observe(_urtc_to_rtc(balance_urtc - total_needed_urtc))
         withdrawal_queue_size.inc()
 
     return jsonify({
@@ -4609,7 +4783,7 @@ def request_withdrawal():
 @app.route("/api/fee_pool", methods=["GET"])
 def api_fee_pool():
     """RIP-301: Fee pool statistics and recent fee events."""
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         c = conn.cursor()
 
         # Total fees collected
@@ -4640,9 +4814,9 @@ def api_fee_pool():
 
         # Community fund balance (where fees go)
         fund_row = c.execute(
-            "SELECT COALESCE(balance_rtc, 0) FROM balances WHERE miner_pk = 'founder_community'"
+            "SELECT COALESCE(balance_urtc, 0) FROM balances WHERE miner_pk = 'founder_community'"
         ).fetchone()
-        fund_balance = fund_row[0] if fund_row else 0.0
+        fund_balance = _urtc_to_rtc(fund_row[0] if fund_row else 0)
 
     return jsonify({
         "rip": 301,
@@ -4660,7 +4834,7 @@ def api_fee_pool():
 @app.route('/withdraw/status/<withdrawal_id>', methods=['GET'])
 def withdrawal_status(withdrawal_id):
     """Get withdrawal status"""
-    with sqlite3.connect(DB_PATH) as c:
+    with _connect() as c:
         row = c.execute("""
             SELECT miner_pk, amount, fee, destination, status,
                    created_at, processed_at, tx_hash, error_msg
@@ -4692,7 +4866,7 @@ def withdrawal_history(miner_pk):
         return jsonify({"error": "Unauthorized - admin key required"}), 401
     limit = request.args.get('limit', 50, type=int)
 
-    with sqlite3.connect(DB_PATH) as c:
+    with _connect() as c:
         rows = c.execute("""
             SELECT withdrawal_id, amount, fee, destination, status,
                    created_at, processed_at, tx_hash
@@ -4716,8 +4890,8 @@ def withdrawal_history(miner_pk):
             })
 
         # Get balance
-        balance_row = c.execute("SELECT balance_rtc FROM balances WHERE miner_pk = ?", (miner_pk,)).fetchone()
-        balance = balance_row[0] if balance_row else 0.0
+        balance_row = c.execute("SELECT balance_urtc FROM balances WHERE miner_pk = ?", (miner_pk,)).fetchone()
+        balance = _urtc_to_rtc(balance_row[0] if balance_row else 0)
 
         return jsonify({
             "miner_pk": miner_pk,
@@ -4750,7 +4924,7 @@ def admin_required(f):
 
 def _db():
     """Get database connection with row factory"""
-    conn = sqlite3.connect(DB_PATH)
+    conn = _connect()
     conn.row_factory = sqlite3.Row
     return conn
 
@@ -4780,7 +4954,7 @@ def gov_rotate_stage():
     members = _canon_members(members)
     members_json = json.dumps(members, separators=(',',':'))
 
-    with sqlite3.connect(DB_PATH) as c:
+    with _connect() as c:
         # Store proposal for multisig approvals
         c.execute("""INSERT OR REPLACE INTO gov_rotation_proposals
                      (epoch_effective, threshold, members_json, created_ts)
@@ -4918,7 +5092,7 @@ def governance_propose():
     if not proposer_wallet or not title or not description:
         return jsonify({"ok": False, "error": "wallet, title and description are required"}), 400
 
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         conn.row_factory = sqlite3.Row
         c = conn.cursor()
         _ensure_governance_tables(c)
@@ -4967,7 +5141,7 @@ def governance_propose():
 
 @app.route('/governance/proposals', methods=['GET'])
 def governance_proposals():
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         conn.row_factory = sqlite3.Row
         c = conn.cursor()
         _ensure_governance_tables(c)
@@ -5003,7 +5177,7 @@ def governance_proposals():
 
 @app.route('/governance/proposal/<int:proposal_id>', methods=['GET'])
 def governance_proposal_detail(proposal_id: int):
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         conn.row_factory = sqlite3.Row
         c = conn.cursor()
         _ensure_governance_tables(c)
@@ -5092,7 +5266,7 @@ def governance_vote():
     if not verify_rtc_signature(public_key, vote_message, signature):
         return jsonify({"ok": False, "error": "invalid_signature"}), 401
 
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         conn.row_factory = sqlite3.Row
         c = conn.cursor()
         _ensure_governance_tables(c)
@@ -5212,7 +5386,7 @@ def genesis_export():
 @app.route('/balance/<miner_pk>', methods=['GET'])
 def get_balance(miner_pk):
     """Get miner balance with schema compatibility."""
-    with sqlite3.connect(DB_PATH) as c:
+    with _connect() as c:
         cur = c.cursor()
         cols = {r[1] for r in cur.execute("PRAGMA table_info(balances)").fetchall()}
 
@@ -5241,11 +5415,11 @@ def get_stats():
     """Get system statistics"""
     epoch = slot_to_epoch(current_slot())
 
-    with sqlite3.connect(DB_PATH) as c:
+    with _connect() as c:
         total_miners = c.execute("SELECT COUNT(*) FROM balances").fetchone()[0]
         # FIXED Nov 2025: Direct DB query instead of broken total_balances() function
         total_balance_urtc = c.execute("SELECT COALESCE(SUM(amount_i64), 0) FROM balances WHERE amount_i64 > 0").fetchone()[0]
-        total_balance = total_balance_urtc / UNIT
+        total_balance = _urtc_to_rtc(total_balance_urtc)
         pending_withdrawals = c.execute("SELECT COUNT(*) FROM withdrawals WHERE status = 'pending'").fetchone()[0]
 
     return jsonify({
@@ -5273,7 +5447,7 @@ BOUNTY_HALF_LIFE = 25000.0     # RTC paid out before bounties halve
 def bounty_multiplier():
     """Get current bounty decay multiplier based on total payouts."""
     import math
-    with sqlite3.connect(DB_PATH) as c:
+    with _connect() as c:
         # Total RTC paid out from community fund (negative deltas)
         row = c.execute(
             "SELECT COALESCE(SUM(ABS(delta_i64)), 0) FROM ledger "
@@ -5281,14 +5455,14 @@ def bounty_multiplier():
             ("founder_community",)
         ).fetchone()
         total_paid_urtc = row[0] if row else 0
-        total_paid_rtc = total_paid_urtc / 1000000.0
+        total_paid_rtc = _urtc_to_rtc(total_paid_urtc)
 
         # Current balance
         bal_row = c.execute(
-            "SELECT COALESCE(balance_rtc, 0) FROM balances WHERE miner_pk = ?",
+            "SELECT COALESCE(balance_urtc, 0) FROM balances WHERE miner_pk = ?",
             ("founder_community",)
         ).fetchone()
-        remaining_rtc = bal_row[0] if bal_row else 0.0
+        remaining_rtc = _urtc_to_rtc(bal_row[0] if bal_row else 0)
 
     # Half-life decay: multiplier = 0.5^(total_paid / half_life)
     multiplier = 0.5 ** (total_paid_rtc / BOUNTY_HALF_LIFE)
@@ -5357,7 +5531,7 @@ def api_nodes():
 
     nodes = []
     try:
-        with sqlite3.connect(DB_PATH) as conn:
+        with _connect() as conn:
             c = conn.cursor()
             c.execute("SELECT node_id, wallet_address, url, name, registered_at, is_active FROM node_registry")
             for row in c.fetchall():
@@ -5412,7 +5586,7 @@ def api_miners():
         limit = 100
         offset = 0
 
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         conn.row_factory = sqlite3.Row
         c = conn.cursor()
         
@@ -5492,7 +5666,7 @@ def api_miner_streak(miner_id: str):
     streak_bonus = _get_streak_bonus(miner_id)
     
     # Get current hardware multiplier
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         row = conn.execute(
             "SELECT device_family, device_arch FROM miner_attest_recent WHERE miner = ?",
             (miner_id,)
@@ -5502,7 +5676,7 @@ def api_miner_streak(miner_id: str):
         return jsonify({"error": "Miner not found"}), 404
     
     fam, arch = row[0] or "x86", row[1] or "modern"
-    hw_mult = HARDWARE_WEIGHTS.get(fam, {}).get(arch, HARDWARE_WEIGHTS.get(fam, {}).get("default", 1.0))
+    hw_mult = _hw_weight(fam, arch)
     
     projections = _projected_multiplier_growth(hw_mult, arch)
     
@@ -5527,7 +5701,7 @@ def api_badge(miner_id: str):
     multiplier = 1.0
 
     try:
-        with sqlite3.connect(DB_PATH) as conn:
+        with _connect() as conn:
             conn.row_factory = sqlite3.Row
             c = conn.cursor()
             row = c.execute(
@@ -5546,9 +5720,7 @@ def api_badge(miner_id: str):
 
                 fam = (row["device_family"] or "unknown")
                 arch = (row["device_arch"] or "unknown")
-                multiplier = HARDWARE_WEIGHTS.get(fam, {}).get(
-                    arch, HARDWARE_WEIGHTS.get(fam, {}).get("default", 1.0)
-                )
+                multiplier = _hw_weight(fam, arch)
     except Exception:
         pass
 
@@ -5570,7 +5742,7 @@ def api_badge(miner_id: str):
 def api_miner_dashboard(miner_id):
     """Aggregated miner dashboard data with reward history (last 20 epochs)."""
     try:
-        with sqlite3.connect(DB_PATH) as c:
+        with _connect() as c:
             c.row_factory = sqlite3.Row
             # current balance from balances table with column-name fallback
             bal_rtc = 0.0
@@ -5650,7 +5822,7 @@ def api_miner_attestations(miner_id: str):
     limit = int(request.args.get("limit", "120") or 120)
     limit = max(1, min(limit, 500))
 
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         conn.row_factory = sqlite3.Row
         c = conn.cursor()
 
@@ -5693,7 +5865,7 @@ def api_balances():
     limit = int(request.args.get("limit", "2000") or 2000)
     limit = max(1, min(limit, 5000))
 
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         conn.row_factory = sqlite3.Row
         c = conn.cursor()
 
@@ -5743,7 +5915,7 @@ def list_oui_deny():
     """List all denied OUIs"""
     if not is_admin(request):
         return jsonify({"ok": False, "error": "forbidden"}), 403
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         rows = conn.execute("SELECT oui, vendor, added_ts, enforce FROM oui_deny ORDER BY vendor").fetchall()
     return jsonify({
         "ok": True,
@@ -5767,12 +5939,13 @@ def add_oui_deny():
     if len(oui) != 6 or not all(c in '0123456789abcdef' for c in oui):
         return jsonify({"error": "Invalid OUI (must be 6 hex chars)"}), 400
 
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         conn.execute(
             "INSERT OR REPLACE INTO oui_deny (oui, vendor, added_ts, enforce) VALUES (?, ?, ?, ?)",
             (oui, vendor, int(time.time()), enforce)
         )
         conn.commit()
+    _invalidate_oui_cache()
 
     return jsonify({"ok": True, "oui": oui, "vendor": vendor, "enforce": enforce})
 
@@ -5787,9 +5960,10 @@ def remove_oui_deny():
     client_ip = get_client_ip()
     oui = data.get('oui', '').lower().replace(':', '').replace('-', '')
 
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         conn.execute("DELETE FROM oui_deny WHERE oui = ?", (oui,))
         conn.commit()
+    _invalidate_oui_cache()
 
     return jsonify({"ok": True, "removed": oui})
 
@@ -5805,7 +5979,7 @@ def _metrics_mac_text() -> str:
         lines.append(f'rustchain_mac_oui_denied{{oui="{oui}"}} {count}')
 
     # Database-derived metrics
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         # Unique MACs in last 24h
         day_ago = int(time.time()) - 86400
         row = conn.execute("SELECT COUNT(DISTINCT mac_hash) FROM miner_macs WHERE last_ts >= ?", (day_ago,)).fetchone()
@@ -5866,7 +6040,7 @@ def attest_debug():
         }
     }
 
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         # Check attestation
         attest_row = conn.execute(
             "SELECT ts_ok, device_family, device_arch, entropy_score FROM miner_attest_recent WHERE miner = ?",
@@ -5912,7 +6086,7 @@ def attest_debug():
 # ---------- Deep health checks ----------
 def _db_rw_ok():
     try:
-        with sqlite3.connect(DB_PATH, timeout=3) as c:
+        with _connect() as c:
             c.execute("PRAGMA quick_check")
         return True
     except Exception:
@@ -5944,7 +6118,7 @@ def _backup_age_hours():
 def _tip_age_slots():
     """Check tip freshness - query DB directly to avoid Response object"""
     try:
-        with sqlite3.connect(DB_PATH, timeout=3) as db:
+        with _connect() as db:
             row = db.execute("SELECT slot FROM headers ORDER BY slot DESC LIMIT 1").fetchone()
         return 0 if row else None
     except Exception:
@@ -6039,16 +6213,22 @@ def api_health():
 def api_ready():
     # "ready" means DB reachable and migrations applied (schema_version exists).
     try:
-        with sqlite3.connect(DB_PATH, timeout=3) as c:
+        with _connect() as c:
             c.execute("SELECT 1 FROM schema_version LIMIT 1")
         return jsonify({"ready": True, "version": APP_VERSION}), 200
     except Exception:
         return jsonify({"ready": False, "version": APP_VERSION}), 503
 
+_METRICS_CACHE = {"body": b"", "expires": 0.0}
+
 @app.route('/metrics', methods=['GET'])
 def metrics():
-    """Prometheus metrics endpoint"""
-    return generate_latest()
+    """Prometheus metrics endpoint (re-rendered at most every 5s)"""
+    now = time.monotonic()
+    if now >= _METRICS_CACHE["expires"]:
+        _METRICS_CACHE["body"] = generate_latest()
+        _METRICS_CACHE["expires"] = now + 5.0
+    return Response(_METRICS_CACHE["body"], mimetype=CONTENT_TYPE_LATEST)
 
 
 @app.route('/rewards/settle', methods=['POST'])
@@ -6070,14 +6250,14 @@ def api_rewards_settle():
         return jsonify({"ok": False, "error": "epoch_not_reached",
                         "requested": epoch, "current_epoch": current_epoch}), 400
 
-    with sqlite3.connect(DB_PATH) as db:
+    with _connect() as db:
         res = settle_epoch(db, epoch)
     return jsonify(res)
 
 @app.route('/rewards/epoch/<int:epoch>', methods=['GET'])
 def api_rewards_epoch(epoch: int):
     """Get reward distribution for a specific epoch"""
-    with sqlite3.connect(DB_PATH) as db:
+    with _connect() as db:
         rows = db.execute(
             "SELECT miner_id, share_i64 FROM epoch_rewards WHERE epoch=? ORDER BY miner_id",
             (epoch,)
@@ -6112,7 +6292,7 @@ def api_wallet_balance():
     if not miner_id:
         return jsonify({"ok": False, "error": "miner_id or address required"}), 400
 
-    with sqlite3.connect(DB_PATH) as db:
+    with _connect() as db:
         try:
             # Newer schema
             row = db.execute("SELECT amount_i64 FROM balances WHERE miner_id=?", (miner_id,)).fetchone()
@@ -6165,7 +6345,7 @@ def api_wallet_history():
 
     transactions = []
 
-    with sqlite3.connect(DB_PATH) as db:
+    with _connect() as db:
         # --- Ledger entries (transfers) ---
         try:
             ledger_rows = db.execute(
@@ -6356,7 +6536,7 @@ def wallet_transfer_v2():
     tx_data = f"{from_miner}:{to_miner}:{amount_i64}:{now}:{os.urandom(8).hex()}"
     tx_hash = hashlib.sha256(tx_data.encode()).hexdigest()[:32]
     
-    conn = sqlite3.connect(DB_PATH)
+    conn = _connect()
     try:
         c = conn.cursor()
         
@@ -6422,7 +6602,7 @@ def wallet_transfer_v2():
         })
     
     finally:
-        conn.close()
+        conn.rollback()
 
 
 @app.route('/pending/list', methods=['GET'])
@@ -6435,7 +6615,7 @@ def list_pending():
     status_filter = request.args.get('status', 'pending')
     limit = min(int(request.args.get('limit', 100)), 500)
     
-    with sqlite3.connect(DB_PATH) as db:
+    with _connect() as db:
         if status_filter == 'all':
             rows = db.execute("""
                 SELECT id, ts, from_miner, to_miner, amount_i64, reason, status, 
@@ -6484,7 +6664,7 @@ def void_pending():
     if not pending_id and not tx_hash:
         return jsonify({"error": "Provide pending_id or tx_hash"}), 400
     
-    conn = sqlite3.connect(DB_PATH)
+    conn = _connect()
     try:
         c = conn.cursor()
         
@@ -6539,7 +6719,7 @@ def void_pending():
         })
     
     finally:
-        conn.close()
+        conn.rollback()
 
 
 @app.route('/pending/confirm', methods=['POST'])
@@ -6554,7 +6734,7 @@ def confirm_pending():
     confirmed_ids = []
     errors = []
     
-    conn = sqlite3.connect(DB_PATH)
+    conn = _connect()
     try:
         c = conn.cursor()
         
@@ -6629,7 +6809,7 @@ def confirm_pending():
         })
     
     finally:
-        conn.close()
+        conn.rollback()
 
 
 @app.route('/pending/integrity', methods=['GET'])
@@ -6639,7 +6819,7 @@ def check_integrity():
     if admin_key != os.environ.get("RC_ADMIN_KEY", ""):
         return jsonify({"error": "Unauthorized"}), 401
 
-    with sqlite3.connect(DB_PATH) as db:
+    with _connect() as db:
         # Sum all ledger deltas per miner
         ledger_sums = dict(db.execute("""
             SELECT miner_id, SUM(delta_i64) FROM ledger GROUP BY miner_id
@@ -6710,7 +6890,7 @@ def wallet_transfer_OLD():
 
     amount_i64 = int(amount_rtc * 1000000)
 
-    conn = sqlite3.connect(DB_PATH)
+    conn = _connect()
     try:
         c = conn.cursor()
         row = c.execute("SELECT amount_i64 FROM balances WHERE miner_id = ?", (from_miner,)).fetchone()
@@ -6741,7 +6921,7 @@ def wallet_transfer_OLD():
             "recipient_balance_rtc": recipient_new / 1000000
         })
     finally:
-        conn.close()
+        conn.rollback()
 @app.route('/wallet/ledger', methods=['GET'])
 def api_wallet_ledger():
     """Get transaction ledger (optionally filtered by miner)"""
@@ -6752,7 +6932,7 @@ def api_wallet_ledger():
 
     miner_id = request.args.get("miner_id", "").strip()
 
-    with sqlite3.connect(DB_PATH) as db:
+    with _connect() as db:
         if miner_id:
             rows = db.execute(
                 "SELECT ts, epoch, delta_i64, reason FROM ledger WHERE miner_id=? ORDER BY id DESC LIMIT 200",
@@ -6796,7 +6976,7 @@ def api_wallet_balances_all():
     if admin_key != os.environ.get("RC_ADMIN_KEY", ""):
         return jsonify({"ok": False, "reason": "admin_required"}), 401
 
-    with sqlite3.connect(DB_PATH) as db:
+    with _connect() as db:
         rows = db.execute(
             "SELECT miner_id, amount_i64 FROM balances ORDER BY amount_i64 DESC"
         ).fetchall()
@@ -6952,9 +7132,8 @@ def downloads_page():
 def verify_rtc_signature(public_key_hex: str, message: bytes, signature_hex: str) -> bool:
     """Verify an Ed25519 signature for RTC transactions."""
     try:
-        verify_key = VerifyKey(bytes.fromhex(public_key_hex))
         signature = bytes.fromhex(signature_hex)
-        verify_key.verify(message, signature)
+        _verify_key(public_key_hex).verify(message, signature)
         return True
     except (BadSignatureError, ValueError, Exception):
         return False
@@ -7017,10 +7196,7 @@ def _get_active_miner_antiquity_multiplier(c: sqlite3.Cursor, wallet: str):
 
     family = row[1] or "unknown"
     arch = row[2] or "unknown"
-    multiplier = HARDWARE_WEIGHTS.get(family, {}).get(
-        arch,
-        HARDWARE_WEIGHTS.get(family, {}).get("default", 1.0),
-    )
+    multiplier = _hw_weight(family, arch)
     return True, float(multiplier), "ok"
 
 
@@ -7283,7 +7459,7 @@ def wallet_transfer_signed():
     # Deterministic tx hash derived from the signed message + signature.
     tx_hash = hashlib.sha256(message + bytes.fromhex(signature)).hexdigest()[:32]
 
-    conn = sqlite3.connect(DB_PATH)
+    conn = _connect()
     try:
         c = conn.cursor()
 
@@ -7352,7 +7528,7 @@ def wallet_transfer_signed():
             "message": f"Transfer pending. Will confirm in {CONFIRMATION_DELAY_SECONDS // 3600} hours unless voided."
         })
     finally:
-        conn.close()
+        conn.rollback()
 
 
 # ---------------------------------------------------------------------------
@@ -7385,7 +7561,7 @@ def beacon_submit():
     now = int(time.time())
     cutoff = now - BEACON_RATE_WINDOW
     try:
-        with sqlite3.connect(DB_PATH) as conn:
+        with _connect() as conn:
             count = conn.execute(
                 "SELECT COUNT(*) FROM beacon_envelopes WHERE agent_id = ? AND created_at >= ?",
                 (agent_id, cutoff)).fetchone()[0]
@@ -0,0 +1,210 @@
+"""Integer micro-RTC accounting: balance_urtc migration, withdraw path,
+and the finalize_epoch reward split."""
+
+import base64
+import sqlite3
+import sys
+import uuid
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+integrated_node = sys.modules["integrated_node"]
+
+
+def _tmp_db_path() -> Path:
+    local_tmp_dir = Path(__file__).parent / ".tmp_attestation"
+    local_tmp_dir.mkdir(exist_ok=True)
+    return local_tmp_dir / f"{uuid.uuid4().hex}.sqlite3"
+
+
+@pytest.fixture
+def legacy_db(monkeypatch):
+    """A pre-migration database: balances has only the REAL column."""
+    db_path = _tmp_db_path()
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE balances (miner_pk TEXT PRIMARY KEY, balance_rtc REAL DEFAULT 0)"
+    )
+    conn.executemany(
+        "INSERT INTO balances (miner_pk, balance_rtc) VALUES (?, ?)",
+        [
+            ("legacy-whole", 12.0),
+            ("legacy-fractional", 12.345678),
+            ("legacy-dust", 0.000001),
+            ("legacy-zero", 0.0),
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+    monkeypatch.setattr(integrated_node, "DB_PATH", str(db_path))
+    yield db_path
+
+    if db_path.exists():
+        try:
+            db_path.unlink()
+        except PermissionError:
+            pass
+
+
+def test_init_db_backfills_balance_urtc_from_legacy_rows(legacy_db):
+    integrated_node.init_db()
+
+    with sqlite3.connect(legacy_db) as conn:
+        rows = dict(
+            conn.execute("SELECT miner_pk, balance_urtc FROM balances").fetchall()
+        )
+        types = {
+            r[0]
+            for r in conn.execute("SELECT typeof(balance_urtc) FROM balances").fetchall()
+        }
+
+    assert rows == {
+        "legacy-whole": 12_000_000,
+        "legacy-fractional": 12_345_678,
+        "legacy-dust": 1,
+        "legacy-zero": 0,
+    }
+    assert types == {"integer"}
+
+    # Re-running the migration must not clobber the integer balances.
+    integrated_node.init_db()
+    with sqlite3.connect(legacy_db) as conn:
+        again = dict(
+            conn.execute("SELECT miner_pk, balance_urtc FROM balances").fetchall()
+        )
+    assert again == rows
+
+
+def test_withdrawal_keeps_integer_and_float_balances_in_sync(legacy_db, monkeypatch):
+    integrated_node.init_db()
+
+    with sqlite3.connect(legacy_db) as conn:
+        conn.execute(
+            "INSERT INTO balances (miner_pk, balance_rtc, balance_urtc) VALUES (?, ?, ?)",
+            ("wd-miner", 5.0, 5_000_000),
+        )
+        conn.execute(
+            "INSERT INTO miner_keys (miner_pk, pubkey_sr25519, registered_at) VALUES (?, ?, 1000)",
+            ("wd-miner", "ab" * 32),
+        )
+        conn.commit()
+
+    monkeypatch.setattr(
+        integrated_node, "verify_sr25519_signature", lambda *args, **kwargs: True
+    )
+
+    integrated_node.app.config["TESTING"] = True
+    with integrated_node.app.test_client() as test_client:
+        response = test_client.post(
+            "/withdraw/request",
+            json={
+                "miner_pk": "wd-miner",
+                "amount": 1.5,
+                "destination": "RTC" + "0" * 40,
+                "signature": base64.b64encode(b"\x00" * 64).decode(),
+                "nonce": "nonce-urtc-1",
+            },
+        )
+
+    assert response.status_code == 200, response.get_data(as_text=True)
+    assert response.get_json()["status"] == "pending"
+
+    fee_urtc = int(integrated_node.WITHDRAWAL_FEE * integrated_node.UNIT)
+    with sqlite3.connect(legacy_db) as conn:
+        urtc, rtc, urtc_type = conn.execute(
+            "SELECT balance_urtc, balance_rtc, typeof(balance_urtc) FROM balances WHERE miner_pk = 'wd-miner'"
+        ).fetchone()
+        pool_urtc, pool_rtc = conn.execute(
+            "SELECT balance_urtc, balance_rtc FROM balances WHERE miner_pk = 'founder_community'"
+        ).fetchone()
+
+    assert urtc == 5_000_000 - 1_500_000 - fee_urtc
+    assert urtc_type == "integer"
+    assert rtc == urtc / 1_000_000.0
+    assert pool_urtc == fee_urtc
+    assert pool_rtc == pool_urtc / 1_000_000.0
+
+
+@pytest.fixture
+def settlement_db(monkeypatch):
+    """Production-variant settlement schema used by finalize_epoch."""
+    db_path = _tmp_db_path()
+    conn = sqlite3.connect(db_path)
+    conn.executescript(
+        """
+        CREATE TABLE epoch_state (
+            epoch INTEGER PRIMARY KEY,
+            settled INTEGER DEFAULT 0,
+            settled_ts INTEGER
+        );
+        CREATE TABLE epoch_enroll (
+            epoch INTEGER NOT NULL,
+            miner_pk TEXT NOT NULL,
+            weight REAL NOT NULL,
+            PRIMARY KEY (epoch, miner_pk)
+        );
+        CREATE TABLE miner_attest_recent (
+            miner TEXT PRIMARY KEY,
+            fingerprint_checks_json TEXT
+        );
+        CREATE TABLE balances (
+            miner_id TEXT PRIMARY KEY,
+            amount_i64 INTEGER NOT NULL DEFAULT 0,
+            balance_rtc REAL DEFAULT 0
+        );
+        """
+    )
+    conn.commit()
+    conn.close()
+
+    monkeypatch.setattr(integrated_node, "DB_PATH", str(db_path))
+    yield db_path
+
+    if db_path.exists():
+        try:
+            db_path.unlink()
+        except PermissionError:
+            pass
+
+
+def test_finalize_epoch_reward_split_stays_integer(settlement_db):
+    per_block_rtc = 0.1
+    weights = [("split-alice", 3.0), ("split-bob", 1.0), ("split-vm", 0.000000001)]
+
+    with sqlite3.connect(settlement_db) as conn:
+        conn.executemany(
+            "INSERT INTO epoch_enroll (epoch, miner_pk, weight) VALUES (7, ?, ?)",
+            weights,
+        )
+        conn.executemany(
+            "INSERT INTO balances (miner_id) VALUES (?)",
+            [(pk,) for pk, _ in weights],
+        )
+        conn.commit()
+
+    integrated_node.finalize_epoch(7, per_block_rtc)
+
+    pot_urtc = int(
+        Decimal(str(per_block_rtc)) * integrated_node.EPOCH_SLOTS * 1_000_000
+    )
+    total = Decimal(str(sum(w for _, w in weights)))
+    expected = {
+        pk: int(Decimal(pot_urtc) * Decimal(str(w)) / total) for pk, w in weights
+    }
+
+    with sqlite3.connect(settlement_db) as conn:
+        rows = conn.execute(
+            "SELECT miner_id, amount_i64, typeof(amount_i64) FROM balances"
+        ).fetchall()
+
+    amounts = {pk: amount for pk, amount, _ in rows}
+    assert amounts == expected
+    # Floats bound into amount_i64 would survive as REAL under SQLite's
+    # INTEGER affinity; the split must only ever produce integers.
+    assert {r[2] for r in rows} == {"integer"}
+    # Truncation is conservative: never over-pays, and leaves at most
+    # one uRTC per miner unassigned.
+    assert 0 <= pot_urtc - sum(amounts.values()) < len(weights)